@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from app.api.routes.endpoints import router as endpoints_router
 from app.api.routes.health import router as health_router
+from app.api.routes.imports import router as imports_router
 from app.api.routes.ingest import router as ingest_router
 from app.api.routes.requests import router as requests_router
 from app.api.routes.stream import router as stream_router
@@ -14,6 +15,7 @@ def build_api_router() -> APIRouter:
     router.include_router(health_router)
     router.include_router(endpoints_router)
     router.include_router(requests_router)
+    router.include_router(imports_router)
     router.include_router(stream_router)
     router.include_router(ingest_router)
     return router
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+
 import asyncpg
 from fastapi import Request
 
 from app.core.config import Settings
+from app.services.body_offload import BodyOffload
+from app.services.body_storage import BodyStorage
+from app.services.cleanup_service import CleanupEngine
+from app.services.endpoint_cache import EndpointCache
+from app.services.endpoint_filter import EndpointFilter
+from app.services.ingest_writer import IngestWriter
+from app.services.loop_lag import LoopLagMonitor
+from app.services.pg_stream_hub import PostgresStreamHub
+from app.services.recent_requests import RecentRequestsCache
 from app.services.stream_hub import StreamHub
 
 
@@ -19,6 +30,41 @@ def get_queries(request: Request) -> dict[str, str]:
     return request.app.state.queries
 
 
-def get_stream_hub(request: Request) -> StreamHub:
+def get_stream_hub(request: Request) -> StreamHub | PostgresStreamHub:
     return request.app.state.stream_hub
 
+
+def get_body_storage(request: Request) -> BodyStorage:
+    return request.app.state.body_storage
+
+
+def get_body_offload(request: Request) -> BodyOffload | None:
+    return request.app.state.body_offload
+
+
+def get_loop_lag_monitor(request: Request) -> LoopLagMonitor | None:
+    return request.app.state.loop_lag_monitor
+
+
+def get_ingest_writer(request: Request) -> IngestWriter | None:
+    return request.app.state.ingest_writer
+
+
+def get_endpoint_cache(request: Request) -> EndpointCache:
+    return request.app.state.endpoint_cache
+
+
+def get_endpoint_filter(request: Request) -> EndpointFilter:
+    return request.app.state.endpoint_filter
+
+
+def get_import_slots(request: Request) -> asyncio.Semaphore:
+    return request.app.state.import_slots
+
+
+def get_recent_requests(request: Request) -> RecentRequestsCache | None:
+    return request.app.state.recent_requests
+
+
+def get_cleanup_engine(request: Request) -> CleanupEngine | None:
+    return request.app.state.cleanup_engine
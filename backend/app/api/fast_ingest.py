@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import orjson
+from starlette.requests import ClientDisconnect
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.constants import (
+    ACCEPTED_INGEST_STATUS,
+    ALLOWED_WEBHOOK_METHODS,
+    ENDPOINT_ID_PATTERN,
+    HOOK_PATH_PREFIX,
+)
+from app.core.errors import AppError, error_payload
+from app.services import ingest_service, request_service
+from app.utils.body_reader import parse_content_length, read_request_body_decoded
+from app.utils.headers import get_client_ip
+
+_METHODS = frozenset(ALLOWED_WEBHOOK_METHODS)
+# Same bytes as IngestAckResponse(accepted=True, request_id=...) through ORJSONResponse.
+_ACK_PREFIX = b'{"accepted":true,"requestId":'
+_ACK_SUFFIX = b"}"
+
+
+async def _receive_body(receive: Receive) -> AsyncIterator[bytes]:
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnect()
+        body = message.get("body", b"")
+        if body:
+            yield body
+        if not message.get("more_body", False):
+            return
+
+
+async def _send_json(
+    send: Send,
+    status: int,
+    body: bytes,
+    headers: dict[str, str] | None = None,
+) -> None:
+    raw_headers = [
+        (b"content-length", str(len(body)).encode("latin-1")),
+        (b"content-type", b"application/json"),
+    ]
+    if headers:
+        raw_headers.extend(
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in headers.items()
+        )
+    await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class IngestFastPath:
+    """Serves ``/hook/{endpoint_id}`` without FastAPI routing and dependency resolution.
+
+    Requests for a valid endpoint ID with an accepted method are handled here
+    against ``app.state``; everything else, including malformed IDs and other
+    methods, falls through to the router so error responses stay the same.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _METHODS
+            or not scope["path"].startswith(HOOK_PATH_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        endpoint_id = scope["path"][len(HOOK_PATH_PREFIX) :]
+        if ENDPOINT_ID_PATTERN.fullmatch(endpoint_id) is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            request_id = await self._ingest(scope, receive, endpoint_id)
+        except AppError as exc:
+            body = orjson.dumps(error_payload(exc.code, exc.message))
+            await _send_json(send, exc.status_code, body, exc.headers)
+            return
+        await _send_json(
+            send, ACCEPTED_INGEST_STATUS, _ACK_PREFIX + orjson.dumps(request_id) + _ACK_SUFFIX
+        )
+
+    async def _ingest(self, scope: Scope, receive: Receive, endpoint_id: str) -> str:
+        state = scope["app"].state
+        ingest_service.reject_known_missing(state.endpoint_filter, endpoint_id)
+
+        # ASGI servers already lowercase header names.
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]
+        }
+        body, encoded_size = await read_request_body_decoded(
+            _receive_body(receive),
+            state.settings.max_body_bytes,
+            content_length=parse_content_length(headers.get("content-length")),
+            content_encoding=headers.get("content-encoding"),
+        )
+        client = scope.get("client")
+        payload = request_service.CaptureRequestInput(
+            endpoint_id=endpoint_id,
+            method=scope["method"],
+            path=scope["path"],
+            query_string=scope.get("query_string", b"").decode() or None,
+            ip=get_client_ip(headers, client[0] if client else None),
+            headers=headers,
+            body=body,
+            body_size_bytes=len(body),
+            encoded_size_bytes=encoded_size,
+        )
+        captured = await ingest_service.ingest_request(
+            state.db_pool,
+            state.queries,
+            payload,
+            stream_hub=state.stream_hub,
+            endpoint_filter=state.endpoint_filter,
+            ingest_writer=state.ingest_writer,
+            recent_requests=state.recent_requests,
+            body_storage=state.body_storage,
+            body_offload=state.body_offload,
+        )
+        return captured.id
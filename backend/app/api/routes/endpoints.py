@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
 
-from app.api.deps import get_db_pool, get_queries, get_settings
-from app.core.constants import API_PREFIX
-from app.schemas.endpoints import CreateEndpointResponse
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.deps import (
+    get_db_pool,
+    get_endpoint_cache,
+    get_endpoint_filter,
+    get_queries,
+    get_settings,
+)
+from app.core.constants import API_PREFIX, MAX_ENDPOINT_BATCH_SIZE
+from app.schemas.endpoints import CreateEndpointResponse, CreateEndpointsResponse
 from app.services import endpoint_service
 
 router = APIRouter(prefix=f"{API_PREFIX}/endpoints", tags=["endpoints"])
@@ -15,11 +23,34 @@ async def create_endpoint(
     pool=Depends(get_db_pool),
     queries: dict[str, str] = Depends(get_queries),
     settings=Depends(get_settings),
+    endpoint_cache=Depends(get_endpoint_cache),
+    endpoint_filter=Depends(get_endpoint_filter),
 ) -> CreateEndpointResponse:
     return await endpoint_service.create_endpoint(
         pool,
         queries,
         settings.public_base_url,
         settings.endpoint_ttl_seconds,
+        cache=endpoint_cache,
+        endpoint_filter=endpoint_filter,
     )
 
+
+@router.post("/batch", response_model=CreateEndpointsResponse, status_code=status.HTTP_201_CREATED)
+async def create_endpoints(
+    count: Annotated[int, Query(ge=1, le=MAX_ENDPOINT_BATCH_SIZE)],
+    pool=Depends(get_db_pool),
+    queries: dict[str, str] = Depends(get_queries),
+    settings=Depends(get_settings),
+    endpoint_cache=Depends(get_endpoint_cache),
+    endpoint_filter=Depends(get_endpoint_filter),
+) -> CreateEndpointsResponse:
+    return await endpoint_service.create_endpoints(
+        pool,
+        queries,
+        settings.public_base_url,
+        settings.endpoint_ttl_seconds,
+        count,
+        cache=endpoint_cache,
+        endpoint_filter=endpoint_filter,
+    )
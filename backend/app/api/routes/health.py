@@ -2,7 +2,15 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 
-from app.api.deps import get_db_pool
+from app.api.deps import (
+    get_body_offload,
+    get_cleanup_engine,
+    get_db_pool,
+    get_endpoint_cache,
+    get_endpoint_filter,
+    get_loop_lag_monitor,
+    get_recent_requests,
+)
 from app.core.errors import ServiceUnavailableError
 from app.db.pool import check_db_ready
 
@@ -21,3 +29,22 @@ async def readyz(pool=Depends(get_db_pool)) -> dict[str, str]:
         raise ServiceUnavailableError("Database not ready")
     return {"status": "ready"}
 
+
+
+@router.get("/metrics")
+async def metrics(
+    endpoint_cache=Depends(get_endpoint_cache),
+    endpoint_filter=Depends(get_endpoint_filter),
+    recent_requests=Depends(get_recent_requests),
+    cleanup_engine=Depends(get_cleanup_engine),
+    body_offload=Depends(get_body_offload),
+    loop_lag_monitor=Depends(get_loop_lag_monitor),
+) -> dict[str, object]:
+    return {
+        "endpointCache": endpoint_cache.stats(),
+        "endpointFilter": endpoint_filter.stats(),
+        "recentRequests": recent_requests.stats() if recent_requests is not None else None,
+        "cleanup": cleanup_engine.stats() if cleanup_engine is not None else None,
+        "bodyOffload": body_offload.stats() if body_offload is not None else None,
+        "loopLag": loop_lag_monitor.stats() if loop_lag_monitor is not None else None,
+    }
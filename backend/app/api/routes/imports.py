@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from app.api.deps import (
+    get_body_storage,
+    get_import_slots,
+    get_queries,
+    get_recent_requests,
+    get_settings,
+)
+from app.core.constants import API_PREFIX, ENDPOINT_ID_PATTERN
+from app.core.errors import ServiceUnavailableError
+from app.db.pool import connect_for_copy
+from app.schemas.requests import ImportRequestsResponse
+from app.services import request_import
+
+router = APIRouter(prefix=f"{API_PREFIX}/requests", tags=["requests"])
+
+
+@router.post("/import", response_model=ImportRequestsResponse)
+async def import_requests(
+    request: Request,
+    endpoint_id: Annotated[
+        str | None, Query(alias="endpointId", pattern=ENDPOINT_ID_PATTERN.pattern)
+    ] = None,
+    queries: dict[str, str] = Depends(get_queries),
+    settings=Depends(get_settings),
+    body_storage=Depends(get_body_storage),
+    recent_requests=Depends(get_recent_requests),
+    import_slots=Depends(get_import_slots),
+) -> ImportRequestsResponse:
+    """Bulk-load captured requests sent as NDJSON; see ``request_import.import_requests``."""
+    # Each import holds a connection outside the pool; refuse rather than queue uploads.
+    if import_slots.locked():
+        raise ServiceUnavailableError("Too many imports in progress; retry later")
+    async with import_slots:
+        conn = await connect_for_copy(settings)
+        try:
+            return await request_import.import_requests(
+                conn,
+                queries,
+                request.stream(),
+                body_storage=body_storage,
+                max_body_bytes=settings.max_body_bytes,
+                endpoint_id=endpoint_id,
+                recent_requests=recent_requests,
+            )
+        finally:
+            await conn.close()
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Path, Request, status
 
-from app.api.deps import get_db_pool, get_queries, get_settings, get_stream_hub
+from app.api.deps import (
+    get_body_offload,
+    get_body_storage,
+    get_db_pool,
+    get_endpoint_filter,
+    get_ingest_writer,
+    get_queries,
+    get_recent_requests,
+    get_settings,
+    get_stream_hub,
+)
 from app.core.constants import ALLOWED_WEBHOOK_METHODS, ENDPOINT_ID_PATTERN
 from app.schemas.requests import IngestAckResponse
-from app.services import request_service
-from app.utils.body_reader import read_request_body_limited
+from app.services import ingest_service, request_service
+from app.utils.body_reader import parse_content_length, read_request_body_decoded
 from app.utils.headers import get_client_ip, normalize_headers
 
 router = APIRouter(tags=["webhooks"])
@@ -25,32 +35,44 @@ async def ingest_webhook(
     queries: dict[str, str] = Depends(get_queries),
     settings=Depends(get_settings),
     stream_hub=Depends(get_stream_hub),
+    ingest_writer=Depends(get_ingest_writer),
+    endpoint_filter=Depends(get_endpoint_filter),
+    recent_requests=Depends(get_recent_requests),
+    body_storage=Depends(get_body_storage),
+    body_offload=Depends(get_body_offload),
 ) -> IngestAckResponse:
-    body_bytes = await read_request_body_limited(request.stream(), settings.max_body_bytes)
-    raw_body = body_bytes.decode("utf-8", errors="replace")
+    ingest_service.reject_known_missing(endpoint_filter, endpoint_id)
+
     headers = normalize_headers(request.headers)
+    body_bytes, encoded_size = await read_request_body_decoded(
+        request.stream(),
+        settings.max_body_bytes,
+        content_length=parse_content_length(headers.get("content-length")),
+        content_encoding=headers.get("content-encoding"),
+    )
     client_ip = get_client_ip(headers, request.client.host if request.client else None)
 
-    captured = await request_service.capture_request(
+    payload = request_service.CaptureRequestInput(
+        endpoint_id=endpoint_id,
+        method=request.method,
+        path=request.url.path,
+        query_string=request.url.query or None,
+        ip=client_ip,
+        headers=headers,
+        body=body_bytes,
+        body_size_bytes=len(body_bytes),
+        encoded_size_bytes=encoded_size,
+    )
+    captured = await ingest_service.ingest_request(
         pool,
         queries,
-        request_service.CaptureRequestInput(
-            endpoint_id=endpoint_id,
-            method=request.method,
-            path=request.url.path,
-            query_string=request.url.query or None,
-            ip=client_ip,
-            headers=headers,
-            raw_body=raw_body,
-            body_size_bytes=len(body_bytes),
-        ),
+        payload,
+        stream_hub=stream_hub,
+        endpoint_filter=endpoint_filter,
+        ingest_writer=ingest_writer,
+        recent_requests=recent_requests,
+        body_storage=body_storage,
+        body_offload=body_offload,
     )
-
-    await stream_hub.publish(
-        endpoint_id,
-        "request.created",
-        {"request": captured.model_dump(by_alias=True)},
-    )
-
     return IngestAckResponse(accepted=True, request_id=captured.id)
 
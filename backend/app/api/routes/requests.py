@@ -2,34 +2,78 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+from fastapi.responses import Response, StreamingResponse
 
-from app.api.deps import get_db_pool, get_queries
-from app.core.constants import API_PREFIX, ENDPOINT_ID_PATTERN
-from app.schemas.requests import ListRequestsResponse, WebhookRequestDTO
-from app.services import endpoint_service, request_service
+from app.api.deps import (
+    get_db_pool,
+    get_endpoint_cache,
+    get_queries,
+    get_recent_requests,
+    get_settings,
+)
+from app.core.constants import (
+    API_PREFIX,
+    DEFAULT_BODY_PREVIEW_CHARS,
+    ENDPOINT_ID_PATTERN,
+    MAX_BODY_PREVIEW_CHARS,
+    MAX_LIST_PAGE_SIZE,
+)
+from app.schemas.requests import (
+    ListRequestsResponse,
+    ListRequestSummariesResponse,
+    WebhookRequestDTO,
+)
+from app.services import endpoint_service, request_body_service, request_service
 
 router = APIRouter(prefix=f"{API_PREFIX}/endpoints", tags=["requests"])
 
 
-@router.get("/{endpoint_id}/requests", response_model=ListRequestsResponse)
+@router.get(
+    "/{endpoint_id}/requests",
+    response_model=ListRequestsResponse | ListRequestSummariesResponse,
+)
 async def list_endpoint_requests(
     endpoint_id: Annotated[str, Path(pattern=ENDPOINT_ID_PATTERN.pattern)],
-    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    limit: Annotated[int, Query(ge=1, le=MAX_LIST_PAGE_SIZE)] = 50,
     before: str | None = Query(default=None),
-    include_body: bool = Query(default=True, alias="includeBody"),  # accepted for forward compatibility
+    include_body: bool = Query(default=True, alias="includeBody"),
+    body_preview_chars: Annotated[
+        int, Query(ge=0, le=MAX_BODY_PREVIEW_CHARS, alias="bodyPreviewChars")
+    ] = DEFAULT_BODY_PREVIEW_CHARS,
     pool=Depends(get_db_pool),
     queries: dict[str, str] = Depends(get_queries),
-) -> ListRequestsResponse:
-    _ = include_body
-    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id)
+    endpoint_cache=Depends(get_endpoint_cache),
+    recent_requests=Depends(get_recent_requests),
+    settings=Depends(get_settings),
+) -> ListRequestsResponse | ListRequestSummariesResponse | Response:
+    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id, cache=endpoint_cache)
     try:
+        # First pages stay on the model path while the recent-requests ring serves them.
+        use_passthrough = include_body and (before or recent_requests is None)
+        if settings.json_passthrough_enabled and use_passthrough:
+            document = await request_service.list_requests_json(
+                pool, queries, endpoint_id, limit=limit, before=before
+            )
+            if document is not None:
+                return Response(content=document, media_type="application/json")
+        if not include_body:
+            return await request_service.list_request_summaries(
+                pool,
+                queries,
+                endpoint_id,
+                limit=limit,
+                before=before,
+                preview_chars=body_preview_chars,
+                recent_requests=recent_requests,
+            )
         return await request_service.list_requests(
             pool,
             queries,
             endpoint_id,
             limit=limit,
             before=before,
+            recent_requests=recent_requests,
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
@@ -41,6 +85,47 @@ async def get_endpoint_request(
     request_id: str,
     pool=Depends(get_db_pool),
     queries: dict[str, str] = Depends(get_queries),
-) -> WebhookRequestDTO:
-    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id)
+    endpoint_cache=Depends(get_endpoint_cache),
+    settings=Depends(get_settings),
+) -> WebhookRequestDTO | Response:
+    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id, cache=endpoint_cache)
+    if settings.json_passthrough_enabled:
+        document = await request_service.get_request_json(pool, queries, endpoint_id, request_id)
+        if document is not None:
+            return Response(content=document, media_type="application/json")
     return await request_service.get_request(pool, queries, endpoint_id, request_id)
+
+
+@router.get("/{endpoint_id}/requests/{request_id}/body", response_class=StreamingResponse)
+async def download_request_body(
+    endpoint_id: Annotated[str, Path(pattern=ENDPOINT_ID_PATTERN.pattern)],
+    request_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+    pool=Depends(get_db_pool),
+    queries: dict[str, str] = Depends(get_queries),
+    endpoint_cache=Depends(get_endpoint_cache),
+) -> StreamingResponse:
+    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id, cache=endpoint_cache)
+    body = await request_body_service.get_stored_body(pool, queries, endpoint_id, request_id)
+    byte_range = request_body_service.parse_range(range_header, body.size_bytes)
+
+    headers = {
+        "Content-Type": body.content_type,
+        "Accept-Ranges": "bytes",
+        # Captured bodies are untrusted; never let a browser render them as our origin.
+        "Content-Security-Policy": "sandbox",
+        "X-Content-Type-Options": "nosniff",
+    }
+    status_code = 200
+    start, end = 0, body.size_bytes - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{body.size_bytes}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        request_body_service.iter_body_range(pool, queries, body, start=start, end=end),
+        status_code=status_code,
+        headers=headers,
+    )
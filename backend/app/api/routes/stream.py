@@ -2,48 +2,92 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
+from typing import Annotated
 
-import orjson
-from fastapi import APIRouter, Depends, Path, Request
+from fastapi import APIRouter, Depends, Header, Path, Query, Request
 from fastapi.responses import StreamingResponse
 
-from app.api.deps import get_db_pool, get_queries, get_settings, get_stream_hub
+from app.api.deps import (
+    get_db_pool,
+    get_endpoint_cache,
+    get_queries,
+    get_settings,
+    get_stream_hub,
+)
 from app.core.constants import API_PREFIX, ENDPOINT_ID_PATTERN
+from app.schemas.requests import WebhookRequestDTO
 from app.schemas.stream import StreamReadyEvent
-from app.services import endpoint_service
+from app.services import endpoint_service, request_service
+from app.utils.cursor import cursor_for_request, decode_cursor
+from app.utils.sse import sse_comment, sse_event
 from app.utils.time import isoformat_z, utc_now
 
 router = APIRouter(prefix=f"{API_PREFIX}/endpoints", tags=["stream"])
 
 
-def _sse_event(event: str, data: dict[str, object]) -> bytes:
-    payload = orjson.dumps(data).decode("utf-8")
-    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
-
-
-def _sse_comment(text: str) -> bytes:
-    return f": {text}\n\n".encode("utf-8")
+def _is_cursor(value: str) -> bool:
+    try:
+        decode_cursor(value)
+    except ValueError:
+        return False
+    return True
 
 
 @router.get("/{endpoint_id}/stream")
 async def stream_endpoint_requests(
     request: Request,
     endpoint_id: str = Path(..., pattern=ENDPOINT_ID_PATTERN.pattern),
+    backfill: Annotated[int, Query(ge=0, le=100)] = 0,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
     pool=Depends(get_db_pool),
     queries: dict[str, str] = Depends(get_queries),
     settings=Depends(get_settings),
     stream_hub=Depends(get_stream_hub),
+    endpoint_cache=Depends(get_endpoint_cache),
 ) -> StreamingResponse:
-    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id)
+    await endpoint_service.ensure_active_endpoint(pool, queries, endpoint_id, cache=endpoint_cache)
+
+    resume_from = last_event_id if last_event_id and _is_cursor(last_event_id) else None
 
     async def event_source() -> AsyncIterator[bytes]:
-        subscriber = await stream_hub.subscribe(endpoint_id)
+        subscriber = await stream_hub.subscribe(endpoint_id, last_event_id=resume_from)
         try:
             ready = StreamReadyEvent(
                 endpoint_id=endpoint_id,
                 connected_at=isoformat_z(utc_now()),
             )
-            yield _sse_event("stream.ready", ready.model_dump(by_alias=True))
+            yield sse_event("stream.ready", ready.model_dump(by_alias=True))
+
+            # Events the hub still had in its replay ring, published before we
+            # subscribed, so they cannot also be in the queue.
+            for message in subscriber.replay:
+                yield message.frame
+
+            catch_up: list[WebhookRequestDTO] = []
+            if resume_from is not None and subscriber.replay_missed:
+                catch_up = await request_service.list_requests_after(
+                    pool,
+                    queries,
+                    endpoint_id,
+                    after=resume_from,
+                    limit=settings.stream_resume_max_events,
+                )
+            elif resume_from is None and backfill:
+                page = await request_service.list_requests(
+                    pool, queries, endpoint_id, limit=backfill, before=None
+                )
+                catch_up = page.items[::-1]
+
+            # Rows loaded from the database may also arrive live; skip those.
+            delivered: set[str] = set()
+            for captured in catch_up:
+                event_id = cursor_for_request(captured)
+                delivered.add(event_id)
+                yield sse_event(
+                    "request.created",
+                    {"request": captured.model_dump(by_alias=True)},
+                    event_id=event_id,
+                )
 
             while True:
                 if await request.is_disconnected():
@@ -55,10 +99,12 @@ async def stream_endpoint_requests(
                         timeout=settings.sse_heartbeat_seconds,
                     )
                 except asyncio.TimeoutError:
-                    yield _sse_comment("keepalive")
+                    yield sse_comment("keepalive")
                     continue
 
-                yield _sse_event(message.event, message.data)
+                if message.event_id in delivered:
+                    continue
+                yield message.frame
         finally:
             await stream_hub.unsubscribe(endpoint_id, subscriber.subscriber_id)
 
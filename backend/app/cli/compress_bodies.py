@@ -0,0 +1,50 @@
+"""Compress existing request bodies according to the BODY_COMPRESSION settings.
+
+    BODY_COMPRESSION=gzip uv run python -m app.cli.compress_bodies --batch-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from app.core.config import get_settings
+from app.core.logging import configure_logging
+from app.db.pool import bootstrap_schema, close_pool, create_pool, load_queries
+from app.services.body_storage import BodyStorage, compress_stored_bodies
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    configure_logging(settings)
+    if settings.body_compression == "none":
+        parser.error("BODY_COMPRESSION is 'none'; set it to the codec to migrate to")
+
+    pool = await create_pool(settings)
+    try:
+        await bootstrap_schema(pool)
+        converted = await compress_stored_bodies(
+            pool,
+            load_queries(),
+            BodyStorage(
+                compression=settings.body_compression,
+                min_bytes=settings.body_compression_min_bytes,
+                level=settings.body_compression_level,
+            ),
+            batch_size=args.batch_size,
+        )
+    finally:
+        await close_pool(pool)
+
+    logger.info("Compressed %s stored request bodies", converted)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
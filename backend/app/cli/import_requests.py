@@ -0,0 +1,98 @@
+"""Bulk-load captured requests from an NDJSON file into their endpoints.
+
+Each line is a request as returned by the requests API; ``-`` reads stdin and
+files ending in ``.gz`` are decompressed.
+
+    uv run python -m app.cli.import_requests archive.ndjson.gz --endpoint-id abc123def4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import logging
+import sys
+from collections.abc import AsyncIterator
+from typing import BinaryIO
+
+from app.core.config import get_settings
+from app.core.constants import ENDPOINT_ID_PATTERN
+from app.core.errors import AppError
+from app.core.logging import configure_logging
+from app.db.pool import connect_for_copy, load_queries
+from app.services.body_storage import BodyStorage
+from app.services.request_import import DEFAULT_IMPORT_BATCH_SIZE, import_requests
+
+logger = logging.getLogger(__name__)
+
+_READ_BYTES = 1_048_576
+
+
+async def _read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := source.read(_READ_BYTES):
+        yield chunk
+
+
+def _open(path: str) -> BinaryIO:
+    if path == "-":
+        return sys.stdin.buffer
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    parser.add_argument("--endpoint-id", help="load every request into this endpoint")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    if args.endpoint_id is not None and not ENDPOINT_ID_PATTERN.fullmatch(args.endpoint_id):
+        parser.error("--endpoint-id is not a valid endpoint ID")
+
+    settings = get_settings()
+    configure_logging(settings)
+
+    source = _open(args.path)
+    conn = await connect_for_copy(settings)
+    try:
+        report = await import_requests(
+            conn,
+            load_queries(),
+            _read_chunks(source),
+            body_storage=BodyStorage(
+                compression=settings.body_compression,
+                min_bytes=settings.body_compression_min_bytes,
+                level=settings.body_compression_level,
+                persist_parsed_json=settings.persist_parsed_json,
+            ),
+            max_body_bytes=settings.max_body_bytes,
+            endpoint_id=args.endpoint_id,
+            batch_size=args.batch_size,
+        )
+    except AppError as exc:
+        logger.error("Import failed: %s", exc.message)
+        raise SystemExit(1) from None
+    finally:
+        await conn.close()
+        source.close()
+
+    logger.info(
+        "Imported %s requests (%s skipped) in %.1fs, %.0f rows/s",
+        report.imported,
+        report.skipped,
+        report.elapsed_ms / 1000,
+        report.rows_per_second,
+    )
+    if report.imported and settings.recent_requests_cache_enabled:
+        logger.warning(
+            "RECENT_REQUESTS_CACHE_ENABLED is set: restart running servers so their cached "
+            "first pages include the imported requests"
+        )
+    if report.missing_endpoint_ids:
+        logger.warning("Missing or expired endpoints: %s", ", ".join(report.missing_endpoint_ids))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
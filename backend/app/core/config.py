@@ -25,11 +25,55 @@ class Settings(BaseSettings):
     request_ttl_seconds: int = 86_400
     max_body_bytes: int = 1_048_576
     cleanup_interval_seconds: int = 60
+    cleanup_leader_election: bool = True
+    cleanup_leader_retry_seconds: int = 5
+    cleanup_batch_min_size: int = 100
+    cleanup_batch_max_size: int = 5_000
+    cleanup_target_batch_ms: int = 200
+    cleanup_cycle_budget_ms: int = 10_000
+    request_partitioning: Literal["none", "hourly", "daily"] = "none"
+    request_partitions_premake: int = 3
     sse_heartbeat_seconds: int = 15
     stream_queue_maxsize: int = 256
+    stream_replay_buffer_size: int = 64
+    stream_replay_buffer_bytes: int = 524_288
+    stream_replay_max_endpoints: int = 256
+    stream_resume_max_events: int = 500
+    stream_hub_backend: Literal["memory", "postgres"] = "memory"
+    stream_notify_max_payload_bytes: int = 7_900
 
     db_pool_min_size: int = 1
     db_pool_max_size: int = 10
+    db_statement_cache_size: int = 256
+
+    endpoint_cache_max_entries: int = 10_000
+    endpoint_negative_cache_ttl_seconds: int = 30
+    endpoint_negative_cache_max_entries: int = 100_000
+    endpoint_filter_rebuild_seconds: int = 60
+
+    body_compression: Literal["none", "gzip"] = "none"
+    body_compression_min_bytes: int = 1_024
+    body_compression_level: int = 6
+    persist_parsed_json: bool = True
+    body_offload_enabled: bool = False
+    body_offload_min_bytes: int = 262_144
+    body_offload_executor: Literal["thread", "process"] = "thread"
+    body_offload_max_workers: int = 2
+    loop_lag_sample_ms: int = 100
+
+    json_passthrough_enabled: bool = False
+
+    recent_requests_cache_enabled: bool = False
+    recent_requests_cache_max_bytes: int = 67_108_864
+
+    ingest_fast_path_enabled: bool = False
+    ingest_batch_enabled: bool = False
+    ingest_batch_max_size: int = 100
+    ingest_batch_max_linger_ms: int = 5
+    ingest_batch_max_in_flight: int = 4
+
+    import_max_concurrent: int = 1
+    import_statement_timeout_seconds: int = 60
 
     @field_validator("cors_allow_origins", mode="before")
     @classmethod
@@ -40,15 +84,54 @@ class Settings(BaseSettings):
             return [item.strip() for item in value.split(",") if item.strip()]
         return value
 
+    @field_validator("db_statement_cache_size")
+    @classmethod
+    def ensure_not_negative(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("must be 0 or greater")
+        return value
+
+    @field_validator("body_compression_level")
+    @classmethod
+    def ensure_compression_level(cls, value: int) -> int:
+        if not 1 <= value <= 9:
+            raise ValueError("must be between 1 and 9")
+        return value
+
     @field_validator(
         "endpoint_ttl_seconds",
         "request_ttl_seconds",
         "max_body_bytes",
         "cleanup_interval_seconds",
+        "cleanup_leader_retry_seconds",
+        "cleanup_batch_min_size",
+        "cleanup_batch_max_size",
+        "cleanup_target_batch_ms",
+        "cleanup_cycle_budget_ms",
+        "request_partitions_premake",
         "sse_heartbeat_seconds",
         "stream_queue_maxsize",
+        "stream_replay_buffer_size",
+        "stream_replay_buffer_bytes",
+        "stream_replay_max_endpoints",
+        "stream_resume_max_events",
+        "stream_notify_max_payload_bytes",
         "db_pool_min_size",
         "db_pool_max_size",
+        "endpoint_cache_max_entries",
+        "endpoint_negative_cache_ttl_seconds",
+        "endpoint_negative_cache_max_entries",
+        "endpoint_filter_rebuild_seconds",
+        "body_compression_min_bytes",
+        "body_offload_min_bytes",
+        "body_offload_max_workers",
+        "loop_lag_sample_ms",
+        "recent_requests_cache_max_bytes",
+        "ingest_batch_max_size",
+        "ingest_batch_max_linger_ms",
+        "ingest_batch_max_in_flight",
+        "import_max_concurrent",
+        "import_statement_timeout_seconds",
     )
     @classmethod
     def ensure_positive(cls, value: int) -> int:
@@ -5,6 +5,10 @@ import re
 API_PREFIX = "/api"
 ENDPOINT_ID_LENGTH = 10
 ENDPOINT_ID_PATTERN = re.compile(r"^[a-z0-9]{8,32}$")
+MAX_LIST_PAGE_SIZE = 100
+MAX_ENDPOINT_BATCH_SIZE = 1_000
+DEFAULT_BODY_PREVIEW_CHARS = 256
+MAX_BODY_PREVIEW_CHARS = 4096
 HOOK_PATH_PREFIX = "/hook/"
 ACCEPTED_INGEST_STATUS = 202
 
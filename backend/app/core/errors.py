@@ -11,6 +11,7 @@ class AppError(Exception):
     code: str
     message: str
     status_code: int
+    headers: dict[str, str] | None = None
 
 
 class NotFoundError(AppError):
@@ -23,6 +24,26 @@ class PayloadTooLargeError(AppError):
         super().__init__(code="payload_too_large", message=message, status_code=413)
 
 
+class InvalidContentEncodingError(AppError):
+    def __init__(self, message: str = "Request body does not match its Content-Encoding") -> None:
+        super().__init__(code="invalid_content_encoding", message=message, status_code=400)
+
+
+class InvalidImportError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code="invalid_import", message=message, status_code=400)
+
+
+class RangeNotSatisfiableError(AppError):
+    def __init__(self, size_bytes: int) -> None:
+        super().__init__(
+            code="range_not_satisfiable",
+            message="Requested range not satisfiable",
+            status_code=416,
+            headers={"Content-Range": f"bytes */{size_bytes}"},
+        )
+
+
 class ServiceUnavailableError(AppError):
     def __init__(self, message: str = "Service unavailable") -> None:
         super().__init__(code="service_unavailable", message=message, status_code=503)
@@ -38,5 +59,6 @@ def register_error_handlers(app: FastAPI) -> None:
         return ORJSONResponse(
             status_code=exc.status_code,
             content=error_payload(exc.code, exc.message),
+            headers=exc.headers,
         )
 
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+import asyncpg
+import orjson
+
+# The binary jsonb format is a version byte followed by the JSON text.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def register_codecs(conn: asyncpg.Connection) -> None:
+    """Decode columns straight into the values the service layer works with.
+
+    ``jsonb`` travels in binary form and is parsed with orjson, so queries no
+    longer cast it to text first. ``inet`` is read as its text form instead of
+    an ``ipaddress`` object; for the host addresses stored here that is the
+    same string ``host()`` returned. ``uuid`` keeps asyncpg's built-in binary
+    codec, whose values convert to ``str`` in C.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "inet",
+        schema="pg_catalog",
+        encoder=str,
+        decoder=str,
+        format="text",
+    )
+
+
+async def register_copy_codecs(conn: asyncpg.Connection) -> None:
+    """Codecs for a connection used with ``copy_records_to_table``.
+
+    Binary ``COPY`` needs a binary encoder for every column, so ``inet`` keeps
+    asyncpg's built-in codec, which takes address strings; ``jsonb`` is encoded
+    as in ``register_codecs``.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        format="binary",
+    )
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import logging
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import asyncpg
 
 from app.core.config import Settings
+from app.db.codecs import register_codecs, register_copy_codecs
 
 BASE_DIR = Path(__file__).resolve().parent
 SCHEMA_PATH = BASE_DIR / "schema.sql"
 QUERIES_DIR = BASE_DIR / "queries"
 
+logger = logging.getLogger(__name__)
+
+# Held for the length of a transaction by everything that runs DDL on startup.
+BOOTSTRAP_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext('webhook_tester.bootstrap'))"
+
+# Raised when preparing against a database the schema bootstrap has not caught up yet.
+_SCHEMA_NOT_READY_ERRORS = (
+    asyncpg.UndefinedTableError,
+    asyncpg.UndefinedColumnError,
+    asyncpg.UndefinedFunctionError,
+    asyncpg.UndefinedObjectError,
+)
+
 
 def _parse_named_queries(sql_text: str) -> dict[str, str]:
     queries: dict[str, str] = {}
@@ -41,13 +57,74 @@ def load_queries() -> dict[str, str]:
     return query_map
 
 
-async def create_pool(settings: Settings) -> asyncpg.Pool:
+async def prepare_queries(conn: asyncpg.Connection, queries: dict[str, str]) -> int:
+    """Put every named query in the connection's statement cache; returns how many."""
+    prepared = 0
+    for sql in queries.values():
+        try:
+            # Connection.prepare() bypasses the cache that fetch() and execute() look up, so
+            # this uses the private method behind both; pyproject.toml caps asyncpg and
+            # tests/test_db_pool.py fails if its signature changes.
+            await conn._prepare(sql, use_cache=True)
+        except _SCHEMA_NOT_READY_ERRORS:
+            continue
+        # A prepare leaves the protocol's implicit transaction, and the table locks it
+        # took, open until the next simple query. Close it after every statement so the
+        # locks cannot pile up against another process's schema bootstrap.
+        await conn.execute("SELECT 1")
+        prepared += 1
+    return prepared
+
+
+async def init_connection(
+    conn: asyncpg.Connection,
+    *,
+    queries: dict[str, str] | None = None,
+) -> None:
+    # Codecs first: changing them clears the connection's statement cache.
+    await register_codecs(conn)
+    if queries:
+        await prepare_queries(conn, queries)
+
+
+async def create_pool(
+    settings: Settings,
+    *,
+    queries: dict[str, str] | None = None,
+) -> asyncpg.Pool:
+    prepare = queries is not None and settings.db_statement_cache_size > 0
+    if prepare and settings.db_statement_cache_size < len(queries):
+        logger.warning(
+            "DB_STATEMENT_CACHE_SIZE=%s cannot hold all %s named queries",
+            settings.db_statement_cache_size,
+            len(queries),
+        )
     return await asyncpg.create_pool(
         dsn=settings.database_url,
         min_size=settings.db_pool_min_size,
         max_size=settings.db_pool_max_size,
         command_timeout=10,
+        statement_cache_size=settings.db_statement_cache_size,
+        init=partial(init_connection, queries=queries if prepare else None),
+    )
+
+
+async def connect_for_copy(settings: Settings) -> asyncpg.Connection:
+    """A connection outside the pool for bulk ``COPY``.
+
+    Server-side timeouts bound each statement and the time the import's transaction
+    may sit idle waiting for more input, so a stalled upload cannot hold it open.
+    """
+    timeout_ms = str(settings.import_statement_timeout_seconds * 1000)
+    conn = await asyncpg.connect(
+        dsn=settings.database_url,
+        server_settings={
+            "statement_timeout": timeout_ms,
+            "idle_in_transaction_session_timeout": timeout_ms,
+        },
     )
+    await register_copy_codecs(conn)
+    return conn
 
 
 async def close_pool(pool: asyncpg.Pool | None) -> None:
@@ -55,12 +132,39 @@ async def close_pool(pool: asyncpg.Pool | None) -> None:
         await pool.close()
 
 
-async def bootstrap_schema(pool: asyncpg.Pool) -> None:
+async def _bootstrap(conn: asyncpg.Connection, request_partitioning: str) -> None:
     sql = SCHEMA_PATH.read_text(encoding="utf-8")
-    async with pool.acquire() as conn:
+    async with conn.transaction():
+        # Concurrent CREATE ... IF NOT EXISTS from processes starting together can still
+        # collide on a fresh database; run one bootstrap at a time.
+        await conn.execute(BOOTSTRAP_LOCK_SQL)
+        # Read by schema.sql to decide how a missing webhook_requests table is created.
+        await conn.execute(
+            "SELECT set_config('webhook_tester.request_partitioning', $1, true)",
+            request_partitioning,
+        )
         await conn.execute(sql)
 
 
+async def bootstrap_schema(pool: asyncpg.Pool, *, request_partitioning: str = "none") -> None:
+    async with pool.acquire() as conn:
+        await _bootstrap(conn, request_partitioning)
+
+
+async def bootstrap_database(settings: Settings, *, request_partitioning: str = "none") -> None:
+    """Bootstrap the schema over a connection of its own, before the pool opens.
+
+    Pooled connections prepare every named query when they open; doing the
+    bootstrap first means none of them prepares against a missing table, or
+    holds a lock the bootstrap's DDL has to wait for.
+    """
+    conn = await asyncpg.connect(dsn=settings.database_url)
+    try:
+        await _bootstrap(conn, request_partitioning)
+    finally:
+        await conn.close()
+
+
 async def check_db_ready(pool: asyncpg.Pool) -> bool:
     try:
         value: Any = await pool.fetchval("SELECT 1;")
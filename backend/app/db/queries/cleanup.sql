@@ -1,26 +1,80 @@
 -- name: delete_expired_requests_batch
 WITH doomed AS (
-  SELECT id
+  SELECT id, received_at
   FROM webhook_requests
   WHERE received_at <= now() - ($1::int * interval '1 second')
   ORDER BY received_at ASC
   LIMIT $2
+),
+deleted AS (
+  DELETE FROM webhook_requests wr
+  USING doomed
+  WHERE wr.id = doomed.id
+    AND wr.received_at = doomed.received_at
+  RETURNING 1
 )
-DELETE FROM webhook_requests wr
-USING doomed
-WHERE wr.id = doomed.id
-RETURNING wr.id;
+SELECT count(*)::int FROM deleted;
+
+-- name: delete_expired_endpoint_requests_batch
+WITH doomed AS (
+  SELECT wr.id, wr.received_at
+  FROM webhook_endpoints we
+  JOIN webhook_requests wr ON wr.endpoint_id = we.endpoint_id
+  WHERE we.expires_at <= now()
+  LIMIT $1
+),
+deleted AS (
+  DELETE FROM webhook_requests wr
+  USING doomed
+  WHERE wr.id = doomed.id
+    AND wr.received_at = doomed.received_at
+  RETURNING 1
+)
+SELECT count(*)::int FROM deleted;
 
 -- name: delete_expired_endpoints_batch
+-- Endpoints go only once their requests are gone, so an interrupted cycle leaves no orphans.
 WITH doomed AS (
   SELECT id
-  FROM webhook_endpoints
+  FROM webhook_endpoints we
   WHERE expires_at <= now()
+    AND NOT EXISTS (
+      SELECT 1
+      FROM webhook_requests wr
+      WHERE wr.endpoint_id = we.endpoint_id
+    )
   ORDER BY expires_at ASC
   LIMIT $1
 )
 DELETE FROM webhook_endpoints we
 USING doomed
 WHERE we.id = doomed.id
-RETURNING we.id;
+RETURNING we.endpoint_id;
+
+-- name: count_expired_requests_capped
+SELECT count(*)::int
+FROM (
+  SELECT 1
+  FROM webhook_requests
+  WHERE received_at <= now() - ($1::int * interval '1 second')
+  LIMIT $2
+) expired;
+
+-- name: request_table_is_partitioned
+SELECT EXISTS (
+  SELECT 1
+  FROM pg_partitioned_table pt
+  WHERE pt.partrelid = to_regclass('webhook_requests')
+);
 
+-- name: list_request_partitions
+SELECT
+  c.relname AS partition_name,
+  i.inhdetachpending AS detach_pending,
+  substring(
+    pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([^'']+)''\)'
+  )::timestamptz AS upper_bound
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = to_regclass('webhook_requests')
+ORDER BY upper_bound ASC NULLS LAST;
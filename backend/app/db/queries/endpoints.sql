@@ -3,6 +3,13 @@ INSERT INTO webhook_endpoints (endpoint_id, expires_at)
 VALUES ($1, now() + ($2::int * interval '1 second'))
 RETURNING endpoint_id, created_at, expires_at;
 
+-- name: create_endpoints_batch
+INSERT INTO webhook_endpoints (endpoint_id, expires_at)
+SELECT t.endpoint_id, now() + ($2::int * interval '1 second')
+FROM unnest($1::text[]) AS t(endpoint_id)
+ON CONFLICT (endpoint_id) DO NOTHING
+RETURNING endpoint_id, created_at, expires_at;
+
 -- name: get_active_endpoint
 SELECT endpoint_id, created_at, expires_at
 FROM webhook_endpoints
@@ -11,3 +18,10 @@ WHERE endpoint_id = $1
   AND expires_at > now()
 LIMIT 1;
 
+
+
+-- name: list_live_endpoint_ids
+SELECT endpoint_id
+FROM webhook_endpoints
+WHERE is_active = TRUE
+  AND expires_at > now();
@@ -18,8 +18,12 @@ INSERT INTO webhook_requests (
   headers_json,
   content_type,
   body_size_bytes,
-  raw_body,
-  parsed_json
+  parsed_json,
+  body_encoding,
+  body_bytes,
+  body_is_json,
+  body_is_text,
+  encoded_size_bytes
 )
 SELECT
   $2::uuid,
@@ -32,56 +36,131 @@ SELECT
   $8::jsonb,
   $9::text,
   $10::int,
-  $11::text,
-  CASE WHEN $12::text IS NULL THEN NULL ELSE $12::jsonb END
+  $11::jsonb,
+  $12::text,
+  $13::bytea,
+  $14::boolean,
+  $15::boolean,
+  $16::int
 FROM active_endpoint ae
 RETURNING
-  id::text AS id,
+  received_at,
+  client_ip AS ip;
+
+-- name: list_requests_page
+SELECT
+  id,
   endpoint_id,
   received_at,
   method,
   path,
   status_code,
-  COALESCE(host(client_ip), '') AS ip,
-  headers_json::text AS headers_json_text,
+  client_ip AS ip,
+  headers_json,
   content_type,
   body_size_bytes,
   raw_body,
-  parsed_json::text AS parsed_json_text;
+  body_encoding,
+  body_bytes,
+  parsed_json,
+  body_is_json,
+  encoded_size_bytes
+FROM webhook_requests
+WHERE endpoint_id = $1
+ORDER BY received_at DESC, id DESC
+LIMIT $2;
 
--- name: list_requests_page
+-- name: list_requests_page_before
 SELECT
-  id::text AS id,
+  id,
   endpoint_id,
   received_at,
   method,
   path,
   status_code,
-  COALESCE(host(client_ip), '') AS ip,
-  headers_json::text AS headers_json_text,
+  client_ip AS ip,
+  headers_json,
   content_type,
   body_size_bytes,
   raw_body,
-  parsed_json::text AS parsed_json_text
+  body_encoding,
+  body_bytes,
+  parsed_json,
+  body_is_json,
+  encoded_size_bytes
 FROM webhook_requests
 WHERE endpoint_id = $1
+  AND (received_at, id) < ($2::timestamptz, $3::uuid)
 ORDER BY received_at DESC, id DESC
-LIMIT $2;
+LIMIT $4;
 
--- name: list_requests_page_before
+-- name: list_requests_page_after
 SELECT
-  id::text AS id,
+  id,
   endpoint_id,
   received_at,
   method,
   path,
   status_code,
-  COALESCE(host(client_ip), '') AS ip,
-  headers_json::text AS headers_json_text,
+  client_ip AS ip,
+  headers_json,
   content_type,
   body_size_bytes,
   raw_body,
-  parsed_json::text AS parsed_json_text
+  body_encoding,
+  body_bytes,
+  parsed_json,
+  body_is_json,
+  encoded_size_bytes
+FROM webhook_requests
+WHERE endpoint_id = $1
+  AND (received_at, id) > ($2::timestamptz, $3::uuid)
+ORDER BY received_at ASC, id ASC
+LIMIT $4;
+
+-- name: list_request_summaries_page
+SELECT
+  id,
+  endpoint_id,
+  received_at,
+  method,
+  path,
+  status_code,
+  client_ip AS ip,
+  content_type,
+  body_size_bytes,
+  body_encoding,
+  CASE WHEN $3::int > 0 AND body_bytes IS NULL THEN left(raw_body, $3::int) END AS body_preview,
+  CASE
+    WHEN $3::int <= 0 THEN NULL
+    WHEN body_encoding = 'identity' THEN substring(body_bytes FROM 1 FOR $3::int * 4)
+    -- Enough of the compressed stream for the preview, with room for its headers.
+    ELSE substring(body_bytes FROM 1 FOR $3::int * 4 + 64)
+  END AS body_bytes
+FROM webhook_requests
+WHERE endpoint_id = $1
+ORDER BY received_at DESC, id DESC
+LIMIT $2;
+
+-- name: list_request_summaries_page_before
+SELECT
+  id,
+  endpoint_id,
+  received_at,
+  method,
+  path,
+  status_code,
+  client_ip AS ip,
+  content_type,
+  body_size_bytes,
+  body_encoding,
+  CASE WHEN $5::int > 0 AND body_bytes IS NULL THEN left(raw_body, $5::int) END AS body_preview,
+  CASE
+    WHEN $5::int <= 0 THEN NULL
+    WHEN body_encoding = 'identity' THEN substring(body_bytes FROM 1 FOR $5::int * 4)
+    -- Enough of the compressed stream for the preview, with room for its headers.
+    ELSE substring(body_bytes FROM 1 FOR $5::int * 4 + 64)
+  END AS body_bytes
 FROM webhook_requests
 WHERE endpoint_id = $1
   AND (received_at, id) < ($2::timestamptz, $3::uuid)
@@ -90,20 +169,189 @@ LIMIT $4;
 
 -- name: get_request_for_endpoint
 SELECT
-  id::text AS id,
+  id,
   endpoint_id,
   received_at,
   method,
   path,
   status_code,
-  COALESCE(host(client_ip), '') AS ip,
-  headers_json::text AS headers_json_text,
+  client_ip AS ip,
+  headers_json,
   content_type,
   body_size_bytes,
   raw_body,
-  parsed_json::text AS parsed_json_text
+  body_encoding,
+  body_bytes,
+  parsed_json,
+  body_is_json,
+  encoded_size_bytes
+FROM webhook_requests
+WHERE endpoint_id = $1
+  AND id = $2::uuid
+LIMIT 1;
+
+-- name: insert_requests_batch_if_active
+WITH incoming AS (
+  SELECT *
+  FROM unnest(
+    $1::text[],
+    $2::uuid[],
+    $3::text[],
+    $4::text[],
+    $5::text[],
+    $6::int[],
+    $7::text[],
+    $8::jsonb[],
+    $9::text[],
+    $10::int[],
+    $11::jsonb[],
+    $12::text[],
+    $13::bytea[],
+    $14::boolean[],
+    $15::boolean[],
+    $16::int[]
+  ) AS t(
+    endpoint_id,
+    id,
+    method,
+    path,
+    query_string,
+    status_code,
+    client_ip,
+    headers_json,
+    content_type,
+    body_size_bytes,
+    parsed_json,
+    body_encoding,
+    body_bytes,
+    body_is_json,
+    body_is_text,
+    encoded_size_bytes
+  )
+),
+active_endpoints AS (
+  UPDATE webhook_endpoints
+  SET last_seen_at = now()
+  WHERE endpoint_id IN (SELECT DISTINCT endpoint_id FROM incoming)
+    AND is_active = TRUE
+    AND expires_at > now()
+  RETURNING endpoint_id
+)
+INSERT INTO webhook_requests (
+  id,
+  endpoint_id,
+  method,
+  path,
+  query_string,
+  status_code,
+  client_ip,
+  headers_json,
+  content_type,
+  body_size_bytes,
+  parsed_json,
+  body_encoding,
+  body_bytes,
+  body_is_json,
+  body_is_text,
+  encoded_size_bytes
+)
+SELECT
+  i.id,
+  i.endpoint_id,
+  i.method,
+  i.path,
+  i.query_string,
+  i.status_code,
+  NULLIF(i.client_ip, '')::inet,
+  i.headers_json,
+  i.content_type,
+  i.body_size_bytes,
+  i.parsed_json,
+  i.body_encoding,
+  i.body_bytes,
+  i.body_is_json,
+  i.body_is_text,
+  i.encoded_size_bytes
+FROM incoming i
+JOIN active_endpoints ae ON ae.endpoint_id = i.endpoint_id
+RETURNING
+  id,
+  received_at,
+  client_ip AS ip;
+
+-- name: list_uncompressed_bodies
+SELECT
+  id,
+  COALESCE(body_bytes, convert_to(raw_body, 'UTF8')) AS body
+FROM webhook_requests
+WHERE body_encoding = 'identity'
+  AND body_size_bytes >= $1
+  AND id > $2::uuid
+ORDER BY id
+LIMIT $3;
+
+-- name: store_compressed_bodies
+UPDATE webhook_requests wr
+SET
+  body_encoding = c.body_encoding,
+  body_bytes = c.body_bytes,
+  raw_body = NULL
+FROM unnest($1::uuid[], $2::text[], $3::bytea[]) AS c(id, body_encoding, body_bytes)
+WHERE wr.id = c.id
+  AND wr.body_encoding = 'identity';
+
+-- name: get_request_body_info
+SELECT
+  content_type,
+  -- Legacy text-column bodies are served as their UTF-8 bytes, which differ in length from
+  -- the received bytes when those were not valid UTF-8.
+  CASE
+    WHEN body_bytes IS NULL THEN octet_length(convert_to(raw_body, 'UTF8'))
+    ELSE body_size_bytes
+  END AS stored_size_bytes,
+  body_encoding,
+  body_bytes IS NULL AS is_text_column
 FROM webhook_requests
 WHERE endpoint_id = $1
   AND id = $2::uuid
 LIMIT 1;
 
+-- name: get_request_body_chunk
+SELECT
+  substring(
+    COALESCE(body_bytes, convert_to(raw_body, 'UTF8'))
+    FROM $3::int
+    FOR $4::int
+  ) AS chunk
+FROM webhook_requests
+WHERE endpoint_id = $1
+  AND id = $2::uuid;
+
+-- name: list_requests_json_page
+SELECT
+  id,
+  received_at,
+  webhook_request_item_json(wr) AS item_json
+FROM webhook_requests wr
+WHERE endpoint_id = $1
+ORDER BY received_at DESC, id DESC
+LIMIT $2;
+
+-- name: list_requests_json_page_before
+SELECT
+  id,
+  received_at,
+  webhook_request_item_json(wr) AS item_json
+FROM webhook_requests wr
+WHERE endpoint_id = $1
+  AND (received_at, id) < ($2::timestamptz, $3::uuid)
+ORDER BY received_at DESC, id DESC
+LIMIT $4;
+
+-- name: get_request_json_for_endpoint
+SELECT
+  webhook_request_item_json(wr) AS item_json
+FROM webhook_requests wr
+WHERE endpoint_id = $1
+  AND id = $2::uuid
+LIMIT 1;
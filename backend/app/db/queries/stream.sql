@@ -0,0 +1,2 @@
+-- name: notify_stream_event
+SELECT pg_notify($1, $2);
@@ -13,6 +13,37 @@ CREATE INDEX IF NOT EXISTS idx_webhook_endpoints_expires_at
 CREATE INDEX IF NOT EXISTS idx_webhook_endpoints_active_expires
   ON webhook_endpoints (is_active, expires_at);
 
+-- With REQUEST_PARTITIONING enabled, a new database gets webhook_requests range-partitioned
+-- by received_at so retention can drop whole partitions. Partitions themselves are created
+-- ahead of time by app.services.request_partitions; an existing plain table is left as is.
+DO $$
+BEGIN
+  IF current_setting('webhook_tester.request_partitioning', true) IN ('hourly', 'daily') THEN
+    CREATE TABLE IF NOT EXISTS webhook_requests (
+      id UUID NOT NULL,
+      endpoint_id TEXT NOT NULL,
+      received_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+      method TEXT NOT NULL,
+      path TEXT NOT NULL,
+      query_string TEXT NULL,
+      status_code INTEGER NOT NULL,
+      client_ip INET NULL,
+      headers_json JSONB NOT NULL,
+      content_type TEXT NOT NULL,
+      body_size_bytes INTEGER NOT NULL,
+      raw_body TEXT NULL,
+      parsed_json JSONB NULL,
+      body_encoding TEXT NOT NULL DEFAULT 'identity',
+      body_bytes BYTEA NULL,
+      body_is_json BOOLEAN NULL,
+      body_is_text BOOLEAN NULL,
+      encoded_size_bytes INTEGER NULL,
+      PRIMARY KEY (id, received_at)
+    ) PARTITION BY RANGE (received_at);
+  END IF;
+END
+$$;
+
 CREATE TABLE IF NOT EXISTS webhook_requests (
   id UUID PRIMARY KEY,
   endpoint_id TEXT NOT NULL,
@@ -25,10 +56,70 @@ CREATE TABLE IF NOT EXISTS webhook_requests (
   headers_json JSONB NOT NULL,
   content_type TEXT NOT NULL,
   body_size_bytes INTEGER NOT NULL,
-  raw_body TEXT NOT NULL,
-  parsed_json JSONB NULL
+  raw_body TEXT NULL,
+  parsed_json JSONB NULL,
+  body_encoding TEXT NOT NULL DEFAULT 'identity',
+  body_bytes BYTEA NULL,
+  body_is_json BOOLEAN NULL,
+  body_is_text BOOLEAN NULL,
+  encoded_size_bytes INTEGER NULL
 );
 
+-- A partitioned table gets a DEFAULT partition, so a capture outside the premade partitions is
+-- still stored when partition maintenance falls behind; ensure_request_partitions() moves such
+-- rows into their partition once it is created.
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1
+    FROM pg_partitioned_table
+    WHERE partrelid = 'webhook_requests'::regclass AND partdefid = 0
+  ) THEN
+    CREATE TABLE IF NOT EXISTS webhook_requests_default PARTITION OF webhook_requests DEFAULT;
+  END IF;
+END
+$$;
+
+-- Upgrades for tables created by older releases. Each ALTER takes an ACCESS EXCLUSIVE lock on
+-- webhook_requests, so the catalog is checked first and an up-to-date table is left alone.
+DO $$
+BEGIN
+  IF (
+    SELECT count(*)
+    FROM pg_attribute
+    WHERE attrelid = 'webhook_requests'::regclass
+      AND attname IN (
+        'body_encoding', 'body_bytes', 'body_is_json', 'body_is_text', 'encoded_size_bytes'
+      )
+      AND NOT attisdropped
+  ) < 5 THEN
+    ALTER TABLE webhook_requests
+      ADD COLUMN IF NOT EXISTS body_encoding TEXT NOT NULL DEFAULT 'identity',
+      ADD COLUMN IF NOT EXISTS body_bytes BYTEA NULL,
+      ADD COLUMN IF NOT EXISTS body_is_json BOOLEAN NULL,
+      ADD COLUMN IF NOT EXISTS body_is_text BOOLEAN NULL,
+      ADD COLUMN IF NOT EXISTS encoded_size_bytes INTEGER NULL;
+  END IF;
+
+  IF EXISTS (
+    SELECT 1
+    FROM pg_attribute
+    WHERE attrelid = 'webhook_requests'::regclass AND attname = 'raw_body' AND attnotnull
+  ) THEN
+    ALTER TABLE webhook_requests ALTER COLUMN raw_body DROP NOT NULL;
+  END IF;
+
+  -- Uncompressed TOAST storage lets substring() fetch only the chunks of a range.
+  IF EXISTS (
+    SELECT 1
+    FROM pg_attribute
+    WHERE attrelid = 'webhook_requests'::regclass AND attname = 'body_bytes' AND attstorage <> 'e'
+  ) THEN
+    ALTER TABLE webhook_requests ALTER COLUMN body_bytes SET STORAGE EXTERNAL;
+  END IF;
+END
+$$;
+
 CREATE INDEX IF NOT EXISTS idx_webhook_requests_endpoint_received
   ON webhook_requests (endpoint_id, received_at DESC, id DESC);
 
@@ -38,3 +129,45 @@ CREATE INDEX IF NOT EXISTS idx_webhook_requests_endpoint_id
 CREATE INDEX IF NOT EXISTS idx_webhook_requests_received_at
   ON webhook_requests (received_at);
 
+-- A request rendered as JSON equivalent to what the requests API returns (same keys and values,
+-- Postgres whitespace), for the list and detail queries that let Postgres build the response. NULL when only Python can render the body: compressed or
+-- binary bodies, and text containing NUL, which convert_from() rejects.
+CREATE OR REPLACE FUNCTION webhook_request_item_json(r webhook_requests)
+RETURNS text
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT CASE
+    WHEN r.body_bytes IS NULL
+      OR (
+        r.body_encoding = 'identity'
+        AND r.body_is_text
+        AND position('\x00'::bytea IN r.body_bytes) = 0
+      )
+    THEN
+      json_build_object(
+        'id', r.id::text,
+        'endpointId', r.endpoint_id,
+        'method', r.method,
+        'path', r.path,
+        'receivedAt', to_char(r.received_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+          || CASE
+            WHEN extract(microseconds FROM r.received_at)::bigint % 1000000 = 0 THEN ''
+            ELSE to_char(r.received_at AT TIME ZONE 'UTC', '.US')
+          END
+          || 'Z',
+        'statusCode', r.status_code,
+        'ip', COALESCE(host(r.client_ip), 'unknown'),
+        'headers', r.headers_json,
+        'contentType', r.content_type,
+        'bodySizeBytes', r.body_size_bytes,
+        'rawBody', COALESCE(r.raw_body, convert_from(r.body_bytes, 'UTF8')),
+        'bodyIsBinary', FALSE,
+        'parsedJson', CASE
+          WHEN r.parsed_json IS NOT NULL THEN r.parsed_json::json
+          WHEN r.body_is_json THEN COALESCE(r.raw_body, convert_from(r.body_bytes, 'UTF8'))::json
+        END,
+        'encodedSizeBytes', r.encoded_size_bytes
+      )::text
+  END;
+$$;
@@ -7,9 +7,24 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.core.config import get_settings
+from app.core.constants import MAX_LIST_PAGE_SIZE
 from app.core.logging import configure_logging
-from app.db.pool import bootstrap_schema, close_pool, create_pool, load_queries
-from app.services.cleanup_service import run_cleanup_loop
+from app.db.pool import bootstrap_database, close_pool, create_pool, load_queries
+from app.services.body_offload import BodyOffload, create_body_offload
+from app.services.body_storage import BodyStorage
+from app.services.cleanup_leader import CleanupLeader
+from app.services.cleanup_service import CleanupEngine, run_cleanup_loop
+from app.services.endpoint_cache import EndpointCache
+from app.services.endpoint_filter import EndpointFilter, run_endpoint_filter_loop
+from app.services.ingest_writer import IngestWriter
+from app.services.loop_lag import LoopLagMonitor, run_loop_lag_monitor
+from app.services.pg_stream_hub import PostgresStreamHub
+from app.services.recent_requests import RecentRequestsCache
+from app.services.request_partitions import (
+    RequestPartitioning,
+    ensure_request_partitions,
+    is_partitioned,
+)
 from app.services.stream_hub import StreamHub
 
 logger = logging.getLogger(__name__)
@@ -22,39 +37,166 @@ async def app_lifespan(app: FastAPI):
 
     pool = None
     cleanup_task: asyncio.Task[None] | None = None
+    cleanup_engine: CleanupEngine | None = None
+    endpoint_filter_task: asyncio.Task[None] | None = None
+    loop_lag_task: asyncio.Task[None] | None = None
+    body_offload: BodyOffload | None = None
+    ingest_writer: IngestWriter | None = None
+    recent_requests: RecentRequestsCache | None = None
+    request_partitioning: RequestPartitioning | None = None
     queries = load_queries()
-    stream_hub = StreamHub(max_queue_size=settings.stream_queue_maxsize)
+    stream_hub: StreamHub | PostgresStreamHub = StreamHub(
+        max_queue_size=settings.stream_queue_maxsize,
+        replay_buffer_size=settings.stream_replay_buffer_size,
+        replay_buffer_bytes=settings.stream_replay_buffer_bytes,
+        max_replay_endpoints=settings.stream_replay_max_endpoints,
+    )
+    body_storage = BodyStorage(
+        compression=settings.body_compression,
+        min_bytes=settings.body_compression_min_bytes,
+        level=settings.body_compression_level,
+        persist_parsed_json=settings.persist_parsed_json,
+    )
+    loop_lag_monitor = LoopLagMonitor(interval_seconds=settings.loop_lag_sample_ms / 1000)
+    endpoint_cache = EndpointCache(max_entries=settings.endpoint_cache_max_entries)
+    endpoint_filter = EndpointFilter(
+        negative_ttl_seconds=settings.endpoint_negative_cache_ttl_seconds,
+        max_negative_entries=settings.endpoint_negative_cache_max_entries,
+        multi_process=settings.stream_hub_backend == "postgres",
+    )
 
     try:
-        pool = await create_pool(settings)
-        await bootstrap_schema(pool)
+        loop_lag_task = asyncio.create_task(
+            run_loop_lag_monitor(loop_lag_monitor), name="loop-lag-monitor"
+        )
+        await bootstrap_database(settings, request_partitioning=settings.request_partitioning)
+        pool = await create_pool(settings, queries=queries)
+
+        if settings.request_partitioning != "none":
+            if await is_partitioned(pool, queries):
+                request_partitioning = RequestPartitioning(
+                    granularity=settings.request_partitioning,
+                    premake=settings.request_partitions_premake,
+                )
+                await ensure_request_partitions(pool, queries, request_partitioning)
+            else:
+                logger.warning(
+                    "Request partitioning disabled: webhook_requests already exists as a "
+                    "plain table; retention falls back to batched deletes"
+                )
+
+        if settings.stream_hub_backend == "postgres":
+            stream_hub = PostgresStreamHub(
+                dsn=settings.database_url,
+                pool=pool,
+                queries=queries,
+                local=stream_hub,
+                max_payload_bytes=settings.stream_notify_max_payload_bytes,
+            )
+            await stream_hub.start()
+
+        if settings.recent_requests_cache_enabled:
+            if settings.stream_hub_backend == "memory":
+                recent_requests = RecentRequestsCache(
+                    max_items_per_endpoint=MAX_LIST_PAGE_SIZE + 1,
+                    max_bytes=settings.recent_requests_cache_max_bytes,
+                    request_ttl_seconds=settings.request_ttl_seconds,
+                )
+            else:
+                logger.warning(
+                    "Recent requests cache disabled: it needs a single process "
+                    "with the in-memory stream hub"
+                )
 
+        def forget_endpoints(endpoint_ids: list[str]) -> None:
+            for endpoint_id in endpoint_ids:
+                endpoint_cache.discard(endpoint_id)
+                if recent_requests is not None:
+                    recent_requests.discard(endpoint_id)
+
+        if settings.body_offload_enabled:
+            body_offload = create_body_offload(
+                min_bytes=settings.body_offload_min_bytes,
+                executor=settings.body_offload_executor,
+                max_workers=settings.body_offload_max_workers,
+            )
+
+        if settings.ingest_batch_enabled:
+            ingest_writer = IngestWriter(
+                pool=pool,
+                queries=queries,
+                max_batch_size=settings.ingest_batch_max_size,
+                max_linger_seconds=settings.ingest_batch_max_linger_ms / 1000,
+                max_in_flight=settings.ingest_batch_max_in_flight,
+                body_storage=body_storage,
+            )
+
+        cleanup_engine = CleanupEngine(
+            pool=pool,
+            queries=queries,
+            request_ttl_seconds=settings.request_ttl_seconds,
+            min_batch_size=settings.cleanup_batch_min_size,
+            max_batch_size=settings.cleanup_batch_max_size,
+            target_batch_seconds=settings.cleanup_target_batch_ms / 1000,
+            cycle_budget_seconds=settings.cleanup_cycle_budget_ms / 1000,
+            request_partitioning=request_partitioning,
+            on_endpoints_deleted=forget_endpoints,
+        )
         cleanup_task = asyncio.create_task(
             run_cleanup_loop(
-                pool,
-                queries,
-                request_ttl_seconds=settings.request_ttl_seconds,
+                cleanup_engine,
                 interval_seconds=settings.cleanup_interval_seconds,
+                leader=(
+                    CleanupLeader(dsn=settings.database_url)
+                    if settings.cleanup_leader_election
+                    else None
+                ),
+                leader_retry_seconds=settings.cleanup_leader_retry_seconds,
             ),
             name="ttl-cleanup-loop",
         )
+        endpoint_filter_task = asyncio.create_task(
+            run_endpoint_filter_loop(
+                pool,
+                queries,
+                endpoint_filter,
+                interval_seconds=settings.endpoint_filter_rebuild_seconds,
+            ),
+            name="endpoint-filter-refresh",
+        )
 
         app.state.settings = settings
         app.state.db_pool = pool
         app.state.queries = queries
         app.state.stream_hub = stream_hub
+        app.state.body_storage = body_storage
+        app.state.body_offload = body_offload
+        app.state.loop_lag_monitor = loop_lag_monitor
+        app.state.ingest_writer = ingest_writer
+        app.state.endpoint_cache = endpoint_cache
+        app.state.endpoint_filter = endpoint_filter
+        app.state.recent_requests = recent_requests
+        app.state.import_slots = asyncio.Semaphore(settings.import_max_concurrent)
         app.state.cleanup_task = cleanup_task
+        app.state.cleanup_engine = cleanup_engine
         logger.info("Application startup complete")
 
         yield
     finally:
-        if cleanup_task is not None:
-            cleanup_task.cancel()
+        for task in (cleanup_task, endpoint_filter_task, loop_lag_task):
+            if task is None:
+                continue
+            task.cancel()
             try:
-                await cleanup_task
+                await task
             except asyncio.CancelledError:
                 pass
 
+        if ingest_writer is not None:
+            await ingest_writer.close()
+        if body_offload is not None:
+            body_offload.close()
+
         await stream_hub.close()
         await close_pool(pool)
         logger.info("Application shutdown complete")
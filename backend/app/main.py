@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 
 from app.api import build_api_router
+from app.api.fast_ingest import IngestFastPath
 from app.core.config import Settings, get_settings
 from app.core.errors import register_error_handlers
 from app.lifespan import app_lifespan
@@ -26,6 +27,10 @@ def create_app(*, use_lifespan: bool = True, settings: Settings | None = None) -
         lifespan=app_lifespan if use_lifespan else _noop_lifespan,
     )
 
+    if app_settings.ingest_fast_path_enabled:
+        # Added before CORS so CORS still wraps the responses it sends.
+        app.add_middleware(IngestFastPath)
+
     if app_settings.cors_allow_origins:
         app.add_middleware(
             CORSMiddleware,
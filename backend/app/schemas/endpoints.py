@@ -10,6 +10,10 @@ class CreateEndpointResponse(CamelModel):
     expires_at: str
 
 
+class CreateEndpointsResponse(CamelModel):
+    items: list[CreateEndpointResponse]
+
+
 class EndpointRecord(CamelModel):
     endpoint_id: str
     created_at: str
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
+from pydantic import Base64Bytes, Field
+
 from app.schemas.common import CamelModel
 
 
@@ -17,7 +20,9 @@ class WebhookRequestDTO(CamelModel):
     content_type: str
     body_size_bytes: int
     raw_body: str
+    body_is_binary: bool = False
     parsed_json: Any | None = None
+    encoded_size_bytes: int | None = None
 
 
 class ListRequestsResponse(CamelModel):
@@ -25,7 +30,50 @@ class ListRequestsResponse(CamelModel):
     next_cursor: str | None = None
 
 
+class WebhookRequestSummaryDTO(CamelModel):
+    id: str
+    endpoint_id: str
+    method: str
+    path: str
+    received_at: str
+    status_code: int
+    ip: str
+    content_type: str
+    body_size_bytes: int
+    body_preview: str | None = None
+
+
+class ListRequestSummariesResponse(CamelModel):
+    items: list[WebhookRequestSummaryDTO]
+    next_cursor: str | None = None
+
+
 class IngestAckResponse(CamelModel):
     accepted: bool
     request_id: str
 
+
+class ImportedRequestRecord(CamelModel):
+    """One line of a request import, in the shape of ``WebhookRequestDTO``.
+
+    Binary bodies, which that shape cannot carry, may be given as ``bodyBase64``.
+    """
+
+    endpoint_id: str | None = None
+    method: str = "POST"
+    path: str | None = None
+    query_string: str | None = None
+    received_at: datetime | None = None
+    ip: str | None = None
+    headers: dict[str, str] = Field(default_factory=dict)
+    raw_body: str = ""
+    body_base64: Base64Bytes | None = None
+    encoded_size_bytes: int | None = None
+
+
+class ImportRequestsResponse(CamelModel):
+    imported: int
+    skipped: int
+    missing_endpoint_ids: list[str]
+    elapsed_ms: int
+    rows_per_second: float
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+import orjson
+
+from app.services.body_storage import IDENTITY, BodyStorage
+from app.utils.json_parse import parse_json_if_applicable
+
+
+@dataclass(slots=True)
+class OffloadedBody:
+    """Ingest work done for a large body away from the event loop.
+
+    Only plain bytes come back, so the result can cross a process boundary
+    cheaply: ``json_bytes`` is the parsed body re-serialised compactly (``None``
+    when the body is not JSON) and ``body_bytes`` is ``None`` when the body is
+    stored as received.
+    """
+
+    json_bytes: bytes | None
+    body_encoding: str
+    body_bytes: bytes | None
+
+
+def analyze_body(content_type: str, body: bytes, body_storage: BodyStorage) -> OffloadedBody:
+    parsed_json = parse_json_if_applicable(content_type, body)
+    body_encoding, body_bytes = body_storage.encode(body)
+    return OffloadedBody(
+        json_bytes=orjson.dumps(parsed_json) if parsed_json is not None else None,
+        body_encoding=body_encoding,
+        body_bytes=body_bytes if body_encoding != IDENTITY else None,
+    )
+
+
+@dataclass(slots=True)
+class BodyOffload:
+    """Runs JSON parsing and body compression for large bodies in an executor.
+
+    Bodies under ``min_bytes`` are left to the caller to handle inline; larger
+    ones are analysed by ``analyze_body`` in ``executor``. The parsed value never
+    comes back to the event loop: the capture keeps it as pre-rendered JSON, so
+    the loop also skips re-encoding it for the database and the stream.
+
+    orjson holds the GIL while parsing, so with a thread pool a parse still
+    stalls the loop; a process pool takes it off entirely at the cost of copying
+    the body to the worker and the JSON back.
+    """
+
+    min_bytes: int
+    executor: Executor
+    offloaded: int = 0
+
+    async def analyze(
+        self,
+        content_type: str,
+        body: bytes,
+        body_storage: BodyStorage,
+    ) -> OffloadedBody | None:
+        """The offloaded analysis of ``body``, or ``None`` when it should stay inline."""
+        if len(body) < self.min_bytes:
+            return None
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, analyze_body, content_type, body, body_storage
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        return {"minBytes": self.min_bytes, "offloaded": self.offloaded}
+
+
+def create_body_offload(
+    *,
+    min_bytes: int,
+    executor: Literal["thread", "process"],
+    max_workers: int,
+) -> BodyOffload:
+    if executor == "process":
+        # Workers are spawned rather than forked from a process running an event loop.
+        pool: Executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="body-offload")
+    return BodyOffload(min_bytes=min_bytes, executor=pool)
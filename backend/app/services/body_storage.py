@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Literal
+
+import asyncpg
+
+_NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+IDENTITY = "identity"
+GZIP = "gzip"
+
+# zlib window bits selecting the gzip container, so stored bytes are plain .gz data.
+_GZIP_WBITS = 31
+
+
+@dataclass(slots=True, frozen=True)
+class BodyStorage:
+    """Decides how captured bodies are written to ``webhook_requests``.
+
+    Bodies are kept as the exact received bytes in ``body_bytes``; those of at
+    least ``min_bytes`` are gzip-compressed when compression is enabled. Reads
+    dispatch on the stored ``body_encoding``, so toggling the setting never
+    affects rows that were already written.
+
+    With ``persist_parsed_json`` off, JSON bodies are only validated at ingest
+    and flagged with ``body_is_json``; the parsed form is rebuilt from the body
+    at read time instead of being stored as a second JSONB copy.
+    """
+
+    compression: Literal["none", "gzip"] = "none"
+    min_bytes: int = 1024
+    level: int = 6
+    persist_parsed_json: bool = True
+
+    def encode(self, body: bytes) -> tuple[str, bytes]:
+        """Return ``(body_encoding, body_bytes)`` for a received body."""
+        if self.compression == "none" or len(body) < self.min_bytes:
+            return IDENTITY, body
+        return GZIP, zlib.compress(body, self.level, wbits=_GZIP_WBITS)
+
+
+def decode_body(body_encoding: str, body_bytes: bytes) -> bytes:
+    if body_encoding == IDENTITY:
+        return body_bytes
+    if body_encoding == GZIP:
+        return zlib.decompress(body_bytes, wbits=_GZIP_WBITS)
+    raise ValueError(f"Unsupported body encoding: {body_encoding}")
+
+
+def decode_body_prefix(body_encoding: str, body_bytes: bytes, max_bytes: int) -> bytes:
+    """Decode at most ``max_bytes`` of a stored body without inflating the rest."""
+    if body_encoding == GZIP:
+        return zlib.decompressobj(wbits=_GZIP_WBITS).decompress(body_bytes, max_bytes)
+    return decode_body(body_encoding, body_bytes)[:max_bytes]
+
+
+async def compress_stored_bodies(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    body_storage: BodyStorage,
+    *,
+    batch_size: int = 500,
+) -> int:
+    """Rewrite existing uncompressed bodies that the storage policy would now compress.
+
+    Walks the table in small primary-key batches so it can run next to live
+    traffic; rows that are already compressed are left alone.
+    """
+    if body_storage.compression == "none":
+        return 0
+
+    converted = 0
+    after_id = _NIL_UUID
+    while True:
+        rows = await pool.fetch(
+            queries["list_uncompressed_bodies"], body_storage.min_bytes, after_id, batch_size
+        )
+        if not rows:
+            return converted
+
+        ids: list[str] = []
+        encodings: list[str] = []
+        payloads: list[bytes] = []
+        for row in rows:
+            body_encoding, body_bytes = body_storage.encode(row["body"])
+            if body_encoding == IDENTITY:
+                continue
+            ids.append(row["id"])
+            encodings.append(body_encoding)
+            payloads.append(body_bytes)
+
+        if ids:
+            await pool.execute(queries["store_compressed_bodies"], ids, encodings, payloads)
+            converted += len(ids)
+        after_id = rows[-1]["id"]
+
+
+async def iter_decoded_chunks(
+    stored_chunks: AsyncIterator[bytes],
+    body_encoding: str,
+) -> AsyncIterator[bytes]:
+    """Decode a stored body incrementally as its bytes arrive from the database."""
+    if body_encoding == IDENTITY:
+        async for chunk in stored_chunks:
+            yield chunk
+        return
+    if body_encoding != GZIP:
+        raise ValueError(f"Unsupported body encoding: {body_encoding}")
+
+    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+    async for chunk in stored_chunks:
+        decoded = decompressor.decompress(chunk)
+        if decoded:
+            yield decoded
+    tail = decompressor.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock keys are a shared bigint namespace; derive ours from a fixed name.
+CLEANUP_LOCK_KEY = int.from_bytes(
+    hashlib.blake2b(b"webhook-tester:ttl-cleanup", digest_size=8).digest(), "big", signed=True
+)
+CHECK_TIMEOUT_SECONDS = 5.0
+# Per-session keepalives so the server drops a vanished leader's session, and its lock,
+# within about half a minute instead of the OS default of hours.
+_SESSION_SETTINGS = {
+    "application_name": "webhook-tester-cleanup-leader",
+    "tcp_keepalives_idle": "10",
+    "tcp_keepalives_interval": "5",
+    "tcp_keepalives_count": "3",
+}
+
+
+@dataclass(slots=True)
+class CleanupLeader:
+    """Elects one cleanup loop across all app processes with a session advisory lock.
+
+    The lock is taken with ``pg_try_advisory_lock`` on a dedicated connection and
+    held for as long as that session lives. When the leader exits or its
+    connection drops, Postgres releases the lock with the session, and the next
+    follower to retry takes over. A leader re-checks its connection before every
+    cycle so it never keeps deleting after silently losing the lock.
+    """
+
+    dsn: str
+    lock_key: int = CLEANUP_LOCK_KEY
+    _connection: asyncpg.Connection | None = None
+    is_leader: bool = False
+    elections_won: int = 0
+
+    async def ensure(self) -> bool:
+        """Return whether this process is (still, or now) the cleanup leader."""
+        try:
+            if self.is_leader:
+                await self._connection.fetchval("SELECT 1", timeout=CHECK_TIMEOUT_SECONDS)
+                return True
+            if self._connection is None or self._connection.is_closed():
+                self._connection = await asyncpg.connect(
+                    dsn=self.dsn,
+                    timeout=CHECK_TIMEOUT_SECONDS,
+                    server_settings=_SESSION_SETTINGS,
+                )
+            acquired = await self._connection.fetchval(
+                "SELECT pg_try_advisory_lock($1)", self.lock_key, timeout=CHECK_TIMEOUT_SECONDS
+            )
+        except (OSError, TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError):
+            if self.is_leader:
+                logger.warning("Lost the cleanup leader connection; stepping down")
+            await self._drop_connection()
+            return False
+
+        if acquired:
+            self.is_leader = True
+            self.elections_won += 1
+            logger.info("This process is now the TTL cleanup leader")
+        return self.is_leader
+
+    async def close(self) -> None:
+        # Closing the session releases the lock for the other processes.
+        await self._drop_connection()
+
+    async def _drop_connection(self) -> None:
+        connection, self._connection = self._connection, None
+        self.is_leader = False
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception:  # pragma: no cover - best effort on a broken connection
+                connection.terminate()
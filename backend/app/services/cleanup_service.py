@@ -2,78 +2,202 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 import asyncpg
 
+from app.services.cleanup_leader import CleanupLeader
+from app.services.request_partitions import (
+    RequestPartitioning,
+    drop_expired_request_partitions,
+    ensure_request_partitions,
+)
+
 logger = logging.getLogger(__name__)
 
+# Expired requests counted past this are reported as "at least" this many.
+BACKLOG_COUNT_CAP = 100_000
+# Pause between cycles while a backlog remains, instead of the full interval.
+BACKLOG_PAUSE_SECONDS = 1.0
 
-async def _delete_in_batches(
-    pool: asyncpg.Pool,
-    query: str,
-    *params: object,
-    batch_size_param_index: int = -1,
-) -> int:
-    total_deleted = 0
-    batch_size = int(params[batch_size_param_index])
 
-    while True:
-        rows = await pool.fetch(query, *params)
-        deleted = len(rows)
-        total_deleted += deleted
-        if deleted < batch_size:
-            break
+@dataclass(slots=True)
+class CleanupEngine:
+    """Deletes expired requests and endpoints within a per-cycle time budget.
 
-    return total_deleted
+    Each DELETE batch is sized from the latency of the previous one: it doubles
+    while batches finish well under ``target_batch_seconds``, shrinks in
+    proportion when they run over, and halves when the pool has no idle
+    connection left so ingest is not starved. Deleted rows are counted by
+    Postgres rather than returned. Requests of expired endpoints are removed
+    before the endpoints themselves, so no orphaned rows are left behind.
+    """
 
+    pool: asyncpg.Pool
+    queries: dict[str, str]
+    request_ttl_seconds: int
+    min_batch_size: int = 100
+    max_batch_size: int = 5_000
+    target_batch_seconds: float = 0.2
+    cycle_budget_seconds: float = 10.0
+    request_partitioning: RequestPartitioning | None = None
+    on_endpoints_deleted: Callable[[list[str]], None] | None = None
+    batch_size: int = 0
+    cycles: int = 0
+    deleted_requests: int = 0
+    deleted_endpoints: int = 0
+    dropped_partitions: int = 0
+    last_cycle_seconds: float = 0.0
+    last_cycle_rows: int = 0
+    backlog: int = 0
+    budget_exhausted: bool = False
+    is_leader: bool = True
 
-async def cleanup_once(
-    pool: asyncpg.Pool,
-    queries: dict[str, str],
-    request_ttl_seconds: int,
-    *,
-    batch_size: int = 500,
-) -> tuple[int, int]:
-    deleted_requests = await _delete_in_batches(
-        pool,
-        queries["delete_expired_requests_batch"],
-        request_ttl_seconds,
-        batch_size,
-    )
-    deleted_endpoints = await _delete_in_batches(
-        pool,
-        queries["delete_expired_endpoints_batch"],
-        batch_size,
-    )
-    return deleted_requests, deleted_endpoints
+    def __post_init__(self) -> None:
+        self.max_batch_size = max(self.max_batch_size, self.min_batch_size)
+        self.batch_size = self.batch_size or self.min_batch_size
+
+    def _pool_saturated(self) -> bool:
+        return self.pool.get_idle_size() == 0 and self.pool.get_size() >= self.pool.get_max_size()
+
+    def _adapt(self, elapsed: float, *, full: bool) -> None:
+        if self._pool_saturated():
+            target = self.batch_size // 2
+        elif elapsed > self.target_batch_seconds:
+            target = int(self.batch_size * self.target_batch_seconds / elapsed)
+        elif full and elapsed < self.target_batch_seconds / 2:
+            # Short batches say little about how long a full one would take.
+            target = self.batch_size * 2
+        else:
+            return
+        self.batch_size = min(max(target, self.min_batch_size), self.max_batch_size)
+
+    async def _drain(
+        self, deadline: float, run_batch: Callable[[int], Awaitable[int]]
+    ) -> tuple[int, bool]:
+        """Run batches until one comes back short; ``(rows, budget_exhausted)``."""
+        total = 0
+        while True:
+            if time.monotonic() >= deadline:
+                return total, True
+            limit = self.batch_size
+            started = time.monotonic()
+            deleted = await run_batch(limit)
+            self._adapt(time.monotonic() - started, full=deleted >= limit)
+            total += deleted
+            if deleted < limit:
+                return total, False
+            if self._pool_saturated():
+                await asyncio.sleep(self.target_batch_seconds)
+
+    async def _delete_requests(self, limit: int) -> int:
+        return await self.pool.fetchval(
+            self.queries["delete_expired_requests_batch"], self.request_ttl_seconds, limit
+        )
+
+    async def _delete_endpoint_requests(self, limit: int) -> int:
+        return await self.pool.fetchval(
+            self.queries["delete_expired_endpoint_requests_batch"], limit
+        )
+
+    async def _delete_endpoints(self, limit: int) -> int:
+        rows = await self.pool.fetch(self.queries["delete_expired_endpoints_batch"], limit)
+        if rows and self.on_endpoints_deleted is not None:
+            self.on_endpoints_deleted([row["endpoint_id"] for row in rows])
+        return len(rows)
+
+    async def run_cycle(self) -> tuple[int, int]:
+        """One cleanup pass; returns ``(deleted_requests, deleted_endpoints)``."""
+        started = time.monotonic()
+        deadline = started + self.cycle_budget_seconds
+
+        if self.request_partitioning is not None:
+            await ensure_request_partitions(self.pool, self.queries, self.request_partitioning)
+            # Whole expired partitions go first, leaving the DELETE only the boundary partition.
+            self.dropped_partitions += await drop_expired_request_partitions(
+                self.pool, self.queries, self.request_ttl_seconds
+            )
+
+        deleted_requests, exhausted = await self._drain(deadline, self._delete_requests)
+        deleted_endpoints = 0
+        if not exhausted:
+            cascaded, exhausted = await self._drain(deadline, self._delete_endpoint_requests)
+            deleted_requests += cascaded
+        if not exhausted:
+            deleted_endpoints, exhausted = await self._drain(deadline, self._delete_endpoints)
+
+        self.budget_exhausted = exhausted
+        self.backlog = 0
+        if exhausted:
+            self.backlog = await self.pool.fetchval(
+                self.queries["count_expired_requests_capped"],
+                self.request_ttl_seconds,
+                BACKLOG_COUNT_CAP,
+            )
+
+        self.cycles += 1
+        self.deleted_requests += deleted_requests
+        self.deleted_endpoints += deleted_endpoints
+        self.last_cycle_seconds = time.monotonic() - started
+        self.last_cycle_rows = deleted_requests + deleted_endpoints
+        return deleted_requests, deleted_endpoints
+
+    def stats(self) -> dict[str, object]:
+        rows_per_second = (
+            self.last_cycle_rows / self.last_cycle_seconds if self.last_cycle_seconds else 0.0
+        )
+        return {
+            "leader": self.is_leader,
+            "batchSize": self.batch_size,
+            "cycles": self.cycles,
+            "deletedRequests": self.deleted_requests,
+            "deletedEndpoints": self.deleted_endpoints,
+            "droppedPartitions": self.dropped_partitions,
+            "lastCycleMs": round(self.last_cycle_seconds * 1000, 1),
+            "lastCycleRowsPerSecond": round(rows_per_second, 1),
+            "backlog": self.backlog,
+            "backlogCapped": self.backlog >= BACKLOG_COUNT_CAP,
+            "budgetExhausted": self.budget_exhausted,
+        }
 
 
 async def run_cleanup_loop(
-    pool: asyncpg.Pool,
-    queries: dict[str, str],
+    engine: CleanupEngine,
     *,
-    request_ttl_seconds: int,
     interval_seconds: int,
-    batch_size: int = 500,
+    leader: CleanupLeader | None = None,
+    leader_retry_seconds: float = 5.0,
 ) -> None:
-    while True:
-        try:
-            deleted_requests, deleted_endpoints = await cleanup_once(
-                pool,
-                queries,
-                request_ttl_seconds,
-                batch_size=batch_size,
-            )
-            if deleted_requests or deleted_endpoints:
-                logger.info(
-                    "TTL cleanup removed requests=%s endpoints=%s",
-                    deleted_requests,
-                    deleted_endpoints,
-                )
-        except asyncio.CancelledError:
-            raise
-        except Exception:  # pragma: no cover - defensive logging path
-            logger.exception("TTL cleanup loop failed")
-
-        await asyncio.sleep(interval_seconds)
+    """Run cleanup cycles; with a ``leader``, only while this process holds the lock."""
+    try:
+        while True:
+            try:
+                engine.is_leader = leader is None or await leader.ensure()
+                if engine.is_leader:
+                    deleted_requests, deleted_endpoints = await engine.run_cycle()
+                    if deleted_requests or deleted_endpoints:
+                        logger.info(
+                            "TTL cleanup removed requests=%s endpoints=%s backlog=%s batch_size=%s",
+                            deleted_requests,
+                            deleted_endpoints,
+                            engine.backlog,
+                            engine.batch_size,
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pragma: no cover - defensive logging path
+                logger.exception("TTL cleanup loop failed")
+
+            if not engine.is_leader:
+                # Followers poll often so a dead leader is replaced promptly.
+                await asyncio.sleep(min(leader_retry_seconds, interval_seconds))
+            elif engine.budget_exhausted:
+                await asyncio.sleep(min(BACKLOG_PAUSE_SECONDS, interval_seconds))
+            else:
+                await asyncio.sleep(interval_seconds)
+    finally:
+        if leader is not None:
+            await leader.close()
 
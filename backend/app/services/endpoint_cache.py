@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.schemas.endpoints import EndpointRecord
+from app.utils.time import utc_now
+
+
+@dataclass(slots=True)
+class _CachedEndpoint:
+    record: EndpointRecord
+    expires_at: datetime
+
+
+@dataclass(slots=True)
+class EndpointCache:
+    """Bounded LRU of active endpoints.
+
+    Each entry lives until the endpoint's own ``expires_at``; endpoints are never
+    reactivated, so an entry cannot go stale before that except through deletion,
+    which the cleanup loop reports via ``discard``.
+    """
+
+    max_entries: int
+    _entries: OrderedDict[str, _CachedEndpoint] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def get(self, endpoint_id: str) -> EndpointRecord | None:
+        entry = self._entries.get(endpoint_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= utc_now():
+            del self._entries[endpoint_id]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(endpoint_id)
+        self.hits += 1
+        return entry.record
+
+    def put(self, record: EndpointRecord) -> None:
+        expires_at = datetime.fromisoformat(record.expires_at)
+        if expires_at <= utc_now():
+            return
+
+        self._entries[record.endpoint_id] = _CachedEndpoint(record=record, expires_at=expires_at)
+        self._entries.move_to_end(record.endpoint_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, endpoint_id: str) -> None:
+        self._entries.pop(endpoint_id, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
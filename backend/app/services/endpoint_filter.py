@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BloomFilter:
+    size_bits: int
+    hash_count: int
+    _bits: bytearray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float = 0.01) -> BloomFilter:
+        capacity = max(capacity, 1)
+        size_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        hash_count = max(1, round(size_bits / capacity * math.log(2)))
+        return cls(size_bits=size_bits, hash_count=hash_count)
+
+    def _positions(self, value: str) -> Iterable[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.size_bits
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value)
+        )
+
+
+@dataclass(slots=True)
+class EndpointFilter:
+    """Sheds ingest traffic for endpoint IDs known not to exist.
+
+    An ID is rejected only while it has an unexpired negative entry (recorded after
+    the database answered 404) and is absent from the Bloom filter of live IDs.
+    Endpoints created in this process are added to the filter immediately, so a
+    freshly created endpoint is never rejected. With ``multi_process`` set, other
+    replicas may create an ID this process has just seen 404, and that only shows
+    up at the next rebuild; a negative entry then rejects only once a rebuild whose
+    snapshot started after the 404 still lacks the ID, and until then the caller
+    asks the database again.
+    """
+
+    negative_ttl_seconds: float
+    max_negative_entries: int
+    multi_process: bool = False
+    _live: BloomFilter | None = None
+    _snapshot_at: float = float("-inf")
+    _created_since_rebuild: set[str] = field(default_factory=set)
+    _negative: OrderedDict[str, float] = field(default_factory=OrderedDict)
+    rejections: int = 0
+    rebuilds: int = 0
+
+    def should_reject(self, endpoint_id: str) -> bool:
+        recorded_at = self._negative.get(endpoint_id)
+        if recorded_at is None:
+            return False
+        if recorded_at + self.negative_ttl_seconds <= time.monotonic():
+            del self._negative[endpoint_id]
+            return False
+        if self.multi_process and recorded_at >= self._snapshot_at:
+            return False
+        if self._live is not None and endpoint_id in self._live:
+            return False
+        self.rejections += 1
+        return True
+
+    def record_missing(self, endpoint_id: str) -> None:
+        now = time.monotonic()
+        recorded_at = self._negative.get(endpoint_id)
+        # Keep the first 404's time so repeated misses can still be confirmed by a rebuild.
+        if recorded_at is None or recorded_at + self.negative_ttl_seconds <= now:
+            self._negative[endpoint_id] = now
+        self._negative.move_to_end(endpoint_id)
+        while len(self._negative) > self.max_negative_entries:
+            self._negative.popitem(last=False)
+
+    def add_live(self, endpoint_id: str) -> None:
+        self._negative.pop(endpoint_id, None)
+        self._created_since_rebuild.add(endpoint_id)
+        if self._live is not None:
+            self._live.add(endpoint_id)
+
+    def rebuild(self, live_endpoint_ids: list[str], *, snapshot_at: float | None = None) -> None:
+        """Replace the live-ID filter; ``snapshot_at`` is when the ID query started."""
+        # IDs created while the snapshot query ran may be missing from it.
+        created = self._created_since_rebuild
+        self._created_since_rebuild = set()
+
+        live = BloomFilter.for_capacity(2 * (len(live_endpoint_ids) + len(created)))
+        for endpoint_id in live_endpoint_ids:
+            live.add(endpoint_id)
+        for endpoint_id in created:
+            live.add(endpoint_id)
+        self._live = live
+        self._snapshot_at = time.monotonic() if snapshot_at is None else snapshot_at
+        self.rebuilds += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "negativeEntries": len(self._negative),
+            "filterBits": self._live.size_bits if self._live is not None else 0,
+            "rejections": self.rejections,
+            "rebuilds": self.rebuilds,
+        }
+
+
+async def refresh_endpoint_filter(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_filter: EndpointFilter,
+) -> None:
+    snapshot_at = time.monotonic()
+    rows = await pool.fetch(queries["list_live_endpoint_ids"])
+    endpoint_filter.rebuild([row["endpoint_id"] for row in rows], snapshot_at=snapshot_at)
+
+
+async def run_endpoint_filter_loop(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_filter: EndpointFilter,
+    *,
+    interval_seconds: int,
+) -> None:
+    while True:
+        try:
+            await refresh_endpoint_filter(pool, queries, endpoint_filter)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pragma: no cover - defensive logging path
+            logger.exception("Endpoint filter refresh failed")
+
+        await asyncio.sleep(interval_seconds)
@@ -5,11 +5,21 @@ from typing import Any
 import asyncpg
 
 from app.core.errors import NotFoundError, ServiceUnavailableError
-from app.schemas.endpoints import CreateEndpointResponse, EndpointRecord
-from app.utils.ids import generate_endpoint_id
+from app.schemas.endpoints import CreateEndpointResponse, CreateEndpointsResponse, EndpointRecord
+from app.services.endpoint_cache import EndpointCache
+from app.services.endpoint_filter import EndpointFilter
+from app.utils.ids import generate_endpoint_id, generate_endpoint_ids
 from app.utils.time import isoformat_z
 
 
+def _row_to_endpoint_record(row: asyncpg.Record) -> EndpointRecord:
+    return EndpointRecord(
+        endpoint_id=row["endpoint_id"],
+        created_at=isoformat_z(row["created_at"]),
+        expires_at=isoformat_z(row["expires_at"]),
+    )
+
+
 async def create_endpoint(
     pool: asyncpg.Pool,
     queries: dict[str, str],
@@ -17,6 +27,8 @@ async def create_endpoint(
     endpoint_ttl_seconds: int,
     *,
     max_retries: int = 5,
+    cache: EndpointCache | None = None,
+    endpoint_filter: EndpointFilter | None = None,
 ) -> CreateEndpointResponse:
     query = queries["create_endpoint"]
     base_url = public_base_url.rstrip("/")
@@ -33,21 +45,83 @@ async def create_endpoint(
         if row is None:
             continue
 
+        record = _row_to_endpoint_record(row)
+        if cache is not None:
+            cache.put(record)
+        if endpoint_filter is not None:
+            endpoint_filter.add_live(record.endpoint_id)
+
         return CreateEndpointResponse(
-            endpoint_id=row["endpoint_id"],
-            hook_url=f"{base_url}/hook/{row['endpoint_id']}",
-            created_at=isoformat_z(row["created_at"]),
-            expires_at=isoformat_z(row["expires_at"]),
+            endpoint_id=record.endpoint_id,
+            hook_url=f"{base_url}/hook/{record.endpoint_id}",
+            created_at=record.created_at,
+            expires_at=record.expires_at,
         )
 
     raise ServiceUnavailableError("Failed to generate unique endpoint ID")
 
 
+async def create_endpoints(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    public_base_url: str,
+    endpoint_ttl_seconds: int,
+    count: int,
+    *,
+    max_retries: int = 5,
+    cache: EndpointCache | None = None,
+    endpoint_filter: EndpointFilter | None = None,
+) -> CreateEndpointsResponse:
+    """Create ``count`` endpoints, inserting each round of IDs with one statement.
+
+    IDs that collide with existing endpoints are skipped by the insert and only
+    that many fresh IDs are generated for the next round.
+    """
+    query = queries["create_endpoints_batch"]
+    base_url = public_base_url.rstrip("/")
+    items: list[CreateEndpointResponse] = []
+
+    for _ in range(max_retries):
+        missing = count - len(items)
+        if missing == 0:
+            break
+        try:
+            rows = await pool.fetch(query, generate_endpoint_ids(missing), endpoint_ttl_seconds)
+        except Exception as exc:  # pragma: no cover - exercised in integration
+            raise ServiceUnavailableError("Database unavailable") from exc
+
+        for row in rows:
+            record = _row_to_endpoint_record(row)
+            if cache is not None:
+                cache.put(record)
+            if endpoint_filter is not None:
+                endpoint_filter.add_live(record.endpoint_id)
+            items.append(
+                CreateEndpointResponse(
+                    endpoint_id=record.endpoint_id,
+                    hook_url=f"{base_url}/hook/{record.endpoint_id}",
+                    created_at=record.created_at,
+                    expires_at=record.expires_at,
+                )
+            )
+
+    if len(items) < count:
+        raise ServiceUnavailableError("Failed to generate unique endpoint IDs")
+    return CreateEndpointsResponse(items=items)
+
+
 async def get_active_endpoint_or_none(
     pool: asyncpg.Pool,
     queries: dict[str, str],
     endpoint_id: str,
+    *,
+    cache: EndpointCache | None = None,
 ) -> EndpointRecord | None:
+    if cache is not None:
+        cached = cache.get(endpoint_id)
+        if cached is not None:
+            return cached
+
     query = queries["get_active_endpoint"]
     try:
         row = await pool.fetchrow(query, endpoint_id)
@@ -57,19 +131,20 @@ async def get_active_endpoint_or_none(
     if row is None:
         return None
 
-    return EndpointRecord(
-        endpoint_id=row["endpoint_id"],
-        created_at=isoformat_z(row["created_at"]),
-        expires_at=isoformat_z(row["expires_at"]),
-    )
+    record = _row_to_endpoint_record(row)
+    if cache is not None:
+        cache.put(record)
+    return record
 
 
 async def ensure_active_endpoint(
     pool: asyncpg.Pool,
     queries: dict[str, str],
     endpoint_id: str,
+    *,
+    cache: EndpointCache | None = None,
 ) -> EndpointRecord:
-    endpoint = await get_active_endpoint_or_none(pool, queries, endpoint_id)
+    endpoint = await get_active_endpoint_or_none(pool, queries, endpoint_id, cache=cache)
     if endpoint is None:
         raise NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
     return endpoint
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncpg
+
+from app.core.errors import NotFoundError
+from app.schemas.requests import WebhookRequestDTO
+from app.services import request_service
+from app.services.body_offload import BodyOffload
+from app.services.body_storage import BodyStorage
+from app.services.endpoint_filter import EndpointFilter
+from app.services.ingest_writer import IngestWriter
+from app.services.pg_stream_hub import PostgresStreamHub
+from app.services.recent_requests import RecentRequestsCache
+from app.services.stream_hub import StreamHub
+from app.utils.cursor import cursor_for_request
+
+
+def reject_known_missing(endpoint_filter: EndpointFilter, endpoint_id: str) -> None:
+    """Raise 404 before the body is read for IDs the filter knows do not exist."""
+    if endpoint_filter.should_reject(endpoint_id):
+        raise NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
+
+
+async def ingest_request(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    payload: request_service.CaptureRequestInput,
+    *,
+    stream_hub: StreamHub | PostgresStreamHub,
+    endpoint_filter: EndpointFilter,
+    ingest_writer: IngestWriter | None = None,
+    recent_requests: RecentRequestsCache | None = None,
+    body_storage: BodyStorage = request_service.DEFAULT_BODY_STORAGE,
+    body_offload: BodyOffload | None = None,
+) -> WebhookRequestDTO:
+    """Store a captured webhook and announce it to stream subscribers."""
+    if body_offload is not None:
+        payload.offloaded = await body_offload.analyze(
+            payload.headers.get("content-type", ""), payload.body, body_storage
+        )
+
+    try:
+        if ingest_writer is not None:
+            captured = await ingest_writer.submit(payload)
+        else:
+            captured = await request_service.capture_request(
+                pool, queries, payload, body_storage=body_storage
+            )
+    except NotFoundError:
+        endpoint_filter.record_missing(payload.endpoint_id)
+        raise
+
+    if recent_requests is not None:
+        if payload.offloaded is None:
+            recent_requests.record(captured)
+        else:
+            # Its parsed JSON is pre-rendered and cannot go through response models.
+            recent_requests.discard(payload.endpoint_id)
+
+    await stream_hub.publish(
+        payload.endpoint_id,
+        "request.created",
+        {"request": captured.model_dump(by_alias=True)},
+        event_id=cursor_for_request(captured),
+    )
+    return captured
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+import asyncpg
+
+from app.core.errors import NotFoundError, ServiceUnavailableError
+from app.schemas.requests import WebhookRequestDTO
+from app.services import request_service
+from app.services.body_storage import BodyStorage
+from app.services.request_service import DEFAULT_BODY_STORAGE, CaptureRequestInput
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PendingCapture:
+    payload: CaptureRequestInput
+    future: asyncio.Future[WebhookRequestDTO]
+
+
+@dataclass(slots=True)
+class IngestWriter:
+    """Group-commits captured requests from concurrent ingest calls.
+
+    Pending captures are flushed as one multi-row insert once ``max_batch_size``
+    is reached or the oldest one has waited ``max_linger_seconds``. At most
+    ``max_in_flight`` batches hit the pool at once; while all slots are busy new
+    captures keep accumulating and go out with the next free slot.
+    """
+
+    pool: asyncpg.Pool
+    queries: dict[str, str]
+    max_batch_size: int
+    max_linger_seconds: float
+    max_in_flight: int
+    body_storage: BodyStorage = DEFAULT_BODY_STORAGE
+    _pending: list[_PendingCapture] = field(default_factory=list)
+    _linger_handle: asyncio.TimerHandle | None = None
+    _in_flight: int = 0
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    _closed: bool = False
+
+    async def submit(self, payload: CaptureRequestInput) -> WebhookRequestDTO:
+        if self._closed:
+            raise ServiceUnavailableError("Ingest writer is shutting down")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[WebhookRequestDTO] = loop.create_future()
+        self._pending.append(_PendingCapture(payload=payload, future=future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._linger_handle is None:
+            self._linger_handle = loop.call_later(self.max_linger_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+
+        while self._pending and self._in_flight < self.max_in_flight:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            self._in_flight += 1
+            task = asyncio.create_task(self._write(batch), name="ingest-writer-flush")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: list[_PendingCapture]) -> None:
+        try:
+            results = await request_service.capture_requests_batch(
+                self.pool,
+                self.queries,
+                [pending.payload for pending in batch],
+                body_storage=self.body_storage,
+            )
+        except ServiceUnavailableError as exc:
+            if len(batch) > 1 and isinstance(exc.__cause__, asyncpg.DataError):
+                # One row Postgres rejects fails the whole statement; write the rows one
+                # by one so only the offending caller gets the error.
+                logger.warning("Batch insert rejected (%s); retrying row by row", exc.__cause__)
+                await self._write_each(batch)
+            else:
+                self._fail(batch, exc)
+        except Exception as exc:
+            self._fail(batch, exc)
+        else:
+            for pending, result in zip(batch, results, strict=True):
+                if pending.future.done():
+                    continue
+                if result is None:
+                    pending.future.set_exception(
+                        NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
+                    )
+                else:
+                    pending.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            if self._pending:
+                self._flush()
+
+    async def _write_each(self, batch: list[_PendingCapture]) -> None:
+        results = await asyncio.gather(
+            *(
+                request_service.capture_request(
+                    self.pool, self.queries, pending.payload, body_storage=self.body_storage
+                )
+                for pending in batch
+            ),
+            return_exceptions=True,
+        )
+        for pending, result in zip(batch, results, strict=True):
+            if pending.future.done():
+                continue
+            if isinstance(result, BaseException):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: list[_PendingCapture], exc: BaseException) -> None:
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+
+    async def close(self) -> None:
+        self._closed = True
+        self._flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pending:  # pragma: no cover - defensive, flush drains on completion
+            logger.warning("Ingest writer closed with %s unflushed captures", len(self._pending))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class LoopLagMonitor:
+    """Measures how late the event loop runs a timer that should fire every interval.
+
+    The lag of a sample is how long past its deadline the sleep returned, i.e.
+    how long the loop was busy with other callbacks. Percentiles cover the last
+    ``window`` samples; the maximum covers the whole process lifetime.
+    """
+
+    interval_seconds: float
+    window: int = 600
+    _samples: deque[float] = field(init=False)
+    max_seconds: float = 0.0
+    samples: int = 0
+
+    def __post_init__(self) -> None:
+        self._samples = deque(maxlen=self.window)
+
+    def record(self, lag_seconds: float) -> None:
+        self._samples.append(lag_seconds)
+        self.samples += 1
+        if lag_seconds > self.max_seconds:
+            self.max_seconds = lag_seconds
+
+    def stats(self) -> dict[str, float | int]:
+        ordered = sorted(self._samples)
+
+        def percentile_ms(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+        return {
+            "intervalMs": round(self.interval_seconds * 1000, 3),
+            "samples": self.samples,
+            "lastMs": round(self._samples[-1] * 1000, 3) if self._samples else 0.0,
+            "p50Ms": percentile_ms(0.5),
+            "p99Ms": percentile_ms(0.99),
+            "maxMs": round(self.max_seconds * 1000, 3),
+        }
+
+
+async def run_loop_lag_monitor(monitor: LoopLagMonitor) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        deadline = loop.time() + monitor.interval_seconds
+        await asyncio.sleep(monitor.interval_seconds)
+        monitor.record(max(0.0, loop.time() - deadline))
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import asyncpg
+import orjson
+
+from app.services import request_service
+from app.services.stream_hub import StreamHub, StreamSubscriber
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "webhook_stream_"
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+def channel_for_endpoint(endpoint_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{endpoint_id}"
+
+
+@dataclass(slots=True)
+class PostgresStreamHub:
+    """Stream hub that fans out across processes through Postgres LISTEN/NOTIFY.
+
+    Every publish is sent as a NOTIFY on the endpoint's channel. Each process
+    LISTENs on a dedicated connection, only for endpoints it has local subscribers
+    for, and hands received events to its in-process ``StreamHub``. Payloads
+    larger than ``max_payload_bytes`` are replaced by the request id and reloaded
+    from the database by the receiving process. Notifications for an endpoint are
+    delivered one at a time in the order they arrived, so an event being reloaded
+    is never overtaken by a later one.
+
+    A local replay ring only stays complete while its channel is LISTENed to, so
+    it is dropped whenever the process stops listening for that endpoint.
+    """
+
+    dsn: str
+    pool: asyncpg.Pool
+    queries: dict[str, str]
+    local: StreamHub
+    max_payload_bytes: int
+    _connection: asyncpg.Connection | None = None
+    _listening: set[str] = field(default_factory=set)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    _backlog: dict[str, deque[dict[str, Any]]] = field(default_factory=dict)
+    _closed: bool = False
+
+    async def start(self) -> None:
+        await self._connect()
+
+    async def subscribe(
+        self,
+        endpoint_id: str,
+        *,
+        last_event_id: str | None = None,
+    ) -> StreamSubscriber:
+        subscriber = await self.local.subscribe(endpoint_id, last_event_id=last_event_id)
+        await self._sync_channel(endpoint_id)
+        return subscriber
+
+    async def unsubscribe(self, endpoint_id: str, subscriber_id: int) -> None:
+        await self.local.unsubscribe(endpoint_id, subscriber_id)
+        await self._sync_channel(endpoint_id)
+
+    async def publish(
+        self,
+        endpoint_id: str,
+        event: str,
+        data: dict[str, Any],
+        *,
+        event_id: str | None = None,
+    ) -> None:
+        payload = orjson.dumps({"event": event, "id": event_id, "data": data})
+        if len(payload) > self.max_payload_bytes:
+            request_id = (data.get("request") or {}).get("id")
+            if request_id is None:
+                logger.warning("Dropping oversized %s stream event for %s", event, endpoint_id)
+                return
+            payload = orjson.dumps({"event": event, "id": event_id, "requestId": request_id})
+
+        await self.pool.execute(
+            self.queries["notify_stream_event"],
+            channel_for_endpoint(endpoint_id),
+            payload.decode("utf-8"),
+        )
+
+    async def close(self) -> None:
+        self._closed = True
+        async with self._lock:
+            connection, self._connection = self._connection, None
+            self._listening.clear()
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await self.local.close()
+
+    async def _connect(self) -> None:
+        connection = await asyncpg.connect(dsn=self.dsn)
+        connection.add_termination_listener(self._on_connection_lost)
+        async with self._lock:
+            self._connection = connection
+            self._listening.clear()
+        for endpoint_id in self.local.endpoint_ids():
+            await self._sync_channel(endpoint_id)
+
+    async def _sync_channel(self, endpoint_id: str) -> None:
+        async with self._lock:
+            connection = self._connection
+            if connection is None or connection.is_closed():
+                return
+
+            wanted = self.local.has_subscribers(endpoint_id)
+            channel = channel_for_endpoint(endpoint_id)
+            if wanted and endpoint_id not in self._listening:
+                await connection.add_listener(channel, self._on_notification)
+                self._listening.add(endpoint_id)
+            elif not wanted and endpoint_id in self._listening:
+                self._listening.discard(endpoint_id)
+                self.local.drop_replay(endpoint_id)
+                await connection.remove_listener(channel, self._on_notification)
+
+    def _on_notification(
+        self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        endpoint_id = channel.removeprefix(CHANNEL_PREFIX)
+        backlog = self._backlog.get(endpoint_id)
+        if backlog is None:
+            backlog = self._backlog[endpoint_id] = deque()
+            self._spawn(self._drain(endpoint_id, backlog))
+        backlog.append(orjson.loads(payload))
+
+    async def _drain(self, endpoint_id: str, backlog: deque[dict[str, Any]]) -> None:
+        # One worker per endpoint with pending notifications; it exits once caught up.
+        try:
+            while backlog:
+                try:
+                    await self._deliver(endpoint_id, backlog.popleft())
+                except Exception:
+                    logger.exception("Stream notification delivery failed for %s", endpoint_id)
+        finally:
+            del self._backlog[endpoint_id]
+
+    async def _deliver(self, endpoint_id: str, message: dict[str, Any]) -> None:
+        data = message.get("data")
+        if "requestId" in message:
+            captured = await request_service.get_request(
+                self.pool, self.queries, endpoint_id, message["requestId"]
+            )
+            data = {"request": captured.model_dump(by_alias=True)}
+        await self.local.publish(endpoint_id, message["event"], data, event_id=message.get("id"))
+
+    def _on_connection_lost(self, _connection: asyncpg.Connection) -> None:
+        # Anything published while disconnected is missing from the rings.
+        self.local.drop_replay()
+        if not self._closed:
+            logger.warning("Stream LISTEN connection lost; reconnecting")
+            self._spawn(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._closed:
+            try:
+                await self._connect()
+                return
+            except Exception:
+                logger.exception("Stream LISTEN reconnect failed")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Stream notification delivery failed", exc_info=task.exception())
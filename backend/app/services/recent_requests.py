@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.schemas.requests import ListRequestsResponse, WebhookRequestDTO
+from app.utils.cursor import cursor_for_request
+from app.utils.time import utc_now
+
+# Rough per-item overhead on top of the body for headers, strings and the model.
+_ITEM_OVERHEAD_BYTES = 1024
+
+
+def _sort_key(request: WebhookRequestDTO) -> tuple[datetime, UUID]:
+    return datetime.fromisoformat(request.received_at), UUID(request.id)
+
+
+@dataclass(slots=True)
+class _RecentRing:
+    # Oldest first, matching the (received_at, id) ordering of the list query.
+    keys: list[tuple[datetime, UUID]] = field(default_factory=list)
+    items: list[WebhookRequestDTO] = field(default_factory=list)
+    size_bytes: int = 0
+    seeded: bool = False
+    # True while the ring holds every stored request of the endpoint.
+    complete: bool = False
+
+    def insert(self, request: WebhookRequestDTO) -> int:
+        key = _sort_key(request)
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return 0
+        self.keys.insert(index, key)
+        self.items.insert(index, request)
+        added = request.body_size_bytes + _ITEM_OVERHEAD_BYTES
+        self.size_bytes += added
+        return added
+
+    def drop_oldest(self, count: int) -> int:
+        freed = sum(item.body_size_bytes + _ITEM_OVERHEAD_BYTES for item in self.items[:count])
+        del self.keys[:count]
+        del self.items[:count]
+        self.size_bytes -= freed
+        return freed
+
+
+@dataclass(slots=True)
+class RecentRequestsCache:
+    """Newest captured requests per endpoint, serving first list pages from memory.
+
+    A ring becomes authoritative once seeded from a first-page database read; from
+    then on every capture in this process is merged into it. Only correct when
+    this process sees every capture, i.e. a single app process with the in-memory
+    stream hub. Cursor pages always go to the database.
+    """
+
+    max_items_per_endpoint: int
+    max_bytes: int
+    request_ttl_seconds: int
+    _rings: OrderedDict[str, _RecentRing] = field(default_factory=OrderedDict)
+    _size_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def first_page(self, endpoint_id: str, limit: int) -> ListRequestsResponse | None:
+        ring = self._rings.get(endpoint_id)
+        if ring is None or not ring.seeded:
+            self.misses += 1
+            return None
+
+        # Mirror TTL cleanup even if the cleanup loop has not run yet.
+        cutoff = utc_now() - timedelta(seconds=self.request_ttl_seconds)
+        expired = bisect.bisect_right(ring.keys, (cutoff, UUID(int=(1 << 128) - 1)))
+        if expired:
+            self._size_bytes -= ring.drop_oldest(expired)
+
+        if len(ring.items) <= limit and not ring.complete:
+            self.misses += 1
+            return None
+
+        self._rings.move_to_end(endpoint_id)
+        self.hits += 1
+        newest = ring.items[::-1]
+        items = newest[:limit]
+        next_cursor: str | None = None
+        if len(newest) > limit:
+            next_cursor = cursor_for_request(items[-1])
+        return ListRequestsResponse(items=items, next_cursor=next_cursor)
+
+    def begin_seed(self, endpoint_id: str) -> None:
+        """Start buffering captures for an endpoint whose first page is being read."""
+        if endpoint_id not in self._rings:
+            self._rings[endpoint_id] = _RecentRing()
+            self._evict()
+
+    def finish_seed(
+        self,
+        endpoint_id: str,
+        requests: list[WebhookRequestDTO],
+        *,
+        complete: bool,
+    ) -> None:
+        ring = self._rings.get(endpoint_id)
+        if ring is None:
+            return
+        # Captures recorded while the query ran were buffered and are kept.
+        for request in requests:
+            self._size_bytes += ring.insert(request)
+        ring.seeded = True
+        ring.complete = complete
+        self._trim(ring)
+        self._evict()
+
+    def record(self, request: WebhookRequestDTO) -> None:
+        ring = self._rings.get(request.endpoint_id)
+        if ring is None:
+            return
+        self._size_bytes += ring.insert(request)
+        self._trim(ring)
+        self._evict()
+
+    def discard(self, endpoint_id: str) -> None:
+        ring = self._rings.pop(endpoint_id, None)
+        if ring is not None:
+            self._size_bytes -= ring.size_bytes
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "endpoints": len(self._rings),
+            "bytes": self._size_bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _trim(self, ring: _RecentRing) -> None:
+        overflow = len(ring.items) - self.max_items_per_endpoint
+        if overflow > 0:
+            self._size_bytes -= ring.drop_oldest(overflow)
+            ring.complete = False
+
+    def _evict(self) -> None:
+        while self._size_bytes > self.max_bytes and self._rings:
+            _, ring = self._rings.popitem(last=False)
+            self._size_bytes -= ring.size_bytes
+            self.evictions += 1
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+
+import asyncpg
+
+from app.db.pool import BOOTSTRAP_LOCK_SQL
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_PREFIX = "webhook_requests_p"
+# Created by schema.sql; catches rows no range partition covers yet.
+DEFAULT_PARTITION = "webhook_requests_default"
+# A plain DETACH waits for every query on webhook_requests and blocks new ones meanwhile.
+_DETACH_LOCK_TIMEOUT = "5s"
+
+
+@dataclass(slots=True, frozen=True)
+class RequestPartitioning:
+    """Layout of a ``webhook_requests`` table range-partitioned by ``received_at``.
+
+    Each partition covers one UTC hour or day and is named after its start,
+    e.g. ``webhook_requests_p2026021814`` or ``webhook_requests_p20260218``.
+    ``premake`` partitions past the current one are kept created so inserts
+    never land outside a partition.
+    """
+
+    granularity: Literal["hourly", "daily"] = "daily"
+    premake: int = 3
+
+    @property
+    def interval(self) -> timedelta:
+        return timedelta(hours=1) if self.granularity == "hourly" else timedelta(days=1)
+
+    def partition_start(self, at: datetime) -> datetime:
+        at = at.astimezone(UTC)
+        if self.granularity == "hourly":
+            return at.replace(minute=0, second=0, microsecond=0)
+        return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def partition_name(self, start: datetime) -> str:
+        fmt = "%Y%m%d%H" if self.granularity == "hourly" else "%Y%m%d"
+        return f"{_PARTITION_PREFIX}{start.strftime(fmt)}"
+
+    def planned_partitions(self, now: datetime) -> list[tuple[str, datetime, datetime]]:
+        """``(name, from, to)`` for the current partition and the premade ones after it."""
+        start = self.partition_start(now)
+        planned = []
+        for _ in range(self.premake + 1):
+            end = start + self.interval
+            planned.append((self.partition_name(start), start, end))
+            start = end
+        return planned
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+async def is_partitioned(pool: asyncpg.Pool, queries: dict[str, str]) -> bool:
+    return bool(await pool.fetchval(queries["request_table_is_partitioned"]))
+
+
+async def ensure_request_partitions(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    partitioning: RequestPartitioning,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """Create any missing partitions up to ``premake`` intervals ahead; returns how many.
+
+    Rows captured while a partition was missing sit in the DEFAULT partition; they
+    are moved into the new partition as it is created, which Postgres requires.
+    """
+    now = now or datetime.now(UTC)
+    planned = partitioning.planned_partitions(now)
+    existing = {
+        row["partition_name"] for row in await pool.fetch(queries["list_request_partitions"])
+    }
+    if all(name in existing for name, _, _ in planned):
+        return 0
+
+    created = 0
+    async with pool.acquire() as conn, conn.transaction():
+        # Every process runs this on startup, and concurrent CREATE ... PARTITION OF for
+        # the same name fails even with IF NOT EXISTS; take the schema bootstrap's lock
+        # and look again.
+        await conn.execute(BOOTSTRAP_LOCK_SQL)
+        existing = {
+            row["partition_name"] for row in await conn.fetch(queries["list_request_partitions"])
+        }
+        if existing - {DEFAULT_PARTITION} and planned[0][0] not in existing:
+            logger.warning(
+                "No request partition covers the current time; partition maintenance fell "
+                "more than REQUEST_PARTITIONS_PREMAKE intervals behind"
+            )
+        for name, start, end in planned:
+            if name in existing:
+                continue
+            # DDL cannot take bind parameters; names and bounds are generated above.
+            lower, upper = f"'{start.isoformat()}'", f"'{end.isoformat()}'"
+            in_range = f"received_at >= {lower} AND received_at < {upper}"
+            # A new partition cannot be attached while the default holds rows in its range.
+            status = await conn.execute(
+                "CREATE TEMP TABLE webhook_requests_moving ON COMMIT DROP AS "
+                f"SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"
+            )
+            moved = int(status.rsplit(" ", 1)[-1])
+            if moved:
+                await conn.execute(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}")
+            await conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_quote_ident(name)} PARTITION OF webhook_requests "
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            )
+            if moved:
+                await conn.execute(
+                    "INSERT INTO webhook_requests SELECT * FROM webhook_requests_moving"
+                )
+                logger.warning("Moved %s requests from the default partition into %s", moved, name)
+            await conn.execute("DROP TABLE webhook_requests_moving")
+            created += 1
+    return created
+
+
+async def drop_expired_request_partitions(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    request_ttl_seconds: int,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """Detach and drop partitions whose every row is past the request TTL.
+
+    ``DETACH ... CONCURRENTLY`` avoids blocking ingest on the parent table; a
+    detach interrupted by a crash is finalized on the next run. Postgres refuses
+    it while a DEFAULT partition exists, so such tables use a plain detach that
+    gives up after ``_DETACH_LOCK_TIMEOUT`` rather than queueing ingest behind
+    it, and retries next run. Rows in the partition that straddles the cutoff
+    are left to the batched DELETE.
+    """
+    cutoff = (now or datetime.now(UTC)) - timedelta(seconds=request_ttl_seconds)
+    partitions = await pool.fetch(queries["list_request_partitions"])
+    has_default = any(row["partition_name"] == DEFAULT_PARTITION for row in partitions)
+    dropped = 0
+    for row in partitions:
+        upper_bound = row["upper_bound"]
+        if upper_bound is None or upper_bound > cutoff:
+            continue
+        name = _quote_ident(row["partition_name"])
+        if row["detach_pending"]:
+            await pool.execute(f"ALTER TABLE webhook_requests DETACH PARTITION {name} FINALIZE")
+            await pool.execute(f"DROP TABLE IF EXISTS {name}")
+        elif not has_default:
+            await pool.execute(f"ALTER TABLE webhook_requests DETACH PARTITION {name} CONCURRENTLY")
+            await pool.execute(f"DROP TABLE IF EXISTS {name}")
+        else:
+            try:
+                async with pool.acquire() as conn, conn.transaction():
+                    await conn.execute(f"SET LOCAL lock_timeout = '{_DETACH_LOCK_TIMEOUT}'")
+                    await conn.execute(f"ALTER TABLE webhook_requests DETACH PARTITION {name}")
+                    await conn.execute(f"DROP TABLE IF EXISTS {name}")
+            except asyncpg.LockNotAvailableError:
+                logger.info(
+                    "Request partition %s is busy; retrying next run", row["partition_name"]
+                )
+                break
+        logger.info("Dropped expired request partition %s", row["partition_name"])
+        dropped += 1
+    return dropped
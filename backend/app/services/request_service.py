@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-import base64
+import ipaddress
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import asyncpg
 import orjson
 
 from app.core.constants import ACCEPTED_INGEST_STATUS
 from app.core.errors import NotFoundError, ServiceUnavailableError
-from app.schemas.requests import ListRequestsResponse, WebhookRequestDTO
+from app.schemas.requests import (
+    ListRequestsResponse,
+    ListRequestSummariesResponse,
+    WebhookRequestDTO,
+    WebhookRequestSummaryDTO,
+)
+from app.services.body_offload import OffloadedBody
+from app.services.body_storage import BodyStorage, decode_body, decode_body_prefix
+from app.services.recent_requests import RecentRequestsCache
+from app.utils.cursor import decode_cursor, encode_cursor
 from app.utils.json_parse import parse_json_if_applicable
+from app.utils.text import decode_utf8, decode_utf8_prefix
 from app.utils.time import isoformat_z
 
+DEFAULT_BODY_STORAGE = BodyStorage()
+
 
 @dataclass(slots=True)
 class CaptureRequestInput:
@@ -24,126 +35,423 @@ class CaptureRequestInput:
     query_string: str | None
     ip: str
     headers: dict[str, str]
-    raw_body: str
+    body: bytes
     body_size_bytes: int
+    # Size on the wire when the body arrived with a Content-Encoding that was decoded.
+    encoded_size_bytes: int | None = None
+    # Set when the body was parsed and encoded off the event loop; see ``BodyOffload``.
+    offloaded: OffloadedBody | None = None
 
 
-def _parse_json_text(value: str | None) -> Any | None:
-    if value is None:
-        return None
-    return orjson.loads(value)
+def _row_body(row: asyncpg.Record) -> bytes:
+    if row["body_bytes"] is None:
+        # Rows written before bodies were stored as bytes.
+        return row["raw_body"].encode("utf-8")
+    return decode_body(row["body_encoding"], row["body_bytes"])
+
+
+def _row_body_preview(row: asyncpg.Record, preview_chars: int) -> str | None:
+    if row["body_bytes"] is None:
+        return row["body_preview"]
+    # A UTF-8 character is at most 4 bytes, so this prefix holds every wanted character.
+    prefix = decode_body_prefix(row["body_encoding"], row["body_bytes"], preview_chars * 4)
+    text = decode_utf8_prefix(prefix)
+    return text[:preview_chars] if text is not None else None
 
 
 def _row_to_webhook_request(row: asyncpg.Record) -> WebhookRequestDTO:
-    headers = _parse_json_text(row["headers_json_text"]) or {}
-    parsed_json = _parse_json_text(row["parsed_json_text"])
+    body = _row_body(row)
+    body_text = decode_utf8(body)
+    parsed_json = row["parsed_json"]
+    if parsed_json is None and row["body_is_json"]:
+        parsed_json = orjson.loads(body)
 
     return WebhookRequestDTO(
-        id=row["id"],
+        id=str(row["id"]),
         endpoint_id=row["endpoint_id"],
         method=row["method"],
         path=row["path"],
         received_at=isoformat_z(row["received_at"]),
         status_code=row["status_code"],
         ip=row["ip"] or "unknown",
-        headers=headers,
+        headers=row["headers_json"] or {},
         content_type=row["content_type"],
         body_size_bytes=row["body_size_bytes"],
-        raw_body=row["raw_body"],
+        raw_body=body_text if body_text is not None else "",
+        body_is_binary=body_text is None,
         parsed_json=parsed_json,
+        encoded_size_bytes=row["encoded_size_bytes"],
     )
 
 
-def encode_cursor(received_at: datetime, request_id: str) -> str:
-    payload = {"receivedAt": isoformat_z(received_at), "id": request_id}
-    encoded = base64.urlsafe_b64encode(orjson.dumps(payload)).decode("ascii")
-    return encoded.rstrip("=")
+@dataclass(slots=True)
+class _PreparedCapture:
+    payload: CaptureRequestInput
+    request_id: str
+    content_type: str
+    body_text: str | None
+    parsed_json: Any | None
+    params: tuple[Any, ...]
+
 
+def _storable_ip(value: str) -> str:
+    """``value`` if Postgres can cast it to ``inet``, else ``""`` (stored as NULL).
 
-def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
-    padding = "=" * (-len(cursor) % 4)
+    The address comes from ``X-Forwarded-For`` unvalidated, and one bad cast
+    would fail every row of a group-committed batch.
+    """
+    if not value:
+        return ""
     try:
-        decoded = base64.urlsafe_b64decode(cursor + padding)
-        payload = orjson.loads(decoded)
-        received_at = datetime.fromisoformat(str(payload["receivedAt"]).replace("Z", "+00:00"))
-        request_id = UUID(str(payload["id"]))
-        return received_at, request_id
-    except Exception as exc:  # noqa: BLE001
-        raise ValueError("Invalid cursor") from exc
+        ipaddress.ip_address(value)
+    except ValueError:
+        return ""
+    return value
 
 
-async def capture_request(
-    pool: asyncpg.Pool,
-    queries: dict[str, str],
-    payload: CaptureRequestInput,
-) -> WebhookRequestDTO:
+def _prepare_capture(payload: CaptureRequestInput, body_storage: BodyStorage) -> _PreparedCapture:
+    request_id = str(uuid4())
     content_type = payload.headers.get("content-type", "application/octet-stream")
-    parsed_json = parse_json_if_applicable(content_type, payload.raw_body)
-
-    headers_json_text = orjson.dumps(payload.headers).decode("utf-8")
-    parsed_json_text = (
-        orjson.dumps(parsed_json).decode("utf-8") if parsed_json is not None else None
-    )
+    offloaded = payload.offloaded
+    if offloaded is None:
+        parsed_json = parse_json_if_applicable(content_type, payload.body)
+        body_encoding, body_bytes = body_storage.encode(payload.body)
+    else:
+        # Already rendered JSON, written verbatim by the jsonb codec and the stream encoder.
+        parsed_json = (
+            orjson.Fragment(offloaded.json_bytes) if offloaded.json_bytes is not None else None
+        )
+        body_encoding = offloaded.body_encoding
+        body_bytes = offloaded.body_bytes if offloaded.body_bytes is not None else payload.body
+    stored_parsed_json = parsed_json if body_storage.persist_parsed_json else None
+    if stored_parsed_json is not None and b"\\u0000" in payload.body:
+        # jsonb rejects NUL in strings; keep the body_is_json flag and re-parse on read.
+        stored_parsed_json = None
+    body_text = decode_utf8(payload.body)
+    # Postgres text cannot hold NUL, so such bodies stay on the Python rendering path.
+    body_is_text = body_text is not None and "\x00" not in body_text
 
-    try:
-        row = await pool.fetchrow(
-            queries["insert_request_if_active"],
+    return _PreparedCapture(
+        payload=payload,
+        request_id=request_id,
+        content_type=content_type,
+        body_text=body_text,
+        parsed_json=parsed_json,
+        params=(
             payload.endpoint_id,
-            str(uuid4()),
+            request_id,
             payload.method,
             payload.path,
             payload.query_string,
             ACCEPTED_INGEST_STATUS,
-            payload.ip,
-            headers_json_text,
+            _storable_ip(payload.ip),
+            payload.headers,
             content_type,
             payload.body_size_bytes,
-            payload.raw_body,
-            parsed_json_text,
-        )
+            stored_parsed_json,
+            body_encoding,
+            body_bytes,
+            parsed_json is not None,
+            body_is_text,
+            payload.encoded_size_bytes,
+        ),
+    )
+
+
+# ``webhook_requests`` columns in the order of ``_PreparedCapture.params``.
+CAPTURE_COLUMNS = (
+    "endpoint_id",
+    "id",
+    "method",
+    "path",
+    "query_string",
+    "status_code",
+    "client_ip",
+    "headers_json",
+    "content_type",
+    "body_size_bytes",
+    "parsed_json",
+    "body_encoding",
+    "body_bytes",
+    "body_is_json",
+    "body_is_text",
+    "encoded_size_bytes",
+)
+
+
+def capture_record(payload: CaptureRequestInput, body_storage: BodyStorage) -> tuple[Any, ...]:
+    """Values for ``CAPTURE_COLUMNS``, as an ingest of ``payload`` would store them."""
+    params = _prepare_capture(payload, body_storage).params
+    if params[6]:
+        return params
+    # The insert turns an empty address into NULL in SQL; COPY needs it up front.
+    return (*params[:6], None, *params[7:])
+
+
+def _captured_request(prepared: _PreparedCapture, row: asyncpg.Record) -> WebhookRequestDTO:
+    """Build the stored request from what was sent plus the server-generated columns."""
+    payload = prepared.payload
+    body_text = prepared.body_text
+    return WebhookRequestDTO(
+        id=prepared.request_id,
+        endpoint_id=payload.endpoint_id,
+        method=payload.method,
+        path=payload.path,
+        received_at=isoformat_z(row["received_at"]),
+        status_code=ACCEPTED_INGEST_STATUS,
+        ip=row["ip"] or "unknown",
+        headers=payload.headers,
+        content_type=prepared.content_type,
+        body_size_bytes=payload.body_size_bytes,
+        raw_body=body_text if body_text is not None else "",
+        body_is_binary=body_text is None,
+        parsed_json=prepared.parsed_json,
+        encoded_size_bytes=payload.encoded_size_bytes,
+    )
+
+
+async def capture_request(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    payload: CaptureRequestInput,
+    *,
+    body_storage: BodyStorage = DEFAULT_BODY_STORAGE,
+) -> WebhookRequestDTO:
+    prepared = _prepare_capture(payload, body_storage)
+    try:
+        row = await pool.fetchrow(queries["insert_request_if_active"], *prepared.params)
     except Exception as exc:  # pragma: no cover - exercised in integration
         raise ServiceUnavailableError("Database unavailable") from exc
 
     if row is None:
         raise NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
 
-    return _row_to_webhook_request(row)
+    return _captured_request(prepared, row)
 
 
-async def list_requests(
+async def capture_requests_batch(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    payloads: list[CaptureRequestInput],
+    *,
+    body_storage: BodyStorage = DEFAULT_BODY_STORAGE,
+) -> list[WebhookRequestDTO | None]:
+    """Insert many captured requests with one statement.
+
+    Results are aligned with ``payloads``; ``None`` marks a request whose endpoint
+    is missing or expired.
+    """
+    prepared = [_prepare_capture(payload, body_storage) for payload in payloads]
+    columns = [list(column) for column in zip(*(item.params for item in prepared), strict=True)]
+
+    try:
+        rows = await pool.fetch(queries["insert_requests_batch_if_active"], *columns)
+    except Exception as exc:  # pragma: no cover - exercised in integration
+        raise ServiceUnavailableError("Database unavailable") from exc
+
+    rows_by_id = {str(row["id"]): row for row in rows}
+    results: list[WebhookRequestDTO | None] = []
+    for item in prepared:
+        row = rows_by_id.get(item.request_id)
+        results.append(_captured_request(item, row) if row is not None else None)
+    return results
+
+
+async def _fetch_page_rows(
     pool: asyncpg.Pool,
     queries: dict[str, str],
+    query_name: str,
     endpoint_id: str,
     *,
-    limit: int,
+    fetch_limit: int,
     before: str | None,
-) -> ListRequestsResponse:
-    fetch_limit = limit + 1
-
+    extra_args: tuple[Any, ...] = (),
+) -> list[asyncpg.Record]:
     try:
         if before:
             before_received_at, before_request_id = decode_cursor(before)
-            rows = await pool.fetch(
-                queries["list_requests_page_before"],
+            return await pool.fetch(
+                queries[f"{query_name}_before"],
                 endpoint_id,
                 before_received_at,
                 before_request_id,
                 fetch_limit,
+                *extra_args,
             )
-        else:
-            rows = await pool.fetch(queries["list_requests_page"], endpoint_id, fetch_limit)
+        return await pool.fetch(queries[query_name], endpoint_id, fetch_limit, *extra_args)
     except ValueError:
         raise
     except Exception as exc:  # pragma: no cover - exercised in integration
         raise ServiceUnavailableError("Database unavailable") from exc
 
-    items = [_row_to_webhook_request(row) for row in rows[:limit]]
-    next_cursor: str | None = None
-    if len(rows) > limit and items:
-        last_visible = rows[limit - 1]
-        next_cursor = encode_cursor(last_visible["received_at"], last_visible["id"])
 
-    return ListRequestsResponse(items=items, next_cursor=next_cursor)
+def _next_cursor(rows: list[asyncpg.Record], limit: int) -> str | None:
+    if len(rows) <= limit:
+        return None
+    last_visible = rows[limit - 1]
+    return encode_cursor(last_visible["received_at"], str(last_visible["id"]))
+
+
+async def list_requests(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_id: str,
+    *,
+    limit: int,
+    before: str | None,
+    recent_requests: RecentRequestsCache | None = None,
+) -> ListRequestsResponse:
+    use_recent = recent_requests is not None and not before
+    if use_recent:
+        cached_page = recent_requests.first_page(endpoint_id, limit)
+        if cached_page is not None:
+            return cached_page
+        recent_requests.begin_seed(endpoint_id)
+
+    fetch_limit = limit + 1
+    rows = await _fetch_page_rows(
+        pool,
+        queries,
+        "list_requests_page",
+        endpoint_id,
+        fetch_limit=fetch_limit,
+        before=before,
+    )
+
+    requests = [_row_to_webhook_request(row) for row in rows]
+    if use_recent:
+        recent_requests.finish_seed(endpoint_id, requests, complete=len(rows) < fetch_limit)
+
+    return ListRequestsResponse(items=requests[:limit], next_cursor=_next_cursor(rows, limit))
+
+
+async def list_requests_json(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_id: str,
+    *,
+    limit: int,
+    before: str | None,
+) -> bytes | None:
+    """List page rendered by Postgres, semantically equivalent to ``ListRequestsResponse``.
+
+    The document parses to the same values but is not byte-identical: Postgres
+    puts spaces around ``:`` and ``,``, and a ``parsedJson`` rebuilt from the
+    raw body (``PERSIST_PARSED_JSON=false``) keeps the body's own number spelling
+    and any duplicate keys, where the model path re-serialises ``orjson.loads``.
+
+    Returns ``None`` when a row can only be rendered in Python (compressed or
+    binary bodies, or rows written before text detection); callers then fall
+    back to ``list_requests``.
+    """
+    rows = await _fetch_page_rows(
+        pool,
+        queries,
+        "list_requests_json_page",
+        endpoint_id,
+        fetch_limit=limit + 1,
+        before=before,
+    )
+    items = [row["item_json"] for row in rows[:limit]]
+    if any(item is None for item in items):
+        return None
+
+    return b"".join(
+        (
+            b'{"items":[',
+            ",".join(items).encode("utf-8"),
+            b'],"nextCursor":',
+            orjson.dumps(_next_cursor(rows, limit)),
+            b"}",
+        )
+    )
+
+
+def _summarize(request: WebhookRequestDTO, preview_chars: int) -> WebhookRequestSummaryDTO:
+    return WebhookRequestSummaryDTO(
+        id=request.id,
+        endpoint_id=request.endpoint_id,
+        method=request.method,
+        path=request.path,
+        received_at=request.received_at,
+        status_code=request.status_code,
+        ip=request.ip,
+        content_type=request.content_type,
+        body_size_bytes=request.body_size_bytes,
+        body_preview=request.raw_body[:preview_chars] if preview_chars > 0 else None,
+    )
+
+
+async def list_request_summaries(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_id: str,
+    *,
+    limit: int,
+    before: str | None,
+    preview_chars: int,
+    recent_requests: RecentRequestsCache | None = None,
+) -> ListRequestSummariesResponse:
+    """List page without headers or full bodies; only a body preview is loaded."""
+    if recent_requests is not None and not before:
+        cached_page = recent_requests.first_page(endpoint_id, limit)
+        if cached_page is not None:
+            return ListRequestSummariesResponse(
+                items=[_summarize(item, preview_chars) for item in cached_page.items],
+                next_cursor=cached_page.next_cursor,
+            )
+
+    rows = await _fetch_page_rows(
+        pool,
+        queries,
+        "list_request_summaries_page",
+        endpoint_id,
+        fetch_limit=limit + 1,
+        before=before,
+        extra_args=(preview_chars,),
+    )
+
+    items = [
+        WebhookRequestSummaryDTO(
+            id=str(row["id"]),
+            endpoint_id=row["endpoint_id"],
+            method=row["method"],
+            path=row["path"],
+            received_at=isoformat_z(row["received_at"]),
+            status_code=row["status_code"],
+            ip=row["ip"] or "unknown",
+            content_type=row["content_type"],
+            body_size_bytes=row["body_size_bytes"],
+            body_preview=_row_body_preview(row, preview_chars),
+        )
+        for row in rows[:limit]
+    ]
+    return ListRequestSummariesResponse(items=items, next_cursor=_next_cursor(rows, limit))
+
+
+async def list_requests_after(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_id: str,
+    *,
+    after: str,
+    limit: int,
+) -> list[WebhookRequestDTO]:
+    """Oldest-first requests newer than the ``after`` cursor, for SSE catch-up."""
+    after_received_at, after_request_id = decode_cursor(after)
+
+    try:
+        rows = await pool.fetch(
+            queries["list_requests_page_after"],
+            endpoint_id,
+            after_received_at,
+            after_request_id,
+            limit,
+        )
+    except Exception as exc:  # pragma: no cover - exercised in integration
+        raise ServiceUnavailableError("Database unavailable") from exc
+
+    return [_row_to_webhook_request(row) for row in rows]
 
 
 async def get_request(
@@ -162,3 +470,24 @@ async def get_request(
 
     return _row_to_webhook_request(row)
 
+
+async def get_request_json(
+    pool: asyncpg.Pool,
+    queries: dict[str, str],
+    endpoint_id: str,
+    request_id: str,
+) -> bytes | None:
+    """``get_request`` rendered by Postgres, as in ``list_requests_json``.
+
+    ``None`` means use the Python path.
+    """
+    try:
+        row = await pool.fetchrow(queries["get_request_json_for_endpoint"], endpoint_id, request_id)
+    except Exception as exc:  # pragma: no cover - exercised in integration
+        raise ServiceUnavailableError("Database unavailable") from exc
+
+    if row is None:
+        raise NotFoundError("Request not found", code="request_not_found")
+    if row["item_json"] is None:
+        return None
+    return row["item_json"].encode("utf-8")
@@ -1,58 +1,169 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Any
 
+from app.utils.sse import sse_event
+
 
 @dataclass(slots=True)
 class StreamMessage:
     event: str
     data: dict[str, Any]
+    frame: bytes
+    event_id: str | None = None
 
 
 @dataclass(slots=True)
 class StreamSubscriber:
     subscriber_id: int
     queue: asyncio.Queue[StreamMessage]
+    replay: list[StreamMessage] = field(default_factory=list)
+    replay_missed: bool = False
+
+
+@dataclass(slots=True)
+class _ReplayRing:
+    max_events: int
+    max_bytes: int
+    _messages: deque[StreamMessage] = field(default_factory=deque)
+    _bytes: int = 0
+
+    def append(self, message: StreamMessage) -> None:
+        self._messages.append(message)
+        self._bytes += len(message.frame)
+        while self._messages and (
+            len(self._messages) > self.max_events or self._bytes > self.max_bytes
+        ):
+            self._bytes -= len(self._messages.popleft().frame)
+
+    def after(self, event_id: str) -> list[StreamMessage] | None:
+        """Messages published after ``event_id``, or None if it has rolled out."""
+        for index in range(len(self._messages) - 1, -1, -1):
+            if self._messages[index].event_id == event_id:
+                return list(self._messages)[index + 1 :]
+        return None
 
 
 @dataclass(slots=True)
 class StreamHub:
+    """In-process pub/sub keyed by endpoint.
+
+    The registry is copy-on-write: each endpoint maps to an immutable tuple that
+    subscribe/unsubscribe replace wholesale. None of the methods await while
+    touching it, so publish reads the current tuple without a lock or a copy.
+
+    Endpoints that have had a subscriber keep a small replay ring of events that
+    carry an ``event_id`` so reconnecting clients can resume from
+    ``Last-Event-ID``. Rings are bounded per endpoint by count and bytes, and the
+    number of endpoints with a ring is bounded LRU-style.
+    """
+
     max_queue_size: int
-    _subscribers: dict[str, dict[int, StreamSubscriber]] = field(default_factory=dict)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    replay_buffer_size: int = 0
+    replay_buffer_bytes: int = 0
+    max_replay_endpoints: int = 0
+    _subscribers: dict[str, tuple[StreamSubscriber, ...]] = field(default_factory=dict)
+    _replay: OrderedDict[str, _ReplayRing] = field(default_factory=OrderedDict)
     _next_id: int = 1
 
-    async def subscribe(self, endpoint_id: str) -> StreamSubscriber:
-        async with self._lock:
-            subscriber_id = self._next_id
-            self._next_id += 1
-            subscriber = StreamSubscriber(
-                subscriber_id=subscriber_id,
-                queue=asyncio.Queue(maxsize=self.max_queue_size),
-            )
-            endpoint_subscribers = self._subscribers.setdefault(endpoint_id, {})
-            endpoint_subscribers[subscriber_id] = subscriber
-            return subscriber
+    async def subscribe(
+        self,
+        endpoint_id: str,
+        *,
+        last_event_id: str | None = None,
+    ) -> StreamSubscriber:
+        subscriber_id = self._next_id
+        self._next_id += 1
+        subscriber = StreamSubscriber(
+            subscriber_id=subscriber_id,
+            queue=asyncio.Queue(maxsize=self.max_queue_size),
+        )
+
+        # Taken in the same step as registration: everything in the ring was
+        # published before this subscriber, everything later lands in its queue.
+        ring = self._replay_ring(endpoint_id)
+        if last_event_id is not None:
+            replay = ring.after(last_event_id) if ring is not None else None
+            if replay is None:
+                subscriber.replay_missed = True
+            else:
+                subscriber.replay = replay
+
+        self._subscribers[endpoint_id] = (*self._subscribers.get(endpoint_id, ()), subscriber)
+        return subscriber
 
     async def unsubscribe(self, endpoint_id: str, subscriber_id: int) -> None:
-        async with self._lock:
-            endpoint_subscribers = self._subscribers.get(endpoint_id)
-            if not endpoint_subscribers:
-                return
-            endpoint_subscribers.pop(subscriber_id, None)
-            if not endpoint_subscribers:
-                self._subscribers.pop(endpoint_id, None)
-
-    async def publish(self, endpoint_id: str, event: str, data: dict[str, Any]) -> None:
-        async with self._lock:
-            endpoint_subscribers = list(self._subscribers.get(endpoint_id, {}).values())
+        endpoint_subscribers = self._subscribers.get(endpoint_id)
+        if not endpoint_subscribers:
+            return
+        remaining = tuple(
+            subscriber
+            for subscriber in endpoint_subscribers
+            if subscriber.subscriber_id != subscriber_id
+        )
+        if remaining:
+            self._subscribers[endpoint_id] = remaining
+        else:
+            self._subscribers.pop(endpoint_id, None)
+
+    def endpoint_ids(self) -> list[str]:
+        return list(self._subscribers)
+
+    def has_subscribers(self, endpoint_id: str) -> bool:
+        return endpoint_id in self._subscribers
+
+    def drop_replay(self, endpoint_id: str | None = None) -> None:
+        """Forget replay history for one endpoint, or all when ``endpoint_id`` is None."""
+        if endpoint_id is None:
+            self._replay.clear()
+        else:
+            self._replay.pop(endpoint_id, None)
+
+    def _replay_ring(self, endpoint_id: str) -> _ReplayRing | None:
+        if self.replay_buffer_size <= 0:
+            return None
 
+        ring = self._replay.get(endpoint_id)
+        if ring is None:
+            ring = _ReplayRing(
+                max_events=self.replay_buffer_size,
+                max_bytes=self.replay_buffer_bytes,
+            )
+            self._replay[endpoint_id] = ring
+            while len(self._replay) > self.max_replay_endpoints:
+                self._replay.popitem(last=False)
+        else:
+            self._replay.move_to_end(endpoint_id)
+        return ring
+
+    async def publish(
+        self,
+        endpoint_id: str,
+        event: str,
+        data: dict[str, Any],
+        *,
+        event_id: str | None = None,
+    ) -> None:
+        endpoint_subscribers = self._subscribers.get(endpoint_id)
+        ring = self._replay.get(endpoint_id) if event_id is not None else None
+        if not endpoint_subscribers and ring is None:
+            return
+
+        # Encoded once here and shared by every subscriber queue.
+        message = StreamMessage(
+            event=event,
+            data=data,
+            frame=sse_event(event, data, event_id=event_id),
+            event_id=event_id,
+        )
+        if ring is not None:
+            ring.append(message)
         if not endpoint_subscribers:
             return
 
-        message = StreamMessage(event=event, data=data)
         for subscriber in endpoint_subscribers:
             queue = subscriber.queue
             if queue.full():
@@ -68,6 +179,5 @@ class StreamHub:
                 continue
 
     async def close(self) -> None:
-        async with self._lock:
-            self._subscribers.clear()
-
+        self._subscribers.clear()
+        self._replay.clear()
@@ -3,14 +3,97 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 
 from app.core.errors import PayloadTooLargeError
+from app.utils.content_encoding import DecodedChunks, content_decoder
+
+
+def parse_content_length(value: str | None) -> int | None:
+    """The announced body size, or ``None`` when the header is missing or malformed."""
+    if value is None or not value.isascii() or not value.isdigit():
+        return None
+    return int(value)
 
 
 async def read_request_body_limited(
     chunks: AsyncIterator[bytes],
     max_bytes: int,
+    *,
+    content_length: int | None = None,
 ) -> bytes:
+    """Read a request body of at most ``max_bytes``.
+
+    With a ``content_length`` the request is rejected before anything is read
+    when the announced size is over the limit, and the chunks are copied into
+    one preallocated ``bytearray`` that is returned as is. A body that arrives
+    in a single chunk is returned without any copy. The header is only trusted
+    for sizing: a body that runs past it continues on the unsized path, and one
+    that stops short is truncated to what actually arrived.
+    """
+    if content_length is None:
+        return await _read_unsized(chunks, max_bytes)
+    if content_length > max_bytes:
+        raise PayloadTooLargeError()
+
+    whole: bytes | None = None
+    buffer: bytearray | None = None
     size = 0
-    parts: list[bytes] = []
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        end = size + len(chunk)
+        if end > content_length:
+            received = whole if buffer is None else bytes(buffer[:size])
+            parts = [received, chunk] if received else [chunk]
+            return await _read_unsized(chunks, max_bytes, parts=parts, size=end)
+        if size == 0 and end == content_length:
+            whole = chunk
+        else:
+            if buffer is None:
+                buffer = bytearray(content_length)
+            buffer[size:end] = chunk
+        size = end
+
+    if buffer is None:
+        return whole or b""
+    del buffer[size:]
+    return buffer
+
+
+async def read_request_body_decoded(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    *,
+    content_length: int | None = None,
+    content_encoding: str | None = None,
+) -> tuple[bytes, int | None]:
+    """Read a body, decompressing a supported ``Content-Encoding`` as it streams in.
+
+    Returns ``(body, encoded_size)``; ``encoded_size`` is ``None`` when the body
+    was not decoded. ``max_bytes`` applies to the encoded and the decoded size
+    alike, and the decoded size is checked as it grows, so a compression bomb
+    fails after at most ``max_bytes`` of output.
+    """
+    decoder = content_decoder(content_encoding)
+    if decoder is None:
+        body = await read_request_body_limited(chunks, max_bytes, content_length=content_length)
+        return body, None
+    if content_length is not None and content_length > max_bytes:
+        raise PayloadTooLargeError()
+
+    decoded = DecodedChunks(chunks, decoder, max_encoded_bytes=max_bytes)
+    body = await _read_unsized(decoded, max_bytes)
+    return body, decoded.encoded_size
+
+
+async def _read_unsized(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    *,
+    parts: list[bytes] | None = None,
+    size: int = 0,
+) -> bytes:
+    if size > max_bytes:
+        raise PayloadTooLargeError()
+    parts = parts if parts is not None else []
 
     async for chunk in chunks:
         if not chunk:
@@ -21,4 +104,3 @@ async def read_request_body_limited(
         parts.append(chunk)
 
     return b"".join(parts)
-
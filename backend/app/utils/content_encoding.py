@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import AsyncIterator, Iterator
+from typing import Protocol
+
+from app.core.errors import InvalidContentEncodingError, PayloadTooLargeError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Bounded-output decompression arrived in brotli 1.2; older releases cannot be used safely.
+if brotli is not None and not hasattr(brotli.Decompressor, "can_accept_more_data"):
+    brotli = None  # pragma: no cover
+
+_DECODE_ERRORS: tuple[type[Exception], ...] = (
+    (zlib.error,) if brotli is None else (zlib.error, brotli.error)
+)
+
+# Decoders emit at most this many bytes per step, so a tiny input cannot inflate into
+# a large allocation before the caller's size limit sees it.
+DECODE_STEP_BYTES = 65_536
+
+_GZIP_WBITS = 31
+_ZLIB_WBITS = 15
+_RAW_DEFLATE_WBITS = -15
+
+
+class ContentDecoder(Protocol):
+    def decode(self, data: bytes) -> Iterator[bytes]: ...
+
+    def finish(self) -> None: ...
+
+
+class _ZlibDecoder:
+    """gzip and deflate; gzip may be several concatenated members."""
+
+    def __init__(self, encoding: str) -> None:
+        self._encoding = encoding
+        self._decompressor: zlib._Decompress | None = None
+
+    def _new_decompressor(self, first_bytes: bytes) -> zlib._Decompress:
+        if self._encoding == "gzip":
+            return zlib.decompressobj(wbits=_GZIP_WBITS)
+        # "deflate" is meant to be zlib-wrapped, but raw deflate streams are common too.
+        wrapped = (
+            len(first_bytes) >= 2
+            and first_bytes[0] & 0x0F == 8
+            and int.from_bytes(first_bytes[:2], "big") % 31 == 0
+        )
+        return zlib.decompressobj(wbits=_ZLIB_WBITS if wrapped else _RAW_DEFLATE_WBITS)
+
+    def decode(self, data: bytes) -> Iterator[bytes]:
+        while data:
+            if self._decompressor is None:
+                self._decompressor = self._new_decompressor(data)
+            decompressor = self._decompressor
+            while True:
+                output = decompressor.decompress(data, DECODE_STEP_BYTES)
+                if output:
+                    yield output
+                data = decompressor.unconsumed_tail
+                if not data and len(output) < DECODE_STEP_BYTES:
+                    break
+            if not decompressor.eof:
+                return
+            data = decompressor.unused_data
+            if data and self._encoding != "gzip":
+                raise InvalidContentEncodingError()
+            self._decompressor = None
+
+    def finish(self) -> None:
+        # A member cut off before its end marker; a body with no bytes at all is just empty.
+        if self._decompressor is not None:
+            raise InvalidContentEncodingError()
+
+
+class _BrotliDecoder:
+    def __init__(self) -> None:
+        self._decompressor = brotli.Decompressor()
+        self._received = False
+
+    def decode(self, data: bytes) -> Iterator[bytes]:
+        self._received = True
+        output = self._decompressor.process(data, output_buffer_limit=DECODE_STEP_BYTES)
+        if output:
+            yield output
+        while not self._decompressor.can_accept_more_data():
+            output = self._decompressor.process(b"", output_buffer_limit=DECODE_STEP_BYTES)
+            if output:
+                yield output
+
+    def finish(self) -> None:
+        if self._received and not self._decompressor.is_finished():
+            raise InvalidContentEncodingError()
+
+
+def content_decoder(content_encoding: str | None) -> ContentDecoder | None:
+    """A decoder for a single supported ``Content-Encoding``, else ``None``.
+
+    Unknown, stacked or ``identity`` encodings return ``None`` and the body is
+    kept exactly as received.
+    """
+    if not content_encoding:
+        return None
+    encoding = content_encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return _ZlibDecoder("gzip")
+    if encoding == "deflate":
+        return _ZlibDecoder("deflate")
+    if encoding == "br" and brotli is not None:
+        return _BrotliDecoder()
+    return None
+
+
+class DecodedChunks:
+    """Decoded chunks of an encoded body stream, counting the encoded bytes read.
+
+    The encoded stream is held to ``max_encoded_bytes`` as well; the decoded
+    size is left to the reader consuming these chunks.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        decoder: ContentDecoder,
+        *,
+        max_encoded_bytes: int,
+    ) -> None:
+        self._chunks = chunks
+        self._decoder = decoder
+        self._max_encoded_bytes = max_encoded_bytes
+        self.encoded_size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._chunks:
+                if not chunk:
+                    continue
+                self.encoded_size += len(chunk)
+                if self.encoded_size > self._max_encoded_bytes:
+                    raise PayloadTooLargeError()
+                for output in self._decoder.decode(chunk):
+                    yield output
+            self._decoder.finish()
+        except _DECODE_ERRORS as exc:
+            raise InvalidContentEncodingError() from exc
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+import orjson
+
+from app.schemas.requests import WebhookRequestDTO
+from app.utils.time import isoformat_z
+
+
+def encode_cursor(received_at: datetime, request_id: str) -> str:
+    payload = {"receivedAt": isoformat_z(received_at), "id": request_id}
+    encoded = base64.urlsafe_b64encode(orjson.dumps(payload)).decode("ascii")
+    return encoded.rstrip("=")
+
+
+def cursor_for_request(request: WebhookRequestDTO) -> str:
+    """Keyset cursor of a captured request, also used as its SSE event id."""
+    return encode_cursor(datetime.fromisoformat(request.received_at), request.id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + padding)
+        payload = orjson.loads(decoded)
+        received_at = datetime.fromisoformat(str(payload["receivedAt"]).replace("Z", "+00:00"))
+        request_id = UUID(str(payload["id"]))
+        return received_at, request_id
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError("Invalid cursor") from exc
@@ -6,12 +6,36 @@ import string
 from app.core.constants import ENDPOINT_ID_LENGTH, ENDPOINT_ID_PATTERN
 
 _ALPHABET = string.ascii_lowercase + string.digits
+# Random bytes map onto the alphabet by remainder; the top bytes that would
+# favour its first characters are dropped instead.
+_USABLE_BYTES = 256 - 256 % len(_ALPHABET)
+_BYTE_TO_CHAR = bytes(ord(_ALPHABET[byte % len(_ALPHABET)]) for byte in range(256))
+_UNUSABLE_BYTES = bytes(range(_USABLE_BYTES, 256))
+
+
+def generate_endpoint_ids(count: int, length: int = ENDPOINT_ID_LENGTH) -> list[str]:
+    """``count`` random IDs drawn from a single random buffer.
+
+    IDs are distinct from each other but may still collide with stored ones.
+    """
+    ids: set[str] = set()
+    while len(ids) < count:
+        needed = (count - len(ids)) * length
+        # Enough for the ~2% of bytes that are dropped, with a little slack.
+        chars = secrets.token_bytes(needed + needed // 32 + 8).translate(
+            _BYTE_TO_CHAR, _UNUSABLE_BYTES
+        )
+        text = chars.decode("ascii")
+        for start in range(0, len(text) - length + 1, length):
+            ids.add(text[start : start + length])
+            if len(ids) == count:
+                break
+    return list(ids)
 
 
 def generate_endpoint_id(length: int = ENDPOINT_ID_LENGTH) -> str:
-    return "".join(secrets.choice(_ALPHABET) for _ in range(length))
+    return generate_endpoint_ids(1, length)[0]
 
 
 def is_valid_endpoint_id(value: str) -> bool:
     return bool(ENDPOINT_ID_PATTERN.fullmatch(value))
-
@@ -5,7 +5,7 @@ from typing import Any
 import orjson
 
 
-def parse_json_if_applicable(content_type: str, raw_body: str) -> Any | None:
+def parse_json_if_applicable(content_type: str, raw_body: str | bytes) -> Any | None:
     if "json" not in content_type.lower():
         return None
     try:
@@ -13,3 +13,4 @@ def parse_json_if_applicable(content_type: str, raw_body: str) -> Any | None:
     except orjson.JSONDecodeError:
         return None
 
+
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from app.core.errors import PayloadTooLargeError
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    """Split a byte stream on ``\\n``, holding at most one partial line in memory.
+
+    Every line is yielded, blank ones included, so callers can number them.
+    """
+    partial: list[bytes] = []
+    partial_size = 0
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line = chunk[start:end]
+            if partial:
+                partial.append(line)
+                line = b"".join(partial)
+                partial = []
+                partial_size = 0
+            if len(line) > max_line_bytes:
+                raise PayloadTooLargeError("Import line too large")
+            yield line
+            start = end + 1
+        if start < len(chunk):
+            partial_size += len(chunk) - start
+            if partial_size > max_line_bytes:
+                raise PayloadTooLargeError("Import line too large")
+            partial.append(chunk[start:])
+    if partial:
+        yield b"".join(partial)
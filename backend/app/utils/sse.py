@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def sse_event(event: str, data: dict[str, Any], *, event_id: str | None = None) -> bytes:
+    id_line = b"id: " + event_id.encode("utf-8") + b"\n" if event_id is not None else b""
+    return (
+        id_line + b"event: " + event.encode("utf-8") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+    )
+
+
+def sse_comment(text: str) -> bytes:
+    return f": {text}\n\n".encode()
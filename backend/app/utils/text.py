@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+
+def decode_utf8(data: bytes) -> str | None:
+    """Text rendering of a body, or ``None`` when it is not valid UTF-8."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def decode_utf8_prefix(data: bytes) -> str | None:
+    """Like ``decode_utf8`` for a truncated prefix, whose last character may be cut."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        if exc.reason != "unexpected end of data":
+            return None
+        return data[: exc.start].decode("utf-8")
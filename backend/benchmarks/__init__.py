@@ -0,0 +1 @@
+"""Benchmark scripts (run manually, not part of the test suite)."""
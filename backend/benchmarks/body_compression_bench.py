@@ -0,0 +1,67 @@
+"""Trade stored body bytes against encode/decode latency for BODY_COMPRESSION.
+
+Bodies are synthetic webhook JSON (repetitive keys, varying values). Encode
+time is what ingest pays per request; decode time is paid by every read that
+returns the full body.
+
+    uv run python -m benchmarks.body_compression_bench --rounds 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import orjson
+
+from app.services.body_storage import BodyStorage, decode_body
+
+
+def _body(size_bytes: int) -> bytes:
+    events = []
+    index = 0
+    while sum(len(event) for event in events) < size_bytes:
+        events.append(
+            orjson.dumps(
+                {
+                    "id": f"evt_{index:08d}",
+                    "type": "invoice.payment_succeeded",
+                    "data": {"amount": index * 137 % 100_000, "currency": "usd", "paid": True},
+                }
+            )
+        )
+        index += 1
+    return b"[" + b",".join(events) + b"]"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    header = ("body", "level", "stored", "ratio", "encode ms", "decode ms")
+    print("{:>9} {:>5} {:>9} {:>6} {:>10} {:>10}".format(*header))
+    for size in (1_024, 16_384, 262_144, 1_048_576):
+        body = _body(size)
+        body_size = len(body)
+        for level in (1, 6, 9):
+            storage = BodyStorage(compression="gzip", min_bytes=1, level=level)
+
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                encoding, stored = storage.encode(body)
+            encode_ms = (time.perf_counter() - started) / args.rounds * 1000
+
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                decode_body(encoding, stored)
+            decode_ms = (time.perf_counter() - started) / args.rounds * 1000
+
+            print(
+                f"{body_size:>9} {level:>5} {len(stored):>9} {body_size / len(stored):>6.1f} "
+                f"{encode_ms:>10.3f} {decode_ms:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
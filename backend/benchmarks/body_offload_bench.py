@@ -0,0 +1,134 @@
+"""Event-loop lag while large JSON bodies are ingested, with and without offloading.
+
+Each mode ingests the same JSON bodies through ``ingest_service.ingest_request``
+with a few requests in flight. The database is simulated: the jsonb parameters
+are encoded as asyncpg would and the round trip is a short sleep. Every capture
+is rendered as an SSE frame, as a stream subscriber would get it. A timer that
+should fire every millisecond measures how late the loop runs it.
+
+    uv run python -m benchmarks.body_offload_bench --size 1048576 --requests 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import orjson
+
+from app.db.codecs import _encode_jsonb
+from app.services import ingest_service, request_service
+from app.services.body_offload import BodyOffload
+from app.services.endpoint_filter import EndpointFilter
+from app.services.loop_lag import LoopLagMonitor, run_loop_lag_monitor
+from app.utils.sse import sse_event
+
+
+class _SimulatedPool:
+    async def fetchrow(self, _query: str, *params: object) -> dict[str, object]:
+        _encode_jsonb(params[7])
+        if params[10] is not None:
+            _encode_jsonb(params[10])
+        await asyncio.sleep(0.002)
+        return {"received_at": datetime.now(UTC), "ip": params[6]}
+
+
+class _FrameHub:
+    async def publish(self, endpoint_id, event, data, *, event_id=None):
+        sse_event(event, data, event_id=event_id)
+
+
+def _body(size_bytes: int) -> bytes:
+    items = [{"sku": f"sku-{index}", "qty": index % 7, "price": index * 1.25} for index in range(8)]
+    while len(orjson.dumps(items)) < size_bytes:
+        items.extend(items)
+    return orjson.dumps({"type": "order.created", "items": items})
+
+
+def _payload(body: bytes) -> request_service.CaptureRequestInput:
+    return request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+async def _run(body: bytes, requests: int, concurrency: int, offload: BodyOffload | None):
+    pool = _SimulatedPool()
+    hub = _FrameHub()
+    endpoint_filter = EndpointFilter(negative_ttl_seconds=30, max_negative_entries=16)
+    if offload is not None:
+        # Start the workers before measuring.
+        await asyncio.gather(
+            *(
+                offload.analyze("text/plain", body, request_service.DEFAULT_BODY_STORAGE)
+                for _ in range(concurrency)
+            )
+        )
+
+    monitor = LoopLagMonitor(interval_seconds=0.001, window=100_000)
+    monitor_task = asyncio.create_task(run_loop_lag_monitor(monitor))
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            await ingest_service.ingest_request(
+                pool,
+                {"insert_request_if_active": "-- insert"},
+                _payload(body),
+                stream_hub=hub,
+                endpoint_filter=endpoint_filter,
+                body_offload=offload,
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    monitor_task.cancel()
+    try:
+        await monitor_task
+    except asyncio.CancelledError:
+        pass
+    return monitor.stats(), elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_048_576)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    body = _body(args.size)
+    print(f"body {len(body)} bytes, {args.requests} requests, {args.concurrency} in flight")
+    print(f"{'mode':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    executors = {
+        "inline": None,
+        "thread": ThreadPoolExecutor(max_workers=args.workers),
+        "process": ProcessPoolExecutor(
+            max_workers=args.workers, mp_context=multiprocessing.get_context("spawn")
+        ),
+    }
+    for mode, executor in executors.items():
+        offload = BodyOffload(min_bytes=1, executor=executor) if executor is not None else None
+        stats, elapsed = await _run(body, args.requests, args.concurrency, offload)
+        if offload is not None:
+            offload.close()
+        print(
+            f"{mode:>8} {args.requests / elapsed:>8.1f} {stats['p50Ms']:>8.2f} "
+            f"{stats['p99Ms']:>8.2f} {stats['maxMs']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""Compare the list-and-join body reader with the Content-Length sized reader.
+
+Bodies arrive in 64 KiB chunks, the size uvicorn reads from the socket. For
+each body size the script reports the peak memory allocated while reading,
+as measured by tracemalloc, and the time per body.
+
+    uv run python -m benchmarks.body_reader_bench --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from app.utils.body_reader import read_request_body_limited
+
+CHUNK_BYTES = 65_536
+MAX_BODY_BYTES = 16 * 1_048_576
+
+
+async def _join_reader(chunks: AsyncIterator[bytes], _content_length: int) -> bytes:
+    # The reader as it was before the Content-Length fast path.
+    size = 0
+    parts: list[bytes] = []
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise ValueError("too large")
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+async def _sized_reader(chunks: AsyncIterator[bytes], content_length: int) -> bytes:
+    return await read_request_body_limited(chunks, MAX_BODY_BYTES, content_length=content_length)
+
+
+async def _chunks(size: int) -> AsyncIterator[bytes]:
+    # Fresh chunk objects each time, as a server would hand them over.
+    for offset in range(0, size, CHUNK_BYTES):
+        yield bytes(min(CHUNK_BYTES, size - offset))
+
+
+async def _peak_bytes(reader, size: int) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    body = await reader(_chunks(size), size)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    assert len(body) == size
+    return peak
+
+
+async def _seconds_per_body(reader, size: int, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await reader(_chunks(size), size)
+    return (time.perf_counter() - started) / rounds
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'body':>9} {'reader':>7} {'peak KiB':>10} {'ms/body':>9}")
+    for size in (1_024, 65_536, 262_144, 1_048_576, 8_388_608):
+        for label, reader in (("join", _join_reader), ("sized", _sized_reader)):
+            peak = await _peak_bytes(reader, size)
+            elapsed = await _seconds_per_body(reader, size, args.rounds)
+            print(f"{size:>9} {label:>7} {peak / 1024:>10.1f} {elapsed * 1000:>9.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Cost of mapping the insert result back to a WebhookRequestDTO per body size.
+
+"full row" is the previous shape: the insert returned headers, body and parsed
+JSON, which were decoded again. "input" builds the DTO from the in-memory
+capture plus the server-generated columns. Wire savings are not included here;
+they equal the returned body, headers and JSONB text per request.
+
+    uv run python -m benchmarks.capture_return_bench --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import orjson
+
+from app.db.codecs import _decode_jsonb, _encode_jsonb
+from app.services import request_service
+from app.services.body_storage import BodyStorage
+
+
+def _payload(size_bytes: int) -> request_service.CaptureRequestInput:
+    body = orjson.dumps({"type": "bench", "blob": "x" * size_bytes})
+    return request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json", "user-agent": "bench"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+def _measure(build: Callable[[], object], rounds: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        build()
+    elapsed_ms = (time.perf_counter() - started) / rounds * 1000
+
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def _read_full_row(row: dict[str, object], headers_json: bytes, parsed_json: bytes | None):
+    # The driver decodes the returned jsonb columns before the row is mapped.
+    row["headers_json"] = _decode_jsonb(headers_json)
+    row["parsed_json"] = _decode_jsonb(parsed_json) if parsed_json is not None else None
+    return request_service._row_to_webhook_request(row)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    header = ("body", "path", "ms", "peak alloc")
+    print("{:>9} {:>9} {:>9} {:>11}".format(*header))
+    for size in (1_024, 65_536, 1_048_576):
+        payload = _payload(size)
+        prepared = request_service._prepare_capture(payload, BodyStorage())
+        params = prepared.params
+        received_at = datetime.now(UTC)
+        full_row = {
+            "id": prepared.request_id,
+            "endpoint_id": payload.endpoint_id,
+            "received_at": received_at,
+            "method": payload.method,
+            "path": payload.path,
+            "status_code": 202,
+            "ip": payload.ip,
+            "headers_json": params[7],
+            "content_type": prepared.content_type,
+            "body_size_bytes": payload.body_size_bytes,
+            "raw_body": None,
+            "parsed_json": params[10],
+            "body_encoding": params[11],
+            # The driver hands back a fresh copy of the returned column.
+            "body_bytes": bytes(bytearray(params[12])),
+            "body_is_json": params[13],
+            "encoded_size_bytes": params[15],
+        }
+        server_row = {"received_at": received_at, "ip": payload.ip}
+        headers_json = _encode_jsonb(params[7])
+        parsed_json = _encode_jsonb(params[10]) if params[10] is not None else None
+
+        for label, build in (
+            (
+                "full row",
+                lambda row=full_row, headers=headers_json, parsed=parsed_json: _read_full_row(
+                    row, headers, parsed
+                ),
+            ),
+            (
+                "input",
+                lambda item=prepared, row=server_row: request_service._captured_request(item, row),
+            ),
+        ):
+            elapsed_ms, peak = _measure(build, args.rounds)
+            print(f"{payload.body_size_bytes:>9} {label:>9} {elapsed_ms:>9.3f} {peak:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare creating endpoints one by one with the batch endpoint service.
+
+Usage (against a disposable database):
+
+    DATABASE_URL=postgresql://... uv run python -m benchmarks.endpoint_batch_bench --endpoints 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from app.core.config import get_settings
+from app.core.constants import MAX_ENDPOINT_BATCH_SIZE
+from app.db.pool import bootstrap_database, close_pool, create_pool, load_queries
+from app.services import endpoint_service
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoints", type=int, default=5000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    queries = load_queries()
+    await bootstrap_database(settings)
+    pool = await create_pool(settings, queries=queries)
+    try:
+        base_url = settings.public_base_url
+        ttl_seconds = settings.endpoint_ttl_seconds
+
+        started = time.perf_counter()
+        for _ in range(args.endpoints):
+            await endpoint_service.create_endpoint(pool, queries, base_url, ttl_seconds)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for offset in range(0, args.endpoints, MAX_ENDPOINT_BATCH_SIZE):
+            count = min(MAX_ENDPOINT_BATCH_SIZE, args.endpoints - offset)
+            await endpoint_service.create_endpoints(pool, queries, base_url, ttl_seconds, count)
+        batch = time.perf_counter() - started
+
+        for label, elapsed in (("one by one", single), ("batch", batch)):
+            print(f"{label:>10}: {args.endpoints / elapsed:10.0f} endpoints/s ({elapsed:.2f}s)")
+    finally:
+        await close_pool(pool)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""Compare /hook throughput through the FastAPI route and the raw ASGI fast path.
+
+Requests are driven straight into the ASGI app, with no server or sockets in
+between, and storage is replaced by an in-memory capture. What is left is the
+per-request cost of routing, dependency resolution, body reading and response
+serialization, which is what the fast path removes.
+
+    uv run python -m benchmarks.ingest_fast_path_bench --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import orjson
+
+from app.core.config import get_settings
+from app.main import create_app
+from app.schemas.requests import WebhookRequestDTO
+from app.services import request_service
+from app.services.body_storage import BodyStorage
+from app.services.endpoint_cache import EndpointCache
+from app.services.endpoint_filter import EndpointFilter
+from app.services.stream_hub import StreamHub
+
+BODY = orjson.dumps({"type": "invoice.paid", "data": {"id": "in_123", "amount": 4200}})
+HEADERS = [
+    (b"host", b"localhost:8000"),
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(BODY)).encode()),
+    (b"user-agent", b"bench"),
+]
+
+
+async def _memory_capture(_pool, _queries, payload, **_kwargs) -> WebhookRequestDTO:
+    return WebhookRequestDTO(
+        id="00000000-0000-0000-0000-000000000001",
+        endpoint_id=payload.endpoint_id,
+        method=payload.method,
+        path=payload.path,
+        received_at="2026-02-25T00:00:00Z",
+        status_code=202,
+        ip=payload.ip,
+        headers=payload.headers,
+        content_type="application/json",
+        body_size_bytes=payload.body_size_bytes,
+        raw_body="",
+    )
+
+
+def _build_app(*, fast_path: bool):
+    settings = get_settings().model_copy(
+        update={"ingest_fast_path_enabled": fast_path, "cors_allow_origins": []}
+    )
+    app = create_app(use_lifespan=False, settings=settings)
+    app.state.db_pool = None
+    app.state.stream_hub = StreamHub(max_queue_size=8)
+    app.state.body_storage = BodyStorage()
+    app.state.ingest_writer = None
+    app.state.recent_requests = None
+    app.state.endpoint_cache = EndpointCache(max_entries=16)
+    app.state.endpoint_filter = EndpointFilter(negative_ttl_seconds=30, max_negative_entries=16)
+    return app
+
+
+async def _drive(app, total: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/hook/abc123def4",
+        "raw_path": b"/hook/abc123def4",
+        "query_string": b"",
+        "root_path": "",
+        "headers": HEADERS,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    statuses: list[int] = []
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": BODY, "more_body": False}
+
+    async def send(message: dict[str, object]) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    started = time.perf_counter()
+    for _ in range(total):
+        await app(dict(scope), receive, send)
+    elapsed = time.perf_counter() - started
+    assert set(statuses) == {202}, set(statuses)
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    request_service.capture_request = _memory_capture
+    for label, fast_path in (("route", False), ("fast path", True)):
+        app = _build_app(fast_path=fast_path)
+        await _drive(app, 200)
+        elapsed = await _drive(app, args.requests)
+        print(
+            f"{label:>10}: {args.requests / elapsed:10.0f} req/s "
+            f"({elapsed / args.requests * 1e6:.1f} us/request)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Compare single-row ingest inserts with the group-commit ingest writer.
+
+Usage (against a disposable database):
+
+    DATABASE_URL=postgresql://... uv run python -m benchmarks.ingest_writer_bench --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from app.core.config import get_settings
+from app.db.pool import bootstrap_schema, close_pool, create_pool, load_queries
+from app.services import endpoint_service, request_service
+from app.services.ingest_writer import IngestWriter
+
+
+def _payload(endpoint_id: str, index: int) -> request_service.CaptureRequestInput:
+    body = f'{{"event":"bench","n":{index}}}'.encode()
+    return request_service.CaptureRequestInput(
+        endpoint_id=endpoint_id,
+        method="POST",
+        path=f"/hook/{endpoint_id}",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json", "user-agent": "bench"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+async def _run(capture, endpoint_id: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            await capture(_payload(endpoint_id, index))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(total)))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    queries = load_queries()
+    pool = await create_pool(settings)
+    try:
+        await bootstrap_schema(pool)
+        endpoint = await endpoint_service.create_endpoint(
+            pool, queries, settings.public_base_url, settings.endpoint_ttl_seconds
+        )
+
+        async def single_row(payload: request_service.CaptureRequestInput) -> None:
+            await request_service.capture_request(pool, queries, payload)
+
+        writer = IngestWriter(
+            pool=pool,
+            queries=queries,
+            max_batch_size=settings.ingest_batch_max_size,
+            max_linger_seconds=settings.ingest_batch_max_linger_ms / 1000,
+            max_in_flight=settings.ingest_batch_max_in_flight,
+        )
+
+        for label, capture in (("single-row", single_row), ("group-commit", writer.submit)):
+            elapsed = await _run(capture, endpoint.endpoint_id, args.requests, args.concurrency)
+            print(f"{label:>12}: {args.requests / elapsed:10.0f} req/s ({elapsed:.2f}s)")
+
+        await writer.close()
+    finally:
+        await close_pool(pool)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
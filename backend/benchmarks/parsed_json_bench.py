@@ -0,0 +1,97 @@
+"""Compare eager (PERSIST_PARSED_JSON=true) and lazy parsed_json handling.
+
+Write cost is the per-request work to build insert parameters plus the bytes
+sent for the body and the JSONB copy; read cost is mapping a stored row back to
+the API model, which in lazy mode parses the body itself.
+
+    uv run python -m benchmarks.parsed_json_bench --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import UTC, datetime
+
+import orjson
+
+from app.db.codecs import _decode_jsonb, _encode_jsonb
+from app.services import request_service
+from app.services.body_storage import BodyStorage
+
+
+def _payload(size_bytes: int) -> request_service.CaptureRequestInput:
+    items = [{"sku": f"sku-{index}", "qty": index % 7, "price": index * 1.25} for index in range(8)]
+    while len(orjson.dumps(items)) < size_bytes:
+        items.extend(items)
+    body = orjson.dumps({"type": "order.created", "items": items})
+    return request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+def _row(params: tuple[object, ...]) -> dict[str, object]:
+    # Mirrors the RETURNING/SELECT columns for the parameters that were written.
+    return {
+        "id": params[1],
+        "endpoint_id": params[0],
+        "received_at": datetime.now(UTC),
+        "method": params[2],
+        "path": params[3],
+        "status_code": params[5],
+        "ip": params[6],
+        "headers_json": params[7],
+        "content_type": params[8],
+        "body_size_bytes": params[9],
+        "raw_body": None,
+        "parsed_json": params[10],
+        "body_encoding": params[11],
+        "body_bytes": params[12],
+        "body_is_json": params[13],
+        "encoded_size_bytes": params[15],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    header = ("body", "mode", "bytes written", "write ms", "read ms")
+    print("{:>9} {:>6} {:>14} {:>9} {:>9}".format(*header))
+    for size in (1_024, 65_536, 1_048_576):
+        payload = _payload(size)
+        for mode, storage in (
+            ("eager", BodyStorage(persist_parsed_json=True)),
+            ("lazy", BodyStorage(persist_parsed_json=False)),
+        ):
+            # The jsonb codec serializes and parses parsed_json on the wire, so it is timed too.
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                params = request_service._prepare_capture(payload, storage).params
+                stored_json = _encode_jsonb(params[10]) if params[10] is not None else None
+            write_ms = (time.perf_counter() - started) / args.rounds * 1000
+
+            row = _row(params)
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                row["parsed_json"] = _decode_jsonb(stored_json) if stored_json else None
+                request_service._row_to_webhook_request(row)
+            read_ms = (time.perf_counter() - started) / args.rounds * 1000
+
+            written = len(params[12]) + len(stored_json or b"")
+            print(
+                f"{payload.body_size_bytes:>9} {mode:>6} {written:>14} "
+                f"{write_ms:>9.3f} {read_ms:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""First-use latency of the request read queries on freshly opened connections.
+
+"cold" is a new connection running a query for the first time (parse and plan
+on the request path); "prepared" is a new connection whose init hook already
+prepared every named query, as pools created by ``create_pool`` now do.
+
+    DATABASE_URL=postgresql://... uv run python -m benchmarks.prepared_queries_bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import asyncpg
+
+from app.core.config import get_settings
+from app.db.pool import bootstrap_schema, close_pool, create_pool, load_queries, prepare_queries
+from app.services import endpoint_service
+
+_NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+async def _first_query_ms(dsn: str, queries: dict[str, str], endpoint_id: str, prepared: bool):
+    conn = await asyncpg.connect(dsn)
+    try:
+        if prepared:
+            await prepare_queries(conn, queries)
+        started = time.perf_counter()
+        await conn.fetch(queries["list_requests_page"], endpoint_id, 51)
+        await conn.fetchrow(queries["get_request_for_endpoint"], endpoint_id, _NIL_UUID)
+        return (time.perf_counter() - started) * 1000
+    finally:
+        await conn.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=50)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    queries = load_queries()
+    pool = await create_pool(settings)
+    try:
+        await bootstrap_schema(pool)
+        endpoint = await endpoint_service.create_endpoint(
+            pool, queries, settings.public_base_url, settings.endpoint_ttl_seconds
+        )
+    finally:
+        await close_pool(pool)
+
+    for label, prepared in (("cold", False), ("prepared", True)):
+        samples = [
+            await _first_query_ms(settings.database_url, queries, endpoint.endpoint_id, prepared)
+            for _ in range(args.connections)
+        ]
+        p99 = statistics.quantiles(samples, n=100)[98]
+        print(f"{label:>9}: p50 {statistics.median(samples):6.2f} ms  p99 {p99:6.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""Fetch-and-decode time of a 100-row request page: text casts vs native codecs.
+
+"text casts" is the previous shape: the query cast ``id``, ``headers_json``,
+``parsed_json`` and ``client_ip`` to text and the service parsed the JSON
+strings with orjson. "codecs" runs the current ``list_requests_page`` on a pool
+with ``register_codecs``, which reads jsonb in binary straight into objects.
+
+    DATABASE_URL=postgresql://... uv run python -m benchmarks.row_decode_bench --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import asyncpg
+import orjson
+
+from app.core.config import get_settings
+from app.db.codecs import register_codecs
+from app.db.pool import bootstrap_schema, load_queries
+from app.services import endpoint_service, request_service
+
+PAGE_SIZE = 100
+
+_TEXT_CAST_PAGE_QUERY = """
+SELECT
+  id::text AS id,
+  received_at,
+  COALESCE(host(client_ip), '') AS ip,
+  headers_json::text AS headers_json_text,
+  parsed_json::text AS parsed_json_text
+FROM webhook_requests
+WHERE endpoint_id = $1
+ORDER BY received_at DESC, id DESC
+LIMIT $2
+"""
+
+_CODEC_PAGE_QUERY = """
+SELECT id, received_at, client_ip AS ip, headers_json, parsed_json
+FROM webhook_requests
+WHERE endpoint_id = $1
+ORDER BY received_at DESC, id DESC
+LIMIT $2
+"""
+
+
+def _payload(endpoint_id: str, index: int) -> request_service.CaptureRequestInput:
+    lines = [{"sku": f"sku-{line}", "qty": line} for line in range(20)]
+    body = orjson.dumps({"type": "invoice.paid", "n": index, "lines": lines})
+    return request_service.CaptureRequestInput(
+        endpoint_id=endpoint_id,
+        method="POST",
+        path=f"/hook/{endpoint_id}",
+        query_string=None,
+        ip="203.0.113.7",
+        headers={
+            "content-type": "application/json",
+            "user-agent": "bench",
+            "x-signature": "t=1700000000,v1=" + "ab" * 32,
+        },
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+async def _decode_text_casts(conn: asyncpg.Connection, endpoint_id: str) -> None:
+    for row in await conn.fetch(_TEXT_CAST_PAGE_QUERY, endpoint_id, PAGE_SIZE):
+        orjson.loads(row["headers_json_text"])
+        if row["parsed_json_text"] is not None:
+            orjson.loads(row["parsed_json_text"])
+        row["id"], row["ip"]
+
+
+async def _decode_codecs(conn: asyncpg.Connection, endpoint_id: str) -> None:
+    for row in await conn.fetch(_CODEC_PAGE_QUERY, endpoint_id, PAGE_SIZE):
+        row["headers_json"], row["parsed_json"], str(row["id"]), row["ip"]
+
+
+async def _time_page(decode, conn: asyncpg.Connection, endpoint_id: str, rounds: int) -> float:
+    await decode(conn, endpoint_id)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await decode(conn, endpoint_id)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    queries = load_queries()
+    plain = await asyncpg.connect(settings.database_url)
+    with_codecs = await asyncpg.connect(settings.database_url)
+    await register_codecs(with_codecs)
+    pool = await asyncpg.create_pool(settings.database_url, init=register_codecs)
+    try:
+        await bootstrap_schema(pool)
+        endpoint = await endpoint_service.create_endpoint(
+            pool, queries, settings.public_base_url, settings.endpoint_ttl_seconds
+        )
+        await request_service.capture_requests_batch(
+            pool, queries, [_payload(endpoint.endpoint_id, index) for index in range(PAGE_SIZE)]
+        )
+
+        for label, decode, conn in (
+            ("text casts", _decode_text_casts, plain),
+            ("codecs", _decode_codecs, with_codecs),
+        ):
+            elapsed_ms = await _time_page(decode, conn, endpoint.endpoint_id, args.rounds)
+            print(f"{label:>10}: {elapsed_ms:7.3f} ms per {PAGE_SIZE}-row page")
+    finally:
+        await plain.close()
+        await with_codecs.close()
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
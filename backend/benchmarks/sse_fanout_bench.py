@@ -0,0 +1,59 @@
+"""Measure SSE fan-out cost per publish as the subscriber count grows.
+
+Compares encoding the event once per subscriber (the previous behaviour) with
+the shared pre-encoded frame carried by ``StreamHub.publish``.
+
+    uv run python -m benchmarks.sse_fanout_bench --body-bytes 1048576
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from app.services.stream_hub import StreamHub
+from app.utils.sse import sse_event
+
+ENDPOINT_ID = "abc123def4"
+
+
+async def _fan_out(
+    subscribers: int,
+    data: dict[str, object],
+    rounds: int,
+    *,
+    per_subscriber: bool,
+) -> float:
+    hub = StreamHub(max_queue_size=rounds + 1)
+    queues = [(await hub.subscribe(ENDPOINT_ID)).queue for _ in range(subscribers)]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await hub.publish(ENDPOINT_ID, "request.created", data)
+        for queue in queues:
+            message = queue.get_nowait()
+            if per_subscriber:
+                sse_event(message.event, message.data)
+    elapsed = time.perf_counter() - started
+
+    await hub.close()
+    return elapsed / rounds
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--body-bytes", type=int, default=65_536)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    data = {"request": {"id": "req_1", "rawBody": "x" * args.body_bytes, "headers": {"a": "b"}}}
+    print(f"{'subscribers':>11} {'per-subscriber ms':>18} {'shared frame ms':>16}")
+    for subscribers in (1, 10, 50, 200):
+        legacy = await _fan_out(subscribers, data, args.rounds, per_subscriber=True)
+        shared = await _fan_out(subscribers, data, args.rounds, per_subscriber=False)
+        print(f"{subscribers:>11} {legacy * 1000:>18.3f} {shared * 1000:>16.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
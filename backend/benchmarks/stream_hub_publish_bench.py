@@ -0,0 +1,66 @@
+"""Measure StreamHub.publish latency while other endpoints churn subscriptions.
+
+Simulates SSE connect/disconnect storms on many endpoints while one hot endpoint
+keeps publishing, and reports publish latency percentiles.
+
+    uv run python -m benchmarks.stream_hub_publish_bench --churn-tasks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.services.stream_hub import StreamHub
+
+HOT_ENDPOINT = "hotendpoint1"
+
+
+async def _churn(hub: StreamHub, endpoint_id: str, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        subscriber = await hub.subscribe(endpoint_id)
+        await asyncio.sleep(0)
+        await hub.unsubscribe(endpoint_id, subscriber.subscriber_id)
+
+
+async def _measure(churn_tasks: int, publishes: int, viewers: int) -> list[float]:
+    hub = StreamHub(max_queue_size=16)
+    for _ in range(viewers):
+        await hub.subscribe(HOT_ENDPOINT)
+
+    stop = asyncio.Event()
+    churners = [
+        asyncio.create_task(_churn(hub, f"churn{index:07d}", stop)) for index in range(churn_tasks)
+    ]
+    data = {"request": {"id": "req_1", "rawBody": "{}"}}
+
+    samples: list[float] = []
+    for _ in range(publishes):
+        started = time.perf_counter()
+        await hub.publish(HOT_ENDPOINT, "request.created", data)
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(0)
+
+    stop.set()
+    await asyncio.gather(*churners)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--churn-tasks", type=int, default=200)
+    parser.add_argument("--publishes", type=int, default=5000)
+    parser.add_argument("--viewers", type=int, default=20)
+    args = parser.parse_args()
+
+    for churn_tasks in (0, args.churn_tasks):
+        samples = sorted(await _measure(churn_tasks, args.publishes, args.viewers))
+        p50 = statistics.median(samples) * 1e6
+        p99 = samples[int(len(samples) * 0.99)] * 1e6
+        print(f"churn tasks={churn_tasks:>5}: publish p50={p50:7.1f}us p99={p99:7.1f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
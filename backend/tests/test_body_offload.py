@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from app.db.codecs import _encode_jsonb
+from app.services import ingest_service, request_service
+from app.services.body_offload import BodyOffload, analyze_body
+from app.services.body_storage import BodyStorage
+from app.services.endpoint_filter import EndpointFilter
+from app.services.loop_lag import LoopLagMonitor, run_loop_lag_monitor
+from app.services.recent_requests import RecentRequestsCache
+
+BODY = orjson.dumps({"event": "build.finished", "steps": [{"n": n} for n in range(2_000)]})
+QUERIES = {"insert_request_if_active": "-- insert"}
+
+
+class ReturningPool:
+    def __init__(self) -> None:
+        self.params: tuple[object, ...] = ()
+
+    async def fetchrow(self, _query: str, *params: object) -> dict[str, object]:
+        self.params = params
+        return {"received_at": datetime(2026, 2, 25, tzinfo=UTC), "ip": "10.0.0.1"}
+
+
+class SpyHub:
+    def __init__(self) -> None:
+        self.published: list[dict[str, object]] = []
+
+    async def publish(self, endpoint_id, event, data, *, event_id=None):
+        self.published.append(data)
+
+
+def _payload(body: bytes = BODY) -> request_service.CaptureRequestInput:
+    return request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string=None,
+        ip="10.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+async def _ingest(body_offload: BodyOffload | None, **options):
+    pool = ReturningPool()
+    hub = SpyHub()
+    captured = await ingest_service.ingest_request(
+        pool,
+        QUERIES,
+        _payload(options.pop("body", BODY)),
+        stream_hub=hub,
+        endpoint_filter=EndpointFilter(negative_ttl_seconds=30, max_negative_entries=16),
+        body_offload=body_offload,
+        **options,
+    )
+    return captured, pool.params, hub.published
+
+
+def test_analyze_body_returns_compact_json_and_stored_bytes():
+    spaced = b'{ "a" : [1, 2] }'
+
+    analysed = analyze_body("application/json", spaced, BodyStorage())
+    assert (analysed.json_bytes, analysed.body_encoding, analysed.body_bytes) == (
+        b'{"a":[1,2]}',
+        "identity",
+        None,
+    )
+
+    compressed = analyze_body("text/plain", BODY, BodyStorage(compression="gzip", min_bytes=1))
+    assert compressed.json_bytes is None
+    assert compressed.body_encoding == "gzip"
+    assert gzip.decompress(compressed.body_bytes) == BODY
+
+
+async def test_offloaded_capture_stores_and_publishes_the_same_json():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offload = BodyOffload(min_bytes=1_024, executor=executor)
+        inline, inline_params, inline_events = await _ingest(None)
+        offloaded, offloaded_params, offloaded_events = await _ingest(offload)
+
+    assert offload.stats() == {"minBytes": 1_024, "offloaded": 1}
+    assert isinstance(offloaded.parsed_json, orjson.Fragment)
+    assert _encode_jsonb(offloaded_params[10]) == _encode_jsonb(inline_params[10])
+    assert offloaded_params[11:] == inline_params[11:]
+    assert offloaded_params[12] is BODY
+
+    def without_ids(event):
+        request = dict(event["request"], id=None)
+        return orjson.loads(orjson.dumps(request))
+
+    assert without_ids(offloaded_events[0]) == without_ids(inline_events[0])
+    assert inline.parsed_json == orjson.loads(BODY)
+
+
+async def test_small_bodies_stay_inline():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offload = BodyOffload(min_bytes=len(BODY) + 1, executor=executor)
+        captured, _params, _events = await _ingest(offload)
+
+    assert offload.offloaded == 0
+    assert captured.parsed_json == orjson.loads(BODY)
+
+
+async def test_offloaded_capture_drops_the_endpoint_from_the_recent_cache():
+    cache = RecentRequestsCache(
+        max_items_per_endpoint=10, max_bytes=1_048_576, request_ttl_seconds=10**9
+    )
+    cache.begin_seed("abc123def4")
+    cache.finish_seed("abc123def4", [], complete=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offload = BodyOffload(min_bytes=1_024, executor=executor)
+        await _ingest(offload, recent_requests=cache, body=b'{"small":true}')
+        assert cache.first_page("abc123def4", 10).items
+
+        await _ingest(offload, recent_requests=cache)
+
+    assert cache.first_page("abc123def4", 10) is None
+
+
+async def test_process_pool_analyses_bodies():
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    offload = BodyOffload(min_bytes=1, executor=executor)
+    try:
+        analysed = await offload.analyze("application/json", BODY, BodyStorage())
+    finally:
+        offload.close()
+
+    assert analysed.json_bytes == BODY
+    assert analysed.body_bytes is None
+
+
+async def test_loop_lag_monitor_records_a_blocked_loop():
+    monitor = LoopLagMonitor(interval_seconds=0.005)
+    task = asyncio.create_task(run_loop_lag_monitor(monitor))
+    await asyncio.sleep(0.02)
+    time.sleep(0.05)
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    stats = monitor.stats()
+    assert stats["samples"] >= 2
+    assert stats["maxMs"] >= 40
+    assert stats["p50Ms"] <= stats["p99Ms"] <= stats["maxMs"]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.core.errors import PayloadTooLargeError
+from app.utils.body_reader import parse_content_length, read_request_body_limited
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def must_not_be_read() -> AsyncIterator[bytes]:
+    raise AssertionError("the body should not be read")
+    yield b""
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("42", 42), ("0", 0), (None, None), ("", None), ("-1", None), (" 4", None), ("١٢", None)],
+)
+def test_parse_content_length(value, expected):
+    assert parse_content_length(value) == expected
+
+
+async def test_announced_oversize_body_is_rejected_before_reading():
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_limited(must_not_be_read(), 10, content_length=11)
+
+
+async def test_single_chunk_body_is_returned_without_copy():
+    chunk = b"0123456789"
+
+    body = await read_request_body_limited(stream(chunk, b""), 10, content_length=10)
+
+    assert body is chunk
+
+
+async def test_chunked_body_fills_one_preallocated_buffer():
+    body = await read_request_body_limited(
+        stream(b"abc", b"", b"defg", b"hi"), 10, content_length=9
+    )
+
+    assert isinstance(body, bytearray)
+    assert body == b"abcdefghi"
+
+
+async def test_body_shorter_than_announced_is_truncated():
+    assert await read_request_body_limited(stream(b"abc", b"de"), 10, content_length=8) == b"abcde"
+    assert await read_request_body_limited(stream(), 10, content_length=8) == b""
+
+
+async def test_body_longer_than_announced_is_read_in_full_within_the_limit():
+    body = await read_request_body_limited(stream(b"abc", b"def", b"g"), 10, content_length=4)
+    assert body == b"abcdefg"
+
+    whole_then_more = await read_request_body_limited(stream(b"abcd", b"ef"), 10, content_length=4)
+    assert whole_then_more == b"abcdef"
+
+
+async def test_body_longer_than_announced_still_hits_the_limit():
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_limited(stream(b"abc", b"defgh", b"ijk"), 10, content_length=3)
+
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_limited(stream(b"x" * 11), 10, content_length=0)
+
+
+async def test_unannounced_body_is_limited_while_streaming():
+    assert await read_request_body_limited(stream(b"abc", b"def"), 10) == b"abcdef"
+
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_limited(stream(b"x" * 6, b"x" * 5), 10)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import os
+import random
+import uuid
+from datetime import UTC, datetime
+
+import asyncpg
+import orjson
+import pytest
+
+from app.core.errors import RangeNotSatisfiableError
+from app.db.pool import bootstrap_schema, load_queries
+from app.services import endpoint_service, request_body_service, request_service
+from app.services.body_storage import GZIP, IDENTITY, BodyStorage, decode_body
+
+
+def test_small_bodies_and_disabled_mode_are_stored_verbatim():
+    body = b'{"hello":"world"}'
+    assert BodyStorage().encode(body * 100) == (IDENTITY, body * 100)
+    assert BodyStorage(compression="gzip", min_bytes=1024).encode(body) == (IDENTITY, body)
+
+
+def test_large_bodies_round_trip_through_gzip():
+    body = orjson.dumps([{"event": "invoice.paid", "amount": index} for index in range(500)])
+
+    encoding, stored = BodyStorage(compression="gzip", min_bytes=1024).encode(body)
+
+    assert encoding == GZIP
+    assert len(stored) < len(body) // 4
+    assert decode_body(encoding, stored) == body
+
+
+def _stored_row(body: bytes, storage: BodyStorage) -> dict[str, object]:
+    body_encoding, body_bytes = storage.encode(body)
+    return {
+        "id": "11111111-1111-1111-1111-111111111111",
+        "endpoint_id": "abc123def4",
+        "received_at": datetime(2026, 2, 25, tzinfo=UTC),
+        "method": "POST",
+        "path": "/hook/abc123def4",
+        "status_code": 202,
+        "ip": "127.0.0.1",
+        "headers_json": {},
+        "content_type": "text/plain",
+        "body_size_bytes": len(body),
+        "raw_body": None,
+        "body_encoding": body_encoding,
+        "body_bytes": body_bytes,
+        "body_preview": None,
+        "parsed_json": None,
+        "body_is_json": False,
+        "encoded_size_bytes": None,
+    }
+
+
+def test_compressed_rows_are_decoded_on_read():
+    text = "héllo wörld " * 200
+    row = _stored_row(text.encode("utf-8"), BodyStorage(compression="gzip", min_bytes=16))
+
+    assert row["body_encoding"] == GZIP
+    assert request_service._row_to_webhook_request(row).raw_body == text
+    assert request_service._row_body_preview(row, 7) == "héllo w"
+
+
+def test_preview_decodes_the_compressed_prefix_summary_queries_return():
+    # Random hex barely compresses, so the prefix holds little more than the preview.
+    text = random.Random(0).randbytes(2_000).hex()
+    row = _stored_row(text.encode(), BodyStorage(compression="gzip", min_bytes=16))
+    preview_chars = 100
+    truncated = row | {"body_bytes": row["body_bytes"][: preview_chars * 4 + 64]}
+
+    assert request_service._row_body_preview(truncated, preview_chars) == text[:preview_chars]
+
+
+def test_binary_and_legacy_text_rows():
+    binary = request_service._row_to_webhook_request(_stored_row(b"\x89PNG\r\n\xff", BodyStorage()))
+    assert binary.raw_body == ""
+    assert binary.body_is_binary
+
+    legacy_row = _stored_row(b"", BodyStorage()) | {"raw_body": "plain", "body_bytes": None}
+    legacy = request_service._row_to_webhook_request(legacy_row)
+    assert legacy.raw_body == "plain"
+    assert not legacy.body_is_binary
+
+
+def test_lazy_parsed_json_is_flagged_at_ingest_and_parsed_on_read():
+    body = b'{"hello":"world"}'
+    payload = request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+    lazy = BodyStorage(persist_parsed_json=False)
+    params = request_service._prepare_capture(payload, lazy).params
+    stored_parsed_json, body_is_json = params[10], params[13]
+    assert stored_parsed_json is None
+    assert body_is_json is True
+
+    row = _stored_row(body, BodyStorage()) | {"body_is_json": True}
+    assert request_service._row_to_webhook_request(row).parsed_json == {"hello": "world"}
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=90-", (90, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=95-500", (95, 99)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=9-3", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert request_body_service.parse_range(header, 100) == expected
+
+
+def test_parse_range_past_end_is_unsatisfiable():
+    with pytest.raises(RangeNotSatisfiableError) as exc_info:
+        request_body_service.parse_range("bytes=100-", 100)
+    assert exc_info.value.headers == {"Content-Range": "bytes */100"}
+
+
+class ChunkPool:
+    def __init__(self, stored: bytes) -> None:
+        self.stored = stored
+        self.calls = 0
+
+    async def fetchval(self, _query: str, _endpoint_id, _request_id, start: int, length: int):
+        self.calls += 1
+        return self.stored[start - 1 : start - 1 + length]
+
+
+async def _read_range(storage: BodyStorage, body: bytes, start: int, end: int) -> bytes:
+    body_encoding, stored = storage.encode(body)
+    pool = ChunkPool(stored)
+    stored_body = request_body_service.StoredBody(
+        endpoint_id="abc123def4",
+        request_id="11111111-1111-1111-1111-111111111111",
+        content_type="application/octet-stream",
+        size_bytes=len(body),
+        body_encoding=body_encoding,
+    )
+    queries = {"get_request_body_chunk": "-- chunk"}
+    chunks = request_body_service.iter_body_range(
+        pool, queries, stored_body, start=start, end=end, chunk_size=64
+    )
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+async def test_body_ranges_stream_in_chunks(compression):
+    body = bytes(range(256)) * 40
+    storage = BodyStorage(compression=compression, min_bytes=1)
+
+    assert await _read_range(storage, body, 0, len(body) - 1) == body
+    assert await _read_range(storage, body, 1000, 1099) == body[1000:1100]
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to download a legacy text-column body from Postgres",
+)
+@pytest.mark.asyncio
+async def test_legacy_text_body_length_matches_the_bytes_served():
+    pool = await asyncpg.create_pool(os.environ["TEST_DATABASE_URL"], min_size=1, max_size=2)
+    queries = load_queries()
+    await bootstrap_schema(pool)
+    endpoint = await endpoint_service.create_endpoint(pool, queries, "http://test", 3600)
+    request_id = str(uuid.uuid4())
+    received = b"caf\xe9 \xff"
+    try:
+        # Written as ingest did before bodies were kept as bytes: invalid UTF-8 replaced.
+        await pool.execute(
+            """
+            INSERT INTO webhook_requests (
+              id, endpoint_id, method, path, status_code, headers_json, content_type,
+              body_size_bytes, raw_body
+            )
+            VALUES ($1::uuid, $2, 'POST', '/', 202, '{}', 'text/plain', $3, $4)
+            """,
+            request_id,
+            endpoint.endpoint_id,
+            len(received),
+            received.decode("utf-8", errors="replace"),
+        )
+
+        body = await request_body_service.get_stored_body(
+            pool, queries, endpoint.endpoint_id, request_id
+        )
+        served = b"".join(
+            [
+                chunk
+                async for chunk in request_body_service.iter_body_range(
+                    pool, queries, body, start=0, end=body.size_bytes - 1, chunk_size=4
+                )
+            ]
+        )
+    finally:
+        await pool.execute(
+            "DELETE FROM webhook_requests WHERE endpoint_id = $1", endpoint.endpoint_id
+        )
+        await pool.execute(
+            "DELETE FROM webhook_endpoints WHERE endpoint_id = $1", endpoint.endpoint_id
+        )
+        await pool.close()
+
+    assert served == "caf\ufffd \ufffd".encode()
+    assert body.size_bytes == len(served)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.cleanup_leader import CleanupLeader
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+requires_database = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to run cleanup leader election against Postgres",
+)
+
+
+@requires_database
+@pytest.mark.asyncio
+async def test_only_one_leader_until_it_steps_down():
+    dsn = os.environ["TEST_DATABASE_URL"]
+    first, second = CleanupLeader(dsn=dsn, lock_key=4242), CleanupLeader(dsn=dsn, lock_key=4242)
+    try:
+        assert await first.ensure()
+        assert not await second.ensure()
+        assert await first.ensure()
+
+        await first.close()
+        assert await second.ensure()
+        assert not await first.ensure()
+    finally:
+        await first.close()
+        await second.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_app_process(database_url: str) -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "CLEANUP_INTERVAL_SECONDS": "1",
+        "CLEANUP_LEADER_RETRY_SECONDS": "1",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+def _leaders(base_urls: list[str], timeout: float = 20) -> list[str]:
+    """Poll until exactly one app process reports cleanup leadership."""
+    deadline = time.monotonic() + timeout
+    leaders: list[str] = []
+    while time.monotonic() < deadline:
+        leaders = []
+        for base_url in base_urls:
+            try:
+                if httpx.get(f"{base_url}/metrics").json()["cleanup"]["leader"]:
+                    leaders.append(base_url)
+            except httpx.TransportError:
+                break
+        else:
+            if len(leaders) == 1:
+                return leaders
+        time.sleep(0.2)
+    return leaders
+
+
+@requires_database
+def test_cleanup_leadership_fails_over_between_processes():
+    database_url = os.environ["TEST_DATABASE_URL"]
+    processes: dict[str, subprocess.Popen[bytes]] = {}
+    for _ in range(3):
+        process, base_url = _start_app_process(database_url)
+        processes[base_url] = process
+    try:
+        [leader_url] = _leaders(list(processes))
+
+        killed = processes.pop(leader_url)
+        killed.kill()
+        killed.wait(timeout=10)
+
+        [new_leader_url] = _leaders(list(processes))
+        assert new_leader_url != leader_url
+    finally:
+        for process in processes.values():
+            process.terminate()
+            process.wait(timeout=10)
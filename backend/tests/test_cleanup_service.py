@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.cleanup_service import CleanupEngine
+
+QUERIES = {
+    "delete_expired_requests_batch": "expired",
+    "delete_expired_endpoint_requests_batch": "cascade",
+    "delete_expired_endpoints_batch": "endpoints",
+    "count_expired_requests_capped": "backlog",
+}
+
+
+class CleanupPool:
+    def __init__(self, *, expired: int, cascaded: int, endpoints: list[str]) -> None:
+        self.remaining = {"expired": expired, "cascade": cascaded}
+        self.endpoints = endpoints
+        self.limits: list[tuple[str, int]] = []
+        self.idle = 1
+
+    def get_idle_size(self) -> int:
+        return self.idle
+
+    def get_size(self) -> int:
+        return 4
+
+    def get_max_size(self) -> int:
+        return 4
+
+    async def fetchval(self, query: str, *args: int) -> int:
+        if query == "backlog":
+            return self.remaining["expired"]
+        limit = args[-1]
+        self.limits.append((query, limit))
+        deleted = min(limit, self.remaining[query])
+        self.remaining[query] -= deleted
+        return deleted
+
+    async def fetch(self, _query: str, limit: int) -> list[dict[str, str]]:
+        doomed, self.endpoints = self.endpoints[:limit], self.endpoints[limit:]
+        return [{"endpoint_id": endpoint_id} for endpoint_id in doomed]
+
+
+def _engine(pool: CleanupPool, **overrides) -> CleanupEngine:
+    options = {"min_batch_size": 10, "max_batch_size": 80, "target_batch_seconds": 1.0}
+    return CleanupEngine(pool=pool, queries=QUERIES, request_ttl_seconds=60, **options | overrides)
+
+
+@pytest.mark.asyncio
+async def test_fast_batches_grow_and_cascade_before_endpoints():
+    pool = CleanupPool(expired=300, cascaded=25, endpoints=["abc123def4"])
+    forgotten: list[str] = []
+    engine = _engine(pool, on_endpoints_deleted=forgotten.extend)
+
+    assert await engine.run_cycle() == (325, 1)
+
+    expired_limits = [limit for query, limit in pool.limits if query == "expired"]
+    assert expired_limits == [10, 20, 40, 80, 80, 80]
+    assert [query for query, _ in pool.limits][-1] == "cascade"
+    assert forgotten == ["abc123def4"]
+    assert engine.stats()["deletedRequests"] == 325
+    assert not engine.budget_exhausted
+
+
+def test_saturated_pool_shrinks_batches():
+    pool = CleanupPool(expired=0, cascaded=0, endpoints=[])
+    engine = _engine(pool, batch_size=80)
+    pool.idle = 0
+
+    engine._adapt(0.01, full=True)
+
+    assert engine.batch_size == 40
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_reports_backlog():
+    pool = CleanupPool(expired=10_000, cascaded=0, endpoints=[])
+    engine = _engine(pool, cycle_budget_seconds=0)
+
+    assert await engine.run_cycle() == (0, 0)
+
+    assert engine.budget_exhausted
+    assert engine.stats()["backlog"] == 10_000
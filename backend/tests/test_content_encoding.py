@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+from collections.abc import AsyncIterator
+
+import orjson
+import pytest
+
+from app.core.errors import InvalidContentEncodingError, PayloadTooLargeError
+from app.utils.body_reader import read_request_body_decoded
+from app.utils.content_encoding import DECODE_STEP_BYTES, DecodedChunks, content_decoder
+
+BODY = orjson.dumps({"event": "build.finished", "steps": [{"n": n} for n in range(500)]})
+
+
+async def stream(data: bytes, chunk_size: int = 100) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+def raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize(
+    ("encoding", "encoded"),
+    [
+        ("gzip", gzip.compress(BODY)),
+        ("X-Gzip", gzip.compress(BODY)),
+        ("gzip", gzip.compress(BODY[:100]) + gzip.compress(BODY[100:])),
+        ("deflate", zlib.compress(BODY)),
+        ("deflate", raw_deflate(BODY)),
+    ],
+)
+async def test_encoded_body_is_decoded_while_streaming(encoding, encoded):
+    body, encoded_size = await read_request_body_decoded(
+        stream(encoded), 1_048_576, content_length=len(encoded), content_encoding=encoding
+    )
+
+    assert body == BODY
+    assert encoded_size == len(encoded)
+
+
+async def test_brotli_body_is_decoded_when_available():
+    brotli = pytest.importorskip("brotli")
+    encoded = brotli.compress(BODY)
+
+    body, encoded_size = await read_request_body_decoded(
+        stream(encoded), 1_048_576, content_encoding="br"
+    )
+
+    assert (body, encoded_size) == (BODY, len(encoded))
+
+
+@pytest.mark.parametrize("encoding", [None, "identity", "zstd", "gzip, gzip"])
+async def test_other_encodings_are_stored_as_received(encoding):
+    encoded = gzip.compress(BODY)
+
+    body, encoded_size = await read_request_body_decoded(
+        stream(encoded), 1_048_576, content_encoding=encoding
+    )
+
+    assert (body, encoded_size) == (encoded, None)
+
+
+async def test_compression_bomb_stops_at_the_decoded_limit():
+    bomb = gzip.compress(bytes(64 * 1_048_576))
+    assert len(bomb) < 128 * 1024
+    decoded = DecodedChunks(
+        stream(bomb, 16_384), content_decoder("gzip"), max_encoded_bytes=1_048_576
+    )
+    sizes: list[int] = []
+    async for output in decoded:
+        sizes.append(len(output))
+        if sum(sizes) > 1_048_576:
+            break
+    assert max(sizes) <= DECODE_STEP_BYTES
+
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_decoded(stream(bomb), 1_048_576, content_encoding="gzip")
+
+
+async def test_encoded_size_is_limited_too():
+    encoded = gzip.compress(BODY)
+
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_decoded(
+            stream(b"x"), 100, content_length=len(encoded), content_encoding="gzip"
+        )
+    with pytest.raises(PayloadTooLargeError):
+        await read_request_body_decoded(stream(encoded), 100, content_encoding="gzip")
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [b"definitely not gzip", gzip.compress(BODY)[:-20], zlib.compress(BODY) + b"trailing"],
+)
+async def test_malformed_encoded_body_is_rejected(encoded):
+    encoding = "deflate" if encoded.endswith(b"trailing") else "gzip"
+
+    with pytest.raises(InvalidContentEncodingError):
+        await read_request_body_decoded(stream(encoded), 1_048_576, content_encoding=encoding)
+
+
+async def test_empty_encoded_body_is_empty():
+    body, encoded_size = await read_request_body_decoded(
+        stream(b""), 1_048_576, content_encoding="gzip"
+    )
+
+    assert (body, encoded_size) == (b"", 0)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import inspect
+import os
+
+import asyncpg
+import pytest
+
+from app.db.pool import _bootstrap, load_queries, prepare_queries
+
+
+class PreparingConnection:
+    def __init__(self, missing_table_queries: set[str]) -> None:
+        self.missing_table_queries = missing_table_queries
+        self.cached: list[str] = []
+
+    async def _prepare(self, sql: str, *, use_cache: bool) -> None:
+        assert use_cache
+        if sql in self.missing_table_queries:
+            raise asyncpg.UndefinedTableError('relation "webhook_requests" does not exist')
+        self.cached.append(sql)
+
+    async def execute(self, sql: str) -> None:
+        self.cached.append(sql)
+
+
+@pytest.mark.asyncio
+async def test_prepare_queries_caches_every_named_query_and_skips_missing_tables():
+    queries = load_queries()
+    missing = {queries["insert_request_if_active"]}
+    conn = PreparingConnection(missing)
+
+    prepared = await prepare_queries(conn, queries)
+
+    assert prepared == len(queries) - 1
+    assert queries["get_request_for_endpoint"] in conn.cached
+    # Every prepare is followed by a simple query that ends its implicit transaction.
+    assert conn.cached[1::2] == ["SELECT 1"] * prepared
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to check the schema bootstrap against Postgres",
+)
+@pytest.mark.asyncio
+async def test_bootstrap_of_an_up_to_date_schema_takes_no_exclusive_lock():
+    conn = await asyncpg.connect(os.environ["TEST_DATABASE_URL"])
+    try:
+        await _bootstrap(conn, "none")
+        async with conn.transaction():
+            await _bootstrap(conn, "none")
+            exclusive = await conn.fetchval(
+                """
+                SELECT count(*)
+                FROM pg_locks
+                WHERE pid = pg_backend_pid()
+                  AND relation = 'webhook_requests'::regclass
+                  AND mode = 'AccessExclusiveLock'
+                """
+            )
+    finally:
+        await conn.close()
+
+    assert exclusive == 0
+
+
+def test_asyncpg_still_has_the_private_prepare_that_fills_the_statement_cache():
+    # prepare_queries() calls Connection._prepare(sql, use_cache=True); an asyncpg
+    # release that renames or reshapes it must fail here, not at startup.
+    parameters = inspect.signature(asyncpg.Connection._prepare).parameters
+    assert "use_cache" in parameters
+    assert parameters["use_cache"].kind is inspect.Parameter.KEYWORD_ONLY
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to check statement preparation against Postgres",
+)
+@pytest.mark.asyncio
+async def test_queries_run_after_prepare_reuse_the_prepared_statements():
+    conn = await asyncpg.connect(os.environ["TEST_DATABASE_URL"], statement_cache_size=256)
+    queries = load_queries()
+    count_sql = "SELECT count(*) FROM pg_prepared_statements"
+    try:
+        await _bootstrap(conn, "none")
+        prepared = await prepare_queries(conn, queries)
+        before = await conn.fetchval(count_sql)
+
+        await conn.fetch(queries["list_requests_page"], "abc123def4", 5)
+        await conn.fetchrow(queries["get_active_endpoint"], "abc123def4")
+
+        assert prepared == len(queries)
+        # No new server-side statements: the named queries came from the cache.
+        assert await conn.fetchval(count_sql) == before
+    finally:
+        await conn.close()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.schemas.endpoints import EndpointRecord
+from app.services import endpoint_service
+from app.services.endpoint_cache import EndpointCache
+from app.utils.time import isoformat_z, utc_now
+
+
+def _record(endpoint_id: str, *, expires_in: timedelta = timedelta(hours=1)) -> EndpointRecord:
+    return EndpointRecord(
+        endpoint_id=endpoint_id,
+        created_at=isoformat_z(utc_now()),
+        expires_at=isoformat_z(utc_now() + expires_in),
+    )
+
+
+def test_endpoint_cache_evicts_least_recently_used():
+    cache = EndpointCache(max_entries=2)
+    cache.put(_record("endpoint01"))
+    cache.put(_record("endpoint02"))
+    assert cache.get("endpoint01") is not None
+
+    cache.put(_record("endpoint03"))
+
+    assert cache.get("endpoint02") is None
+    assert cache.get("endpoint01") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_endpoint_cache_expires_with_endpoint():
+    cache = EndpointCache(max_entries=4)
+    cache.put(_record("endpoint01", expires_in=timedelta(milliseconds=-1)))
+    assert cache.get("endpoint01") is None
+
+    cache.put(_record("endpoint02"))
+    cache._entries["endpoint02"].expires_at = datetime.now(UTC) - timedelta(seconds=1)
+
+    assert cache.get("endpoint02") is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_active_endpoint_uses_cache():
+    class CountingPool:
+        calls = 0
+
+        async def fetchrow(self, _query: str, endpoint_id: str) -> dict[str, object]:
+            self.calls += 1
+            return {
+                "endpoint_id": endpoint_id,
+                "created_at": utc_now(),
+                "expires_at": utc_now() + timedelta(hours=1),
+            }
+
+    pool = CountingPool()
+    cache = EndpointCache(max_entries=4)
+    queries = {"get_active_endpoint": "-- lookup"}
+
+    for _ in range(3):
+        await endpoint_service.ensure_active_endpoint(pool, queries, "abc123def4", cache=cache)
+
+    assert pool.calls == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
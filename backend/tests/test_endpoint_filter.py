@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+
+from app.services.endpoint_filter import BloomFilter, EndpointFilter
+
+
+def _filter(ttl: float = 30) -> EndpointFilter:
+    return EndpointFilter(negative_ttl_seconds=ttl, max_negative_entries=4)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter.for_capacity(1000)
+    ids = [f"endpoint{index:04d}" for index in range(1000)]
+    for endpoint_id in ids:
+        bloom.add(endpoint_id)
+
+    assert all(endpoint_id in bloom for endpoint_id in ids)
+    false_positives = sum(f"missing{index:05d}" in bloom for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_endpoint_filter_rejects_only_recorded_misses():
+    endpoint_filter = _filter()
+    endpoint_filter.rebuild(["liveendpoint"])
+
+    assert not endpoint_filter.should_reject("goneendpoint")
+    endpoint_filter.record_missing("goneendpoint")
+    assert endpoint_filter.should_reject("goneendpoint")
+    assert not endpoint_filter.should_reject("liveendpoint")
+
+
+def test_endpoint_filter_never_rejects_freshly_created_endpoint():
+    endpoint_filter = _filter()
+    endpoint_filter.rebuild([])
+    endpoint_filter.record_missing("newendpoint1")
+
+    endpoint_filter.add_live("newendpoint1")
+    assert not endpoint_filter.should_reject("newendpoint1")
+
+    # Created while the snapshot query was running: still kept after the rebuild.
+    endpoint_filter.rebuild([])
+    endpoint_filter.record_missing("newendpoint1")
+    assert not endpoint_filter.should_reject("newendpoint1")
+
+
+def test_endpoint_filter_negative_entries_expire():
+    endpoint_filter = _filter(ttl=0.01)
+    endpoint_filter.record_missing("goneendpoint")
+    time.sleep(0.02)
+    assert not endpoint_filter.should_reject("goneendpoint")
+
+
+def test_multi_process_filter_trusts_a_miss_only_after_a_later_rebuild():
+    endpoint_filter = EndpointFilter(
+        negative_ttl_seconds=30, max_negative_entries=4, multi_process=True
+    )
+    endpoint_filter.rebuild([])
+    endpoint_filter.record_missing("otherreplica")
+
+    # Another replica may have created it since this process saw the 404.
+    assert not endpoint_filter.should_reject("otherreplica")
+    endpoint_filter.record_missing("otherreplica")
+    assert not endpoint_filter.should_reject("otherreplica")
+
+    endpoint_filter.rebuild([])
+    assert endpoint_filter.should_reject("otherreplica")
+
+
+def test_multi_process_filter_lets_through_ids_a_rebuild_found():
+    endpoint_filter = EndpointFilter(
+        negative_ttl_seconds=30, max_negative_entries=4, multi_process=True
+    )
+    endpoint_filter.record_missing("otherreplica")
+
+    endpoint_filter.rebuild(["otherreplica"])
+
+    assert not endpoint_filter.should_reject("otherreplica")
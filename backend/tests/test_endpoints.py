@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 from app.schemas.endpoints import CreateEndpointResponse
+from app.services import endpoint_service
+from app.services.endpoint_filter import EndpointFilter
+from app.utils.ids import generate_endpoint_ids, is_valid_endpoint_id
 
 
 def test_create_endpoint(client, monkeypatch):
-    async def fake_create_endpoint(_pool, _queries, _public_base_url, _ttl_seconds):
+    async def fake_create_endpoint(_pool, _queries, _public_base_url, _ttl_seconds, **_kwargs):
         return CreateEndpointResponse(
             endpoint_id="abc123def4",
             hook_url="http://localhost:8000/hook/abc123def4",
@@ -20,3 +25,58 @@ def test_create_endpoint(client, monkeypatch):
     assert payload["endpointId"] == "abc123def4"
     assert payload["hookUrl"].endswith("/hook/abc123def4")
 
+
+
+def test_create_endpoints_batch_validates_count(client):
+    assert client.post("/api/endpoints/batch?count=0").status_code == 422
+    assert client.post("/api/endpoints/batch?count=1001").status_code == 422
+    assert client.post("/api/endpoints/batch").status_code == 422
+
+
+async def test_create_endpoints_regenerates_only_colliding_ids(monkeypatch):
+    batches = [["taken00001", "fresh00001", "fresh00002"], ["fresh00003"]]
+    monkeypatch.setattr(
+        "app.services.endpoint_service.generate_endpoint_ids", lambda count: batches.pop(0)
+    )
+
+    class CollidingPool:
+        def __init__(self) -> None:
+            self.calls: list[list[str]] = []
+
+        async def fetch(self, _query: str, endpoint_ids: list[str], _ttl_seconds: int):
+            self.calls.append(endpoint_ids)
+            now = datetime(2026, 2, 25, tzinfo=UTC)
+            return [
+                {"endpoint_id": endpoint_id, "created_at": now, "expires_at": now}
+                for endpoint_id in endpoint_ids
+                if endpoint_id != "taken00001"
+            ]
+
+    pool = CollidingPool()
+    endpoint_filter = EndpointFilter(negative_ttl_seconds=30, max_negative_entries=16)
+    endpoint_filter.record_missing("fresh00003")
+
+    response = await endpoint_service.create_endpoints(
+        pool,
+        {"create_endpoints_batch": "-- batch"},
+        "http://localhost:8000/",
+        3600,
+        3,
+        endpoint_filter=endpoint_filter,
+    )
+
+    assert [len(call) for call in pool.calls] == [3, 1]
+    assert [item.endpoint_id for item in response.items] == [
+        "fresh00001",
+        "fresh00002",
+        "fresh00003",
+    ]
+    assert response.items[2].hook_url == "http://localhost:8000/hook/fresh00003"
+    assert not endpoint_filter.should_reject("fresh00003")
+
+
+def test_generated_endpoint_ids_are_distinct_and_valid():
+    ids = generate_endpoint_ids(5_000)
+
+    assert len(set(ids)) == 5_000
+    assert all(len(endpoint_id) == 10 and is_valid_endpoint_id(endpoint_id) for endpoint_id in ids)
@@ -24,3 +24,9 @@ def test_readyz_unavailable(client, monkeypatch):
     assert response.status_code == 503
     assert response.json()["error"]["code"] == "service_unavailable"
 
+
+
+def test_metrics_exposes_endpoint_cache_counters(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.json()["endpointCache"]["hits"] == 0
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import gzip
 from types import SimpleNamespace
 
+from app.core.errors import NotFoundError
 from app.schemas.requests import WebhookRequestDTO
 
 
@@ -9,12 +11,19 @@ def test_ingest_webhook_success(app, client, monkeypatch):
     published: list[tuple[str, str, dict[str, object]]] = []
 
     class SpyHub:
-        async def publish(self, endpoint_id: str, event: str, data: dict[str, object]) -> None:
+        async def publish(
+            self,
+            endpoint_id: str,
+            event: str,
+            data: dict[str, object],
+            *,
+            event_id: str | None = None,
+        ) -> None:
             published.append((endpoint_id, event, data))
 
     app.state.stream_hub = SpyHub()
 
-    async def fake_capture_request(_pool, _queries, payload):
+    async def fake_capture_request(_pool, _queries, payload, **_kwargs):
         return WebhookRequestDTO(
             id="req_1",
             endpoint_id=payload.endpoint_id,
@@ -26,7 +35,7 @@ def test_ingest_webhook_success(app, client, monkeypatch):
             headers=payload.headers,
             content_type=payload.headers.get("content-type", "application/json"),
             body_size_bytes=payload.body_size_bytes,
-            raw_body=payload.raw_body,
+            raw_body=payload.body.decode("utf-8"),
             parsed_json={"hello": "world"},
         )
 
@@ -59,3 +68,57 @@ def test_ingest_webhook_payload_too_large(app, client, monkeypatch):
     assert response.status_code == 413
     assert response.json()["error"]["code"] == "payload_too_large"
 
+
+
+def test_ingest_webhook_sheds_known_missing_endpoint(client, monkeypatch):
+    calls = 0
+
+    async def fake_capture_request(_pool, _queries, _payload, **_kwargs):
+        nonlocal calls
+        calls += 1
+        raise NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
+
+    monkeypatch.setattr("app.api.routes.ingest.request_service.capture_request", fake_capture_request)
+
+    first = client.post("/hook/expired0001", json={"hello": "world"})
+    second = client.post("/hook/expired0001", json={"hello": "world"})
+
+    assert first.status_code == second.status_code == 404
+    assert second.json()["error"]["code"] == "endpoint_not_found"
+    assert calls == 1
+
+
+def test_ingest_webhook_decodes_gzip_body(client, monkeypatch):
+    captured = []
+
+    async def fake_capture_request(_pool, _queries, payload, **_kwargs):
+        captured.append(payload)
+        return WebhookRequestDTO(
+            id="req_1",
+            endpoint_id=payload.endpoint_id,
+            method=payload.method,
+            path=payload.path,
+            received_at="2026-02-25T00:00:00Z",
+            status_code=202,
+            ip="unknown",
+            headers=payload.headers,
+            content_type="application/json",
+            body_size_bytes=payload.body_size_bytes,
+            raw_body=payload.body.decode("utf-8"),
+            encoded_size_bytes=payload.encoded_size_bytes,
+        )
+
+    monkeypatch.setattr("app.api.routes.ingest.request_service.capture_request", fake_capture_request)
+    encoded = gzip.compress(b'{"hello":"world"}')
+
+    response = client.post(
+        "/hook/abc123def4",
+        content=encoded,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 202
+    [payload] = captured
+    assert payload.body == b'{"hello":"world"}'
+    assert payload.body_size_bytes == 17
+    assert payload.encoded_size_bytes == len(encoded)
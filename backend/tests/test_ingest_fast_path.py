@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.errors import NotFoundError
+from app.schemas.requests import WebhookRequestDTO
+
+CAPTURE_TARGET = "app.services.ingest_service.request_service.capture_request"
+
+
+async def fake_capture_request(_pool, _queries, payload, **_kwargs):
+    if payload.endpoint_id.startswith("expired"):
+        raise NotFoundError("Endpoint not found or expired", code="endpoint_not_found")
+    return WebhookRequestDTO(
+        id="req_1",
+        endpoint_id=payload.endpoint_id,
+        method=payload.method,
+        path=payload.path,
+        received_at="2026-02-25T00:00:00Z",
+        status_code=202,
+        ip=payload.ip,
+        headers=payload.headers,
+        content_type=payload.headers.get("content-type", ""),
+        body_size_bytes=payload.body_size_bytes,
+        raw_body=payload.body.decode("utf-8"),
+    )
+
+
+@pytest.fixture
+def fast_client(fast_app):
+    with TestClient(fast_app) as test_client:
+        yield test_client
+
+
+def _exchange(test_client: TestClient, method: str, path: str, **kwargs) -> tuple:
+    response = test_client.request(method, path, **kwargs)
+    return response.status_code, response.headers.get("content-type"), response.content
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "kwargs"),
+    [
+        ("POST", "/hook/abc123def4?a=1", {"json": {"hello": "world"}}),
+        ("GET", "/hook/abc123def4", {}),
+        ("POST", "/hook/abc123def4", {"content": b"x" * 11}),
+        ("POST", "/hook/abc123def4", {"content": b"x", "headers": {"Content-Encoding": "gzip"}}),
+        ("POST", "/hook/expired0001", {"json": {}}),
+        ("POST", "/hook/NOT-VALID", {"json": {}}),
+        ("POST", "/hook/abc123def4/extra", {"json": {}}),
+        ("TRACE", "/hook/abc123def4", {}),
+    ],
+)
+def test_fast_path_matches_router_responses(
+    app, client, fast_app, fast_client, monkeypatch, method, path, kwargs
+):
+    app.state.settings.max_body_bytes = fast_app.state.settings.max_body_bytes = 10
+    monkeypatch.setattr(CAPTURE_TARGET, fake_capture_request)
+
+    assert _exchange(fast_client, method, path, **kwargs) == _exchange(
+        client, method, path, **kwargs
+    )
+
+
+def test_fast_path_captures_request_and_publishes(fast_app, fast_client, monkeypatch):
+    captured = []
+
+    async def spy_capture(_pool, _queries, payload, **kwargs):
+        captured.append(payload)
+        return await fake_capture_request(_pool, _queries, payload, **kwargs)
+
+    async def route_body_reader(*_args):
+        raise AssertionError("the FastAPI route should not handle this request")
+
+    monkeypatch.setattr(CAPTURE_TARGET, spy_capture)
+    monkeypatch.setattr("app.api.routes.ingest.read_request_body_decoded", route_body_reader)
+    published = []
+
+    class SpyHub:
+        async def publish(self, endpoint_id, event, data, *, event_id=None):
+            published.append((endpoint_id, event, data["request"]["id"]))
+
+    fast_app.state.stream_hub = SpyHub()
+
+    response = fast_client.post(
+        "/hook/abc123def4?x=1",
+        content=b'{"a":1}',
+        headers={"Content-Type": "application/json", "X-Forwarded-For": "203.0.113.9, 10.0.0.1"},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"accepted": True, "requestId": "req_1"}
+    [payload] = captured
+    assert payload.method == "POST"
+    assert (payload.path, payload.query_string) == ("/hook/abc123def4", "x=1")
+    assert payload.ip == "203.0.113.9"
+    assert payload.headers["content-type"] == "application/json"
+    assert payload.body == b'{"a":1}'
+    assert published == [("abc123def4", "request.created", "req_1")]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import asyncpg
+import pytest
+
+from app.core.errors import NotFoundError, ServiceUnavailableError
+from app.services.ingest_writer import IngestWriter
+from app.services.request_service import CaptureRequestInput
+
+LIVE_ENDPOINT = "abc123def4"
+
+
+class BatchPool:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    async def fetch(self, _query: str, *columns: list[object]) -> list[dict[str, object]]:
+        endpoint_ids, request_ids = columns[0], columns[1]
+        self.batches.append(len(request_ids))
+        await asyncio.sleep(0)
+        return [
+            {
+                "id": request_id,
+                "endpoint_id": endpoint_id,
+                "received_at": datetime(2026, 2, 25, tzinfo=UTC),
+                "method": columns[2][index],
+                "path": columns[3][index],
+                "status_code": columns[5][index],
+                "ip": columns[6][index],
+                "headers_json": columns[7][index],
+                "content_type": columns[8][index],
+                "body_size_bytes": columns[9][index],
+                "raw_body": None,
+                "parsed_json": columns[10][index],
+                "body_encoding": columns[11][index],
+                "body_bytes": columns[12][index],
+                "body_is_json": columns[13][index],
+                "encoded_size_bytes": columns[15][index],
+            }
+            for index, (endpoint_id, request_id) in enumerate(
+                zip(endpoint_ids, request_ids, strict=True)
+            )
+            if endpoint_id == LIVE_ENDPOINT
+        ]
+
+
+class PoisonPool(BatchPool):
+    """Rejects any statement carrying a row whose query string is ``poison``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.columns: list[list[object]] = []
+        self.single_rows = 0
+
+    async def fetch(self, query: str, *columns: list[object]) -> list[dict[str, object]]:
+        self.columns = list(columns)
+        if "poison" in columns[4]:
+            self.batches.append(len(columns[1]))
+            raise asyncpg.InvalidTextRepresentationError("invalid input syntax")
+        return await super().fetch(query, *columns)
+
+    async def fetchrow(self, _query: str, *params: object) -> dict[str, object]:
+        self.single_rows += 1
+        if params[4] == "poison":
+            raise asyncpg.InvalidTextRepresentationError("invalid input syntax")
+        return {"received_at": datetime(2026, 2, 25, tzinfo=UTC), "ip": params[6] or None}
+
+
+def _payload(endpoint_id: str, body: str) -> CaptureRequestInput:
+    return CaptureRequestInput(
+        endpoint_id=endpoint_id,
+        method="POST",
+        path=f"/hook/{endpoint_id}",
+        query_string=None,
+        ip="127.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body.encode("utf-8"),
+        body_size_bytes=len(body),
+    )
+
+
+def _writer(pool: BatchPool, *, max_batch_size: int = 10, max_in_flight: int = 2) -> IngestWriter:
+    return IngestWriter(
+        pool=pool,
+        queries={"insert_requests_batch_if_active": "-- batch"},
+        max_batch_size=max_batch_size,
+        max_linger_seconds=0.01,
+        max_in_flight=max_in_flight,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_writer_groups_concurrent_captures():
+    pool = BatchPool()
+    writer = _writer(pool)
+
+    results = await asyncio.gather(
+        *(writer.submit(_payload(LIVE_ENDPOINT, f'{{"n":{index}}}')) for index in range(25))
+    )
+
+    assert pool.batches == [10, 10, 5]
+    assert [result.parsed_json for result in results] == [{"n": index} for index in range(25)]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_ingest_writer_reports_missing_endpoint_per_caller():
+    pool = BatchPool()
+    writer = _writer(pool)
+
+    live, missing = await asyncio.gather(
+        writer.submit(_payload(LIVE_ENDPOINT, "{}")),
+        writer.submit(_payload("expired0001", "{}")),
+        return_exceptions=True,
+    )
+
+    assert live.endpoint_id == LIVE_ENDPOINT
+    assert isinstance(missing, NotFoundError)
+    assert missing.code == "endpoint_not_found"
+    assert pool.batches == [2]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_ingest_writer_flushes_pending_on_close():
+    pool = BatchPool()
+    writer = IngestWriter(
+        pool=pool,
+        queries={"insert_requests_batch_if_active": "-- batch"},
+        max_batch_size=10,
+        max_linger_seconds=60,
+        max_in_flight=1,
+    )
+
+    pending = asyncio.ensure_future(writer.submit(_payload(LIVE_ENDPOINT, "{}")))
+    await asyncio.sleep(0)
+    await writer.close()
+
+    assert (await pending).endpoint_id == LIVE_ENDPOINT
+    assert pool.batches == [1]
+
+
+@pytest.mark.asyncio
+async def test_a_row_postgres_rejects_fails_only_its_own_caller():
+    pool = PoisonPool()
+    writer = IngestWriter(
+        pool=pool,
+        queries={
+            "insert_requests_batch_if_active": "-- batch",
+            "insert_request_if_active": "-- one",
+        },
+        max_batch_size=10,
+        max_linger_seconds=0.01,
+        max_in_flight=1,
+    )
+    poisoned = _payload(LIVE_ENDPOINT, "{}")
+    poisoned.query_string = "poison"
+
+    results = await asyncio.gather(
+        writer.submit(_payload(LIVE_ENDPOINT, '{"n":1}')),
+        writer.submit(poisoned),
+        writer.submit(_payload(LIVE_ENDPOINT, '{"n":2}')),
+        return_exceptions=True,
+    )
+
+    assert pool.batches == [3]
+    assert pool.single_rows == 3
+    assert results[0].parsed_json == {"n": 1}
+    assert isinstance(results[1], ServiceUnavailableError)
+    assert results[2].parsed_json == {"n": 2}
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_values_postgres_would_reject_are_not_sent():
+    pool = PoisonPool()
+    writer = _writer(pool)
+    spoofed = _payload(LIVE_ENDPOINT, '{"name":"a\\u0000b"}')
+    spoofed.ip = "garbage"
+
+    result = await writer.submit(spoofed)
+
+    assert pool.columns[6] == [""]
+    assert pool.columns[10] == [None]
+    assert pool.columns[13] == [True]
+    assert result.ip == "unknown"
+    assert result.parsed_json == {"name": "a\x00b"}
+    await writer.close()
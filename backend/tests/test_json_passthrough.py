@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+import re
+from datetime import UTC, datetime
+
+import asyncpg
+import orjson
+import pytest
+
+from app.db.codecs import register_codecs
+from app.db.pool import SCHEMA_PATH, bootstrap_schema, load_queries
+from app.schemas.requests import WebhookRequestDTO
+from app.services import endpoint_service, request_service
+from app.services.body_storage import BodyStorage
+from app.utils.cursor import encode_cursor
+
+
+class JsonPagePool:
+    def __init__(self, items: list[str | None]) -> None:
+        self.items = items
+
+    async def fetch(self, _query: str, *_args: object) -> list[dict[str, object]]:
+        received_at = datetime(2026, 2, 25, tzinfo=UTC)
+        return [
+            {
+                "id": f"00000000-0000-0000-0000-00000000000{index}",
+                "received_at": received_at,
+                "item_json": item,
+            }
+            for index, item in enumerate(self.items)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_list_requests_json_joins_rendered_rows_and_cursor():
+    pool = JsonPagePool(['{"id":"a"}', '{"id":"b"}', '{"id":"c"}'])
+
+    document = await request_service.list_requests_json(
+        pool, {"list_requests_json_page": "-- page"}, "abc123def4", limit=2, before=None
+    )
+
+    assert orjson.loads(document) == {
+        "items": [{"id": "a"}, {"id": "b"}],
+        "nextCursor": encode_cursor(
+            datetime(2026, 2, 25, tzinfo=UTC), "00000000-0000-0000-0000-000000000001"
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_requests_json_falls_back_for_rows_python_must_render():
+    pool = JsonPagePool(['{"id":"a"}', None])
+
+    document = await request_service.list_requests_json(
+        pool, {"list_requests_json_page": "-- page"}, "abc123def4", limit=2, before=None
+    )
+
+    assert document is None
+
+
+def _payload(
+    endpoint_id: str, body: bytes, content_type: str
+) -> request_service.CaptureRequestInput:
+    return request_service.CaptureRequestInput(
+        endpoint_id=endpoint_id,
+        method="PUT",
+        path=f"/hook/{endpoint_id}",
+        query_string="a=1",
+        ip="2001:db8::1",
+        headers={"content-type": content_type, "x-trace": "é ✓"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to check Postgres-rendered JSON against the model path",
+)
+@pytest.mark.asyncio
+async def test_postgres_rendered_json_matches_model_path():
+    pool = await asyncpg.create_pool(
+        os.environ["TEST_DATABASE_URL"], min_size=1, max_size=2, init=register_codecs
+    )
+    queries = load_queries()
+    await bootstrap_schema(pool)
+    endpoint = await endpoint_service.create_endpoint(pool, queries, "http://test", 3600)
+    endpoint_id = endpoint.endpoint_id
+    try:
+        captures = [
+            (b'{ "b": 1, "a": [1.5, {"nested": "\\u00e9"}], "n": null }', "application/json"),
+            (b'{"lazy": true,  "text": "k\\u00f6ln"}', "application/json"),
+            (b"not json", "application/json"),
+            (b"null", "application/json"),
+            ("plain tëxt".encode(), "text/plain"),
+            (b"", "application/octet-stream"),
+        ]
+        for index, (body, content_type) in enumerate(captures):
+            storage = BodyStorage(persist_parsed_json=index != 1)
+            await request_service.capture_request(
+                pool, queries, _payload(endpoint_id, body, content_type), body_storage=storage
+            )
+        # Timestamps without a fractional part are formatted without one.
+        await pool.execute(
+            "UPDATE webhook_requests SET received_at = date_trunc('second', received_at) "
+            "WHERE endpoint_id = $1 AND content_type = 'text/plain'",
+            endpoint_id,
+        )
+
+        before = None
+        while True:
+            model_page = await request_service.list_requests(
+                pool, queries, endpoint_id, limit=4, before=before
+            )
+            document = await request_service.list_requests_json(
+                pool, queries, endpoint_id, limit=4, before=before
+            )
+            assert document is not None
+            assert orjson.loads(document) == model_page.model_dump(mode="json", by_alias=True)
+
+            for item in model_page.items:
+                single = await request_service.get_request_json(
+                    pool, queries, endpoint_id, item.id
+                )
+                assert orjson.loads(single) == item.model_dump(mode="json", by_alias=True)
+
+            if model_page.next_cursor is None:
+                break
+            before = model_page.next_cursor
+
+        binary = await request_service.capture_request(
+            pool, queries, _payload(endpoint_id, b"\xff\xfe\x00", "application/octet-stream")
+        )
+        assert await request_service.get_request_json(pool, queries, endpoint_id, binary.id) is None
+
+        # Valid UTF-8 with NUL in it, which Postgres text cannot hold; older rows may
+        # still carry body_is_text for such bodies.
+        nul = await request_service.capture_request(
+            pool, queries, _payload(endpoint_id, b"a\x00b", "text/plain")
+        )
+        assert await request_service.get_request_json(pool, queries, endpoint_id, nul.id) is None
+        await pool.execute(
+            "UPDATE webhook_requests SET body_is_text = TRUE WHERE id = $1::uuid", nul.id
+        )
+        assert await request_service.get_request_json(pool, queries, endpoint_id, nul.id) is None
+        assert (
+            await request_service.list_requests_json(
+                pool, queries, endpoint_id, limit=50, before=None
+            )
+            is None
+        )
+    finally:
+        await pool.execute("DELETE FROM webhook_requests WHERE endpoint_id = $1", endpoint_id)
+        await pool.execute("DELETE FROM webhook_endpoints WHERE endpoint_id = $1", endpoint_id)
+        await pool.close()
+
+
+def test_postgres_rendered_item_has_the_model_keys_in_order():
+    # Runs without a database: catches a model field missing from the SQL rendering.
+    schema = SCHEMA_PATH.read_text(encoding="utf-8")
+    function = schema[schema.index("FUNCTION webhook_request_item_json") :]
+    function = function[: function.index("$$;")]
+    sql_keys = re.findall(r"^\s+'(\w+)', ", function, flags=re.MULTILINE)
+
+    model_keys = [field.alias or name for name, field in WebhookRequestDTO.model_fields.items()]
+    assert sql_keys == model_keys
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.schemas.requests import WebhookRequestDTO
+from app.services.pg_stream_hub import PostgresStreamHub, channel_for_endpoint
+from app.services.stream_hub import StreamHub
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+QUERIES = {"notify_stream_event": "-- notify", "get_request_for_endpoint": "-- get"}
+
+
+class NotifyBus:
+    """Stands in for Postgres: routes NOTIFY payloads to every LISTENing connection."""
+
+    def __init__(self) -> None:
+        self.connections: list[FakeListenConnection] = []
+
+    async def connect(self, dsn: str) -> FakeListenConnection:
+        connection = FakeListenConnection()
+        self.connections.append(connection)
+        return connection
+
+    def notify(self, channel: str, payload: str) -> None:
+        for connection in self.connections:
+            for callback in connection.listeners.get(channel, []):
+                callback(connection, 1, channel, payload)
+
+
+class FakeListenConnection:
+    def __init__(self) -> None:
+        self.listeners: dict[str, list[object]] = {}
+        self.closed = False
+
+    def add_termination_listener(self, _callback) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def add_listener(self, channel: str, callback) -> None:
+        self.listeners.setdefault(channel, []).append(callback)
+
+    async def remove_listener(self, channel: str, callback) -> None:
+        self.listeners[channel].remove(callback)
+        if not self.listeners[channel]:
+            del self.listeners[channel]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class BusPool:
+    def __init__(
+        self, bus: NotifyBus, stored: dict[str, WebhookRequestDTO], *, fetch_delay: float = 0
+    ) -> None:
+        self.bus = bus
+        self.stored = stored
+        self.fetch_delay = fetch_delay
+
+    async def execute(self, _query: str, channel: str, payload: str) -> None:
+        self.bus.notify(channel, payload)
+
+    async def fetchrow(self, _query: str, _endpoint_id: str, request_id: str):
+        await asyncio.sleep(self.fetch_delay)
+        dto = self.stored[request_id]
+        return {
+            "id": dto.id,
+            "endpoint_id": dto.endpoint_id,
+            "received_at": datetime.fromisoformat(dto.received_at),
+            "method": dto.method,
+            "path": dto.path,
+            "status_code": dto.status_code,
+            "ip": dto.ip,
+            "headers_json": {},
+            "content_type": dto.content_type,
+            "body_size_bytes": dto.body_size_bytes,
+            "raw_body": dto.raw_body,
+            "parsed_json": None,
+            "body_encoding": "identity",
+            "body_bytes": None,
+            "body_is_json": False,
+            "encoded_size_bytes": dto.encoded_size_bytes,
+        }
+
+
+async def _hub(
+    bus: NotifyBus,
+    pool: BusPool,
+    *,
+    max_payload_bytes: int = 7900,
+) -> PostgresStreamHub:
+    hub = PostgresStreamHub(
+        dsn="postgresql://unused",
+        pool=pool,
+        queries=QUERIES,
+        local=StreamHub(max_queue_size=8),
+        max_payload_bytes=max_payload_bytes,
+    )
+    await hub.start()
+    return hub
+
+
+@pytest.fixture
+def bus(monkeypatch) -> NotifyBus:
+    notify_bus = NotifyBus()
+    monkeypatch.setattr("app.services.pg_stream_hub.asyncpg.connect", notify_bus.connect)
+    return notify_bus
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_subscribers_in_other_processes(bus):
+    pool = BusPool(bus, {})
+    publisher = await _hub(bus, pool)
+    viewer = await _hub(bus, pool)
+
+    subscriber = await viewer.subscribe("abc123def4")
+    await publisher.publish("abc123def4", "request.created", {"request": {"id": "req_1"}})
+
+    message = await asyncio.wait_for(subscriber.queue.get(), timeout=0.5)
+    assert message.data["request"]["id"] == "req_1"
+
+    await publisher.close()
+    await viewer.close()
+
+
+@pytest.mark.asyncio
+async def test_listens_only_while_endpoint_has_local_subscribers(bus):
+    hub = await _hub(bus, BusPool(bus, {}))
+    connection = bus.connections[0]
+    channel = channel_for_endpoint("abc123def4")
+
+    first = await hub.subscribe("abc123def4")
+    second = await hub.subscribe("abc123def4")
+    assert len(connection.listeners[channel]) == 1
+
+    await hub.unsubscribe("abc123def4", first.subscriber_id)
+    assert channel in connection.listeners
+    await hub.unsubscribe("abc123def4", second.subscriber_id)
+    assert channel not in connection.listeners
+
+    await hub.close()
+
+
+def _large_request() -> WebhookRequestDTO:
+    return WebhookRequestDTO(
+        id="11111111-1111-1111-1111-111111111111",
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        received_at="2026-02-25T00:00:00+00:00",
+        status_code=202,
+        ip="127.0.0.1",
+        headers={},
+        content_type="text/plain",
+        body_size_bytes=4096,
+        raw_body="x" * 4096,
+    )
+
+
+@pytest.mark.asyncio
+async def test_oversized_payload_is_reloaded_by_request_id(bus):
+    dto = _large_request()
+    pool = BusPool(bus, {dto.id: dto})
+    hub = await _hub(bus, pool, max_payload_bytes=256)
+
+    subscriber = await hub.subscribe("abc123def4")
+    await hub.publish("abc123def4", "request.created", {"request": dto.model_dump(by_alias=True)})
+
+    message = await asyncio.wait_for(subscriber.queue.get(), timeout=0.5)
+    assert message.data["request"]["rawBody"] == dto.raw_body
+
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_reloaded_event_is_delivered_before_later_events(bus):
+    dto = _large_request()
+    hub = await _hub(bus, BusPool(bus, {dto.id: dto}, fetch_delay=0.05), max_payload_bytes=256)
+
+    subscriber = await hub.subscribe("abc123def4")
+    await hub.publish("abc123def4", "request.created", {"request": dto.model_dump(by_alias=True)})
+    await hub.publish("abc123def4", "request.created", {"request": {"id": "req_2"}})
+
+    first = await asyncio.wait_for(subscriber.queue.get(), timeout=0.5)
+    second = await asyncio.wait_for(subscriber.queue.get(), timeout=0.5)
+    assert [first.data["request"]["id"], second.data["request"]["id"]] == [dto.id, "req_2"]
+
+    await hub.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_app_process(database_url: str) -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "STREAM_HUB_BACKEND": "postgres",
+        "PUBLIC_BASE_URL": f"http://127.0.0.1:{port}",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/readyz").status_code == 200:
+                return process, base_url
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("app process did not become ready")
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to run multi-process stream tests against Postgres",
+)
+def test_sse_spans_app_processes():
+    database_url = os.environ["TEST_DATABASE_URL"]
+    processes = [_start_app_process(database_url) for _ in range(2)]
+    (_, ingest_url), (_, viewer_url) = processes
+    try:
+        endpoint_id = httpx.post(f"{ingest_url}/api/endpoints").json()["endpointId"]
+
+        stream_url = f"{viewer_url}/api/endpoints/{endpoint_id}/stream"
+        with httpx.stream("GET", stream_url, timeout=10) as stream:
+            lines = stream.iter_lines()
+            assert next(lines) == "event: stream.ready"
+            httpx.post(f"{ingest_url}/hook/{endpoint_id}", json={"hello": "world"})
+            for line in lines:
+                if line.startswith("event: "):
+                    assert line == "event: request.created"
+                    break
+    finally:
+        for process, _ in processes:
+            process.terminate()
+            process.wait(timeout=10)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.requests import WebhookRequestDTO
+from app.services import request_service
+from app.services.recent_requests import RecentRequestsCache
+from app.utils.time import isoformat_z, utc_now
+
+ENDPOINT_ID = "abc123def4"
+
+
+def _request(age_seconds: float) -> WebhookRequestDTO:
+    return WebhookRequestDTO(
+        id=str(uuid4()),
+        endpoint_id=ENDPOINT_ID,
+        method="POST",
+        path=f"/hook/{ENDPOINT_ID}",
+        received_at=isoformat_z(utc_now() - timedelta(seconds=age_seconds)),
+        status_code=202,
+        ip="127.0.0.1",
+        headers={},
+        content_type="application/json",
+        body_size_bytes=2,
+        raw_body="{}",
+    )
+
+
+def _cache(**overrides: int) -> RecentRequestsCache:
+    options = {"max_items_per_endpoint": 5, "max_bytes": 1_000_000, "request_ttl_seconds": 3600}
+    options.update(overrides)
+    return RecentRequestsCache(**options)
+
+
+def test_first_page_requires_seed():
+    cache = _cache()
+    cache.record(_request(0))
+    assert cache.first_page(ENDPOINT_ID, 10) is None
+
+
+def test_seeded_ring_merges_captures_newest_first():
+    cache = _cache()
+    older, newer = _request(20), _request(10)
+    cache.begin_seed(ENDPOINT_ID)
+    captured_during_query = _request(5)
+    cache.record(captured_during_query)
+    cache.finish_seed(ENDPOINT_ID, [newer, older], complete=True)
+    latest = _request(0)
+    cache.record(latest)
+
+    page = cache.first_page(ENDPOINT_ID, 3)
+
+    assert page is not None
+    assert [item.id for item in page.items] == [latest.id, captured_during_query.id, newer.id]
+    assert page.next_cursor is not None
+    full_page = cache.first_page(ENDPOINT_ID, 10)
+    assert full_page is not None and full_page.next_cursor is None
+
+
+def test_incomplete_ring_misses_when_page_exceeds_it():
+    cache = _cache(max_items_per_endpoint=2)
+    cache.begin_seed(ENDPOINT_ID)
+    cache.finish_seed(ENDPOINT_ID, [_request(2), _request(3)], complete=False)
+    cache.record(_request(1))
+
+    assert cache.first_page(ENDPOINT_ID, 1) is not None
+    assert cache.first_page(ENDPOINT_ID, 2) is None
+
+
+def test_expired_requests_are_pruned_and_endpoints_discarded():
+    cache = _cache(request_ttl_seconds=60)
+    fresh = _request(1)
+    cache.begin_seed(ENDPOINT_ID)
+    cache.finish_seed(ENDPOINT_ID, [fresh, _request(120)], complete=True)
+
+    page = cache.first_page(ENDPOINT_ID, 10)
+    assert page is not None
+    assert [item.id for item in page.items] == [fresh.id]
+
+    cache.discard(ENDPOINT_ID)
+    assert cache.first_page(ENDPOINT_ID, 10) is None
+    assert cache.stats()["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_requests_serves_first_page_from_ring():
+    class CountingPool:
+        calls = 0
+
+        async def fetch(self, *_args: object) -> list[object]:
+            self.calls += 1
+            return []
+
+    pool = CountingPool()
+    cache = _cache()
+    queries = {"list_requests_page": "-- page"}
+
+    first = await request_service.list_requests(
+        pool, queries, ENDPOINT_ID, limit=10, before=None, recent_requests=cache
+    )
+    captured = _request(0)
+    cache.record(captured)
+    second = await request_service.list_requests(
+        pool, queries, ENDPOINT_ID, limit=10, before=None, recent_requests=cache
+    )
+
+    assert first.items == []
+    assert [item.id for item in second.items] == [captured.id]
+    assert pool.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_summaries_project_cached_first_page():
+    cache = _cache()
+    cache.begin_seed(ENDPOINT_ID)
+    cache.finish_seed(ENDPOINT_ID, [_request(1)], complete=True)
+
+    page = await request_service.list_request_summaries(
+        None, {}, ENDPOINT_ID, limit=10, before=None, preview_chars=1, recent_requests=cache
+    )
+
+    assert [item.body_preview for item in page.items] == ["{"]
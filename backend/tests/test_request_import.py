@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from app.core.config import Settings
+from app.core.errors import InvalidImportError, PayloadTooLargeError
+from app.db.pool import connect_for_copy
+from app.services import request_import
+from app.services.body_storage import BodyStorage
+from app.utils.ndjson import iter_lines
+
+QUERIES = {"get_active_endpoint": "-- active"}
+
+
+class CopyConnection:
+    def __init__(self, active_endpoint_ids: set[str]) -> None:
+        self.active_endpoint_ids = active_endpoint_ids
+        self.lookups: list[str] = []
+        self.copies: list[list[tuple[object, ...]]] = []
+        self.committed = False
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+        self.committed = True
+
+    async def fetchrow(self, _query: str, endpoint_id: str):
+        self.lookups.append(endpoint_id)
+        if endpoint_id not in self.active_endpoint_ids:
+            return None
+        now = datetime(2026, 2, 25, tzinfo=UTC)
+        return {"endpoint_id": endpoint_id, "created_at": now, "expires_at": now}
+
+    async def copy_records_to_table(self, table: str, *, records, columns):
+        assert table == "webhook_requests"
+        assert columns == request_import.IMPORT_COLUMNS
+        self.copies.append(list(records))
+
+
+async def stream(data: bytes, chunk_size: int = 7) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+def ndjson(*records: dict[str, object]) -> bytes:
+    return b"\n".join(orjson.dumps(record) for record in records) + b"\n"
+
+
+async def run_import(conn: CopyConnection, data: bytes, **options):
+    return await request_import.import_requests(
+        conn,
+        QUERIES,
+        stream(data),
+        body_storage=BodyStorage(),
+        max_body_bytes=1_024,
+        **options,
+    )
+
+
+async def test_lines_are_split_across_chunks():
+    lines = [line async for line in iter_lines(stream(b"first\n\nsecond line\nlast"), 64)]
+
+    assert lines == [b"first", b"", b"second line", b"last"]
+
+
+async def test_a_line_over_the_limit_is_rejected_while_streaming():
+    with pytest.raises(PayloadTooLargeError):
+        async for _ in iter_lines(stream(b"short\n" + b"x" * 100), 64):
+            pass
+
+
+async def test_import_copies_rows_in_batches_as_ingest_would_store_them():
+    conn = CopyConnection({"abc123def4"})
+    data = ndjson(
+        *(
+            {
+                "endpointId": "abc123def4",
+                "method": "PUT",
+                "path": "/hook/abc123def4",
+                "receivedAt": "2026-02-25T10:00:00Z",
+                "ip": "unknown",
+                "headers": {"content-type": "application/json"},
+                "rawBody": f'{{"n":{n}}}',
+                "parsedJson": {"n": n},
+            }
+            for n in range(5)
+        ),
+        {"endpointId": "abc123def4", "bodyBase64": base64.b64encode(b"\xff\x00").decode()},
+    )
+
+    report = await run_import(conn, data, batch_size=4)
+
+    assert conn.committed
+    assert conn.lookups == ["abc123def4"]
+    assert [len(rows) for rows in conn.copies] == [4, 2]
+    row = dict(zip(request_import.IMPORT_COLUMNS, conn.copies[0][0], strict=True))
+    assert row["method"] == "PUT"
+    assert row["client_ip"] is None
+    assert row["parsed_json"] == {"n": 0}
+    assert row["body_bytes"] == b'{"n":0}'
+    assert row["received_at"] == datetime(2026, 2, 25, 10, tzinfo=UTC)
+    binary = dict(zip(request_import.IMPORT_COLUMNS, conn.copies[1][1], strict=True))
+    assert (binary["body_bytes"], binary["body_is_text"]) == (b"\xff\x00", False)
+    assert binary["path"] == "/hook/abc123def4"
+    assert (report.imported, report.skipped, report.missing_endpoint_ids) == (6, 0, [])
+
+
+async def test_missing_endpoints_are_looked_up_once_and_skipped():
+    conn = CopyConnection({"abc123def4"})
+    data = ndjson(
+        {"endpointId": "gone000001", "rawBody": "a"},
+        {"endpointId": "abc123def4", "rawBody": "b"},
+        {"endpointId": "gone000001", "rawBody": "c"},
+    )
+
+    report = await run_import(conn, data)
+
+    assert conn.lookups == ["gone000001", "abc123def4"]
+    assert (report.imported, report.skipped) == (1, 2)
+    assert report.missing_endpoint_ids == ["gone000001"]
+
+
+async def test_endpoint_override_replaces_the_recorded_endpoint():
+    conn = CopyConnection({"abc123def4"})
+
+    report = await run_import(conn, ndjson({"rawBody": "a"}), endpoint_id="abc123def4")
+
+    assert report.imported == 1
+    assert conn.copies[0][0][0] == "abc123def4"
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b'{"endpointId":"abc123def4"}\n{not json\n', "Line 2"),
+        (ndjson({"rawBody": "no endpoint"}), "endpointId"),
+        (ndjson({"endpointId": "abc123def4", "headers": {"x": 1}}), "headers.x"),
+    ],
+)
+async def test_malformed_lines_fail_the_import(data, message):
+    conn = CopyConnection({"abc123def4"})
+
+    with pytest.raises(InvalidImportError) as error:
+        await run_import(conn, data)
+
+    assert message in error.value.message
+    assert not conn.committed
+
+
+def test_import_route_streams_the_body_into_the_service(client, app, monkeypatch):
+    conn = CopyConnection({"abc123def4"})
+    closed: list[bool] = []
+
+    async def fake_connect_for_copy(_settings):
+        async def close() -> None:
+            closed.append(True)
+
+        conn.close = close
+        return conn
+
+    monkeypatch.setattr("app.api.routes.imports.connect_for_copy", fake_connect_for_copy)
+    app.state.queries = QUERIES
+
+    response = client.post(
+        "/api/requests/import?endpointId=abc123def4",
+        content=ndjson({"rawBody": "a"}, {"rawBody": "b"}),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert closed == [True]
+    assert client.post("/api/requests/import?endpointId=NOPE").status_code == 422
+
+
+def test_import_route_refuses_when_every_import_slot_is_taken(client, app, monkeypatch):
+    async def fail_connect(_settings):
+        raise AssertionError("no connection may be opened")
+
+    monkeypatch.setattr("app.api.routes.imports.connect_for_copy", fail_connect)
+    app.state.queries = QUERIES
+    app.state.import_slots = asyncio.Semaphore(0)
+
+    response = client.post("/api/requests/import?endpointId=abc123def4", content=b"")
+
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "service_unavailable"
+
+
+async def test_copy_connection_has_server_side_timeouts(monkeypatch):
+    opened: dict[str, object] = {}
+
+    class Connection:
+        async def set_type_codec(self, *_args, **_kwargs) -> None:
+            pass
+
+    async def fake_connect(**kwargs):
+        opened.update(kwargs)
+        return Connection()
+
+    monkeypatch.setattr("app.db.pool.asyncpg.connect", fake_connect)
+    settings = Settings(database_url="postgresql://unused", import_statement_timeout_seconds=30)
+
+    await connect_for_copy(settings)
+
+    assert opened["server_settings"] == {
+        "statement_timeout": "30000",
+        "idle_in_transaction_session_timeout": "30000",
+    }
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import asyncpg
+import pytest
+
+from app.db.pool import BOOTSTRAP_LOCK_SQL, bootstrap_schema, load_queries
+from app.services.request_partitions import (
+    RequestPartitioning,
+    drop_expired_request_partitions,
+    ensure_request_partitions,
+    is_partitioned,
+)
+
+QUERIES = {"list_request_partitions": "-- partitions"}
+
+
+class PartitionPool:
+    def __init__(self, partitions: list[dict[str, object]]) -> None:
+        self.partitions = partitions
+        self.statements: list[str] = []
+
+    async def fetch(self, _query: str) -> list[dict[str, object]]:
+        return self.partitions
+
+    async def execute(self, statement: str) -> str:
+        self.statements.append(statement)
+        return "SELECT 0"
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+def test_planned_partitions_cover_current_and_premade_intervals():
+    now = datetime(2026, 2, 28, 22, 41, tzinfo=UTC)
+
+    hourly = RequestPartitioning(granularity="hourly", premake=2).planned_partitions(now)
+    daily = RequestPartitioning(granularity="daily", premake=1).planned_partitions(now)
+
+    assert [name for name, _, _ in hourly] == [
+        "webhook_requests_p2026022822",
+        "webhook_requests_p2026022823",
+        "webhook_requests_p2026030100",
+    ]
+    assert daily[1] == (
+        "webhook_requests_p20260301",
+        datetime(2026, 3, 1, tzinfo=UTC),
+        datetime(2026, 3, 2, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_creates_only_missing_partitions():
+    pool = PartitionPool([{"partition_name": "webhook_requests_p20260228"}])
+
+    created = await ensure_request_partitions(
+        pool,
+        QUERIES,
+        RequestPartitioning(granularity="daily", premake=1),
+        now=datetime(2026, 2, 28, 12, tzinfo=UTC),
+    )
+
+    assert created == 1
+    assert pool.statements[0] == BOOTSTRAP_LOCK_SQL
+    assert [statement for statement in pool.statements if "PARTITION OF" in statement] == [
+        'CREATE TABLE IF NOT EXISTS "webhook_requests_p20260301" PARTITION OF webhook_requests '
+        "FOR VALUES FROM ('2026-03-01T00:00:00+00:00') TO ('2026-03-02T00:00:00+00:00')",
+    ]
+    # Nothing was waiting in the default partition, so nothing is moved.
+    assert not any(statement.startswith(("DELETE", "INSERT")) for statement in pool.statements)
+
+
+@pytest.mark.asyncio
+async def test_ensure_takes_no_lock_when_every_partition_exists():
+    pool = PartitionPool(
+        [
+            {"partition_name": "webhook_requests_p20260228"},
+            {"partition_name": "webhook_requests_p20260301"},
+        ]
+    )
+
+    created = await ensure_request_partitions(
+        pool,
+        QUERIES,
+        RequestPartitioning(granularity="daily", premake=1),
+        now=datetime(2026, 2, 28, 12, tzinfo=UTC),
+    )
+
+    assert created == 0
+    assert pool.statements == []
+
+
+@pytest.mark.asyncio
+async def test_only_partitions_entirely_past_the_ttl_are_dropped():
+    pool = PartitionPool(
+        [
+            {
+                "partition_name": "webhook_requests_p20260226",
+                "detach_pending": True,
+                "upper_bound": datetime(2026, 2, 27, tzinfo=UTC),
+            },
+            {
+                "partition_name": "webhook_requests_p20260227",
+                "detach_pending": False,
+                "upper_bound": datetime(2026, 2, 28, tzinfo=UTC),
+            },
+            {
+                "partition_name": "webhook_requests_p20260228",
+                "detach_pending": False,
+                "upper_bound": datetime(2026, 3, 1, tzinfo=UTC),
+            },
+        ]
+    )
+
+    dropped = await drop_expired_request_partitions(
+        pool, QUERIES, 86_400, now=datetime(2026, 3, 1, 6, tzinfo=UTC)
+    )
+
+    assert dropped == 2
+    assert pool.statements == [
+        'ALTER TABLE webhook_requests DETACH PARTITION "webhook_requests_p20260226" FINALIZE',
+        'DROP TABLE IF EXISTS "webhook_requests_p20260226"',
+        'ALTER TABLE webhook_requests DETACH PARTITION "webhook_requests_p20260227" CONCURRENTLY',
+        'DROP TABLE IF EXISTS "webhook_requests_p20260227"',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tables_with_a_default_partition_detach_under_a_lock_timeout():
+    pool = PartitionPool(
+        [
+            {
+                "partition_name": "webhook_requests_p20260227",
+                "detach_pending": False,
+                "upper_bound": datetime(2026, 2, 28, tzinfo=UTC),
+            },
+            {
+                "partition_name": "webhook_requests_default",
+                "detach_pending": False,
+                "upper_bound": None,
+            },
+        ]
+    )
+
+    dropped = await drop_expired_request_partitions(
+        pool, QUERIES, 86_400, now=datetime(2026, 3, 1, 6, tzinfo=UTC)
+    )
+
+    assert dropped == 1
+    assert pool.statements == [
+        "SET LOCAL lock_timeout = '5s'",
+        'ALTER TABLE webhook_requests DETACH PARTITION "webhook_requests_p20260227"',
+        'DROP TABLE IF EXISTS "webhook_requests_p20260227"',
+    ]
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to create request partitions in Postgres",
+)
+@pytest.mark.asyncio
+async def test_processes_starting_together_create_each_partition_once():
+    dsn = os.environ["TEST_DATABASE_URL"]
+    schema = f"partitions_{uuid.uuid4().hex[:8]}"
+    admin = await asyncpg.connect(dsn)
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    pools = [
+        await asyncpg.create_pool(
+            dsn, min_size=1, max_size=2, server_settings={"search_path": schema}
+        )
+        for _ in range(4)
+    ]
+    queries = load_queries()
+    partitioning = RequestPartitioning(granularity="daily", premake=2)
+    now = datetime(2026, 2, 28, 12, tzinfo=UTC)
+    try:
+        await bootstrap_schema(pools[0], request_partitioning="daily")
+        assert await is_partitioned(pools[0], queries)
+
+        created = await asyncio.gather(
+            *(ensure_request_partitions(pool, queries, partitioning, now=now) for pool in pools)
+        )
+
+        assert sum(created) == 3
+        partitions = await pools[0].fetch(queries["list_request_partitions"])
+        assert [(row["partition_name"], row["upper_bound"]) for row in partitions] == [
+            ("webhook_requests_p20260228", datetime(2026, 3, 1, tzinfo=UTC)),
+            ("webhook_requests_p20260301", datetime(2026, 3, 2, tzinfo=UTC)),
+            ("webhook_requests_p20260302", datetime(2026, 3, 3, tzinfo=UTC)),
+            ("webhook_requests_default", None),
+        ]
+
+        dropped = await drop_expired_request_partitions(
+            pools[0], queries, 86_400, now=datetime(2026, 3, 2, 6, tzinfo=UTC)
+        )
+        assert dropped == 1
+    finally:
+        for pool in pools:
+            await pool.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to create request partitions in Postgres",
+)
+@pytest.mark.asyncio
+async def test_rows_past_the_premade_horizon_are_kept_and_moved_later():
+    dsn = os.environ["TEST_DATABASE_URL"]
+    schema = f"partitions_{uuid.uuid4().hex[:8]}"
+    admin = await asyncpg.connect(dsn)
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    pool = await asyncpg.create_pool(
+        dsn, min_size=1, max_size=2, server_settings={"search_path": schema}
+    )
+    queries = load_queries()
+    partitioning = RequestPartitioning(granularity="daily", premake=0)
+    try:
+        await bootstrap_schema(pool, request_partitioning="daily")
+        await ensure_request_partitions(
+            pool, queries, partitioning, now=datetime(2026, 2, 28, 12, tzinfo=UTC)
+        )
+        # Maintenance stalled: this request arrives after the last premade partition ends.
+        late = datetime(2026, 3, 1, 9, tzinfo=UTC)
+        await pool.execute(
+            "INSERT INTO webhook_requests (id, endpoint_id, received_at, method, path, "
+            "status_code, headers_json, content_type, body_size_bytes) "
+            "VALUES ($1, 'late', $2, 'POST', '/', 200, '{}', '', 0)",
+            uuid.uuid4(),
+            late,
+        )
+        assert await pool.fetchval("SELECT count(*) FROM webhook_requests_default") == 1
+
+        created = await ensure_request_partitions(pool, queries, partitioning, now=late)
+
+        assert created == 1
+        assert await pool.fetchval("SELECT count(*) FROM webhook_requests_default") == 0
+        assert await pool.fetchval("SELECT count(*) FROM webhook_requests_p20260301") == 1
+    finally:
+        await pool.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services import request_service
+
+
+class ReturningPool:
+    def __init__(self) -> None:
+        self.params: tuple[object, ...] = ()
+
+    async def fetchrow(self, _query: str, *params: object) -> dict[str, object]:
+        self.params = params
+        return {"received_at": datetime(2026, 2, 25, tzinfo=UTC), "ip": "10.0.0.1"}
+
+
+@pytest.mark.asyncio
+async def test_capture_request_builds_dto_from_input_and_server_columns():
+    body = b'{"hello":"world"}'
+    pool = ReturningPool()
+    payload = request_service.CaptureRequestInput(
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        query_string="a=1",
+        ip="10.0.0.1",
+        headers={"content-type": "application/json"},
+        body=body,
+        body_size_bytes=len(body),
+    )
+
+    captured = await request_service.capture_request(
+        pool, {"insert_request_if_active": "-- insert"}, payload
+    )
+
+    assert captured.id == pool.params[1]
+    assert captured.received_at == "2026-02-25T00:00:00Z"
+    assert captured.ip == "10.0.0.1"
+    assert captured.headers == {"content-type": "application/json"}
+    assert captured.raw_body == '{"hello":"world"}'
+    assert captured.parsed_json == {"hello": "world"}
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from app.schemas.endpoints import EndpointRecord
-from app.schemas.requests import ListRequestsResponse, WebhookRequestDTO
+from app.schemas.requests import (
+    ListRequestsResponse,
+    ListRequestSummariesResponse,
+    WebhookRequestDTO,
+    WebhookRequestSummaryDTO,
+)
 
 
 async def _fake_active_endpoint(*_args, **_kwargs):
@@ -13,7 +18,7 @@ async def _fake_active_endpoint(*_args, **_kwargs):
 
 
 def test_list_requests(client, monkeypatch):
-    async def fake_list_requests(_pool, _queries, endpoint_id, *, limit, before):
+    async def fake_list_requests(_pool, _queries, endpoint_id, *, limit, before, **_kwargs):
         assert endpoint_id == "abc123def4"
         assert limit == 50
         assert before is None
@@ -47,6 +52,56 @@ def test_list_requests(client, monkeypatch):
     assert payload["nextCursor"] == "next-cursor"
 
 
+def test_list_requests_without_body(client, monkeypatch):
+    async def fake_list_request_summaries(
+        _pool, _queries, endpoint_id, *, limit, before, preview_chars, **_kwargs
+    ):
+        assert preview_chars == 16
+        return ListRequestSummariesResponse(
+            items=[
+                WebhookRequestSummaryDTO(
+                    id="req_1",
+                    endpoint_id=endpoint_id,
+                    method="POST",
+                    path=f"/hook/{endpoint_id}",
+                    received_at="2026-02-25T00:00:00Z",
+                    status_code=202,
+                    ip="127.0.0.1",
+                    content_type="application/json",
+                    body_size_bytes=1_048_576,
+                    body_preview='{"hello":"world"',
+                )
+            ],
+        )
+
+    monkeypatch.setattr("app.api.routes.requests.endpoint_service.ensure_active_endpoint", _fake_active_endpoint)
+    monkeypatch.setattr(
+        "app.api.routes.requests.request_service.list_request_summaries",
+        fake_list_request_summaries,
+    )
+
+    response = client.get("/api/endpoints/abc123def4/requests?includeBody=false&bodyPreviewChars=16")
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["bodyPreview"] == '{"hello":"world"'
+    assert "rawBody" not in item
+    assert "headers" not in item
+
+
+def test_list_requests_returns_postgres_rendered_page(app, client, monkeypatch):
+    async def fake_list_requests_json(*_args, **_kwargs):
+        return b'{"items":[],"nextCursor":null}'
+
+    app.state.settings = app.state.settings.model_copy(update={"json_passthrough_enabled": True})
+    monkeypatch.setattr("app.api.routes.requests.endpoint_service.ensure_active_endpoint", _fake_active_endpoint)
+    monkeypatch.setattr("app.api.routes.requests.request_service.list_requests_json", fake_list_requests_json)
+
+    response = client.get("/api/endpoints/abc123def4/requests")
+    assert response.status_code == 200
+    assert response.content == b'{"items":[],"nextCursor":null}'
+    assert response.headers["content-type"] == "application/json"
+
+
 def test_list_requests_invalid_cursor(client, monkeypatch):
     async def fake_list_requests(*_args, **_kwargs):
         raise ValueError("Invalid cursor")
@@ -82,3 +137,32 @@ def test_get_request(client, monkeypatch):
     assert response.status_code == 200
     assert response.json()["id"] == "11111111-1111-1111-1111-111111111111"
 
+
+
+def test_download_request_body_range(app, client, monkeypatch):
+    class BodyPool:
+        async def fetchrow(self, *_args):
+            return {
+                "content_type": "image/png",
+                "stored_size_bytes": 6,
+                "body_encoding": "identity",
+                "is_text_column": False,
+            }
+
+        async def fetchval(self, _query, _endpoint_id, _request_id, start, length):
+            return b"\x89PNG\r\n"[start - 1 : start - 1 + length]
+
+    app.state.db_pool = BodyPool()
+    app.state.queries = {"get_request_body_info": "-- info", "get_request_body_chunk": "-- chunk"}
+    monkeypatch.setattr("app.api.routes.requests.endpoint_service.ensure_active_endpoint", _fake_active_endpoint)
+
+    url = "/api/endpoints/abc123def4/requests/11111111-1111-1111-1111-111111111111/body"
+    response = client.get(url, headers={"Range": "bytes=1-3"})
+    assert response.status_code == 206
+    assert response.content == b"PNG"
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["content-range"] == "bytes 1-3/6"
+
+    unsatisfiable = client.get(url, headers={"Range": "bytes=6-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == "bytes */6"
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 
 import pytest
 
-from app.api.routes.stream import _sse_comment, _sse_event
+from app.schemas.requests import WebhookRequestDTO
 from app.services.stream_hub import StreamHub
+from app.utils.cursor import cursor_for_request, decode_cursor
+from app.utils.sse import sse_comment, sse_event
 
 
 @pytest.mark.asyncio
@@ -36,8 +39,8 @@ async def test_stream_hub_drops_oldest_when_queue_is_full():
 
 
 def test_sse_format_helpers():
-    event_bytes = _sse_event("stream.ready", {"endpointId": "abc123def4"})
-    comment_bytes = _sse_comment("keepalive")
+    event_bytes = sse_event("stream.ready", {"endpointId": "abc123def4"})
+    comment_bytes = sse_comment("keepalive")
 
     event_text = event_bytes.decode("utf-8")
     comment_text = comment_bytes.decode("utf-8")
@@ -46,3 +49,96 @@ def test_sse_format_helpers():
     assert 'data: {"endpointId":"abc123def4"}' in event_text
     assert comment_text == ": keepalive\n\n"
 
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_shares_one_encoded_frame_across_subscribers():
+    hub = StreamHub(max_queue_size=4)
+    first = await hub.subscribe("abc123def4")
+    second = await hub.subscribe("abc123def4")
+
+    await hub.publish("abc123def4", "request.created", {"request": {"id": "req_1"}})
+
+    first_message = first.queue.get_nowait()
+    second_message = second.queue.get_nowait()
+    assert first_message.frame is second_message.frame
+    assert first_message.frame == b'event: request.created\ndata: {"request":{"id":"req_1"}}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_registry_is_copy_on_write():
+    hub = StreamHub(max_queue_size=4)
+    first = await hub.subscribe("abc123def4")
+    snapshot = hub._subscribers["abc123def4"]
+
+    second = await hub.subscribe("abc123def4")
+    await hub.unsubscribe("abc123def4", first.subscriber_id)
+
+    assert snapshot == (first,)
+    assert hub._subscribers["abc123def4"] == (second,)
+
+    await hub.unsubscribe("abc123def4", second.subscriber_id)
+    assert not hub.has_subscribers("abc123def4")
+
+
+def _replay_hub(buffer_size: int = 3) -> StreamHub:
+    return StreamHub(
+        max_queue_size=8,
+        replay_buffer_size=buffer_size,
+        replay_buffer_bytes=1_048_576,
+        max_replay_endpoints=4,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_replays_events_after_last_event_id():
+    hub = _replay_hub()
+    first = await hub.subscribe("abc123def4")
+    for index in range(3):
+        await hub.publish(
+            "abc123def4", "request.created", {"request": {"id": index}}, event_id=f"evt-{index}"
+        )
+    await hub.unsubscribe("abc123def4", first.subscriber_id)
+
+    resumed = await hub.subscribe("abc123def4", last_event_id="evt-0")
+
+    assert not resumed.replay_missed
+    assert [message.event_id for message in resumed.replay] == ["evt-1", "evt-2"]
+    assert resumed.replay[0].frame.startswith(b"id: evt-1\nevent: request.created\n")
+    assert resumed.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_stream_hub_flags_rolled_over_last_event_id():
+    hub = _replay_hub(buffer_size=2)
+    await hub.subscribe("abc123def4")
+    for index in range(4):
+        await hub.publish(
+            "abc123def4", "request.created", {"request": {"id": index}}, event_id=f"evt-{index}"
+        )
+
+    resumed = await hub.subscribe("abc123def4", last_event_id="evt-0")
+    unknown = await hub.subscribe("otherendpoint", last_event_id="evt-0")
+
+    assert resumed.replay_missed
+    assert unknown.replay_missed
+
+
+def test_cursor_for_request_round_trips():
+    dto = WebhookRequestDTO(
+        id="11111111-1111-1111-1111-111111111111",
+        endpoint_id="abc123def4",
+        method="POST",
+        path="/hook/abc123def4",
+        received_at="2026-02-25T00:00:00.123456Z",
+        status_code=202,
+        ip="127.0.0.1",
+        headers={},
+        content_type="application/json",
+        body_size_bytes=2,
+        raw_body="{}",
+    )
+
+    received_at, request_id = decode_cursor(cursor_for_request(dto))
+    assert received_at == datetime(2026, 2, 25, 0, 0, 0, 123456, tzinfo=UTC)
+    assert str(request_id) == dto.id